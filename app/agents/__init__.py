@@ -1,5 +1,5 @@
 """Drug Interaction Agent using LangGraph."""
 
-from .drug_agent import DrugInteractionAgent, create_agent
+from .drug_agent import DrugInteractionAgent, create_agent, load_graph
 
-__all__ = ["DrugInteractionAgent", "create_agent"]
+__all__ = ["DrugInteractionAgent", "create_agent", "load_graph"]
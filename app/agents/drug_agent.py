@@ -9,6 +9,9 @@ import os
 import logging
 from typing import Optional, Dict, List, Tuple, Union
 from drug_interaction_graph import DrugInteractionGraph
+from drug_graph_engine import FrozenDrugGraph
+from drug_graph_shared import open_or_build_shared_graph
+from drug_graph_snapshot import is_snapshot
 from .graph import DrugInteractionGraph as DrugAgentGraph
 
 # Set up logging
@@ -312,30 +315,81 @@ class DrugInteractionAgent:
             return True  # Assume available on error
 
 
-def create_agent(
+def load_graph(
     data_filepath: str,
+    read_only: bool = False,
+    delta_log_filepath: Optional[str] = None,
+    shared_filepath: Optional[str] = None,
+) -> Union[DrugInteractionGraph, FrozenDrugGraph]:
+    """
+    Load the interaction graph the agent serves queries from.
+
+    Args:
+        data_filepath: Path to a graph snapshot or GraphML file with drug interactions
+        read_only: Serve queries from a FrozenDrugGraph instead of igraph
+        delta_log_filepath: Optional delta log applied on top of the loaded graph
+        shared_filepath: Optional memory-mapped image shared by all workers;
+            built from the other files when missing or stale (implies read_only)
+
+    Returns:
+        Loaded DrugInteractionGraph, or FrozenDrugGraph if read_only
+    """
+    has_deltas = (
+        delta_log_filepath is not None
+        and os.path.exists(delta_log_filepath)
+        and os.path.getsize(delta_log_filepath) > 0
+    )
+
+    if shared_filepath is not None:
+        sources = [data_filepath] + ([delta_log_filepath] if has_deltas else [])
+        return open_or_build_shared_graph(
+            shared_filepath,
+            sources,
+            lambda: load_graph(data_filepath, True, delta_log_filepath),
+        )
+    if has_deltas:
+        graph = DrugInteractionGraph(data_filepath)
+        graph.apply_delta_log(delta_log_filepath)
+        return graph.freeze() if read_only else graph
+    if read_only and is_snapshot(data_filepath):
+        return FrozenDrugGraph.from_snapshot(data_filepath)
+    if read_only:
+        return DrugInteractionGraph(data_filepath).freeze()
+    return DrugInteractionGraph(data_filepath)
+
+
+def create_agent(
+    data_filepath: Optional[str] = None,
     openai_api_key: Optional[str] = None,
     model_name: str = "gpt-4o-mini",
     verbose: bool = False,
     enable_drug_mapping: bool = True,
     drug_mapping_threshold: float = 0.7,
+    read_only: bool = False,
+    delta_log_filepath: Optional[str] = None,
+    graph=None,
 ) -> DrugInteractionAgent:
     """
     Convenience function to create an agent with data loaded from file.
 
     Args:
-        data_filepath: Path to GraphML file with drug interactions
+        data_filepath: Path to a graph snapshot or GraphML file with drug interactions
         openai_api_key: OpenAI API key (defaults to env var)
         model_name: OpenAI model to use (gpt-4o-mini, gpt-4o, o3-mini, etc.)
         verbose: Whether to print agent reasoning
         enable_drug_mapping: Whether to enable drug name mapping
         drug_mapping_threshold: Similarity threshold for drug name mapping
+        read_only: Serve queries from a FrozenDrugGraph instead of igraph
+        delta_log_filepath: Optional delta log applied on top of the loaded graph
+        graph: Already loaded graph (or GraphHolder) to use instead of data_filepath
 
     Returns:
         Initialized DrugInteractionAgent
     """
-    # Load the graph
-    graph = DrugInteractionGraph(data_filepath)
+    if graph is None:
+        if data_filepath is None:
+            raise ValueError("Either data_filepath or graph is required")
+        graph = load_graph(data_filepath, read_only, delta_log_filepath)
 
     if verbose:
         print(f"Initializing LangGraph agent with {model_name}...")
@@ -13,7 +13,9 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from pydantic import BaseModel, Field
 from openai import OpenAI
+from app.core.drug_name_index import get_alias_index
 from drug_interaction_graph import DrugInteractionGraph
+from .tools import MAX_LISTED_INTERACTIONS, DrugInteractionTools
 
 # Check if drug mapping is available
 DRUG_MAPPING_AVAILABLE = importlib.util.find_spec("app.core.drug_mapper") is not None
@@ -53,6 +55,9 @@ class EnhancedDrugInteractionTools:
         self.enable_drug_mapping = enable_drug_mapping and DRUG_MAPPING_AVAILABLE
         self.llm = ChatOpenAI(model=model_name, temperature=0.0)
 
+    # Pin a hot-swappable GraphHolder once per tool call
+    _current_graph = DrugInteractionTools._current_graph
+
     @staticmethod
     def _parse_two_drugs(query: str) -> tuple[str | None, str | None]:
         """
@@ -75,7 +80,7 @@ class EnhancedDrugInteractionTools:
 
         return None, None
 
-    def _extract_active_ingredient(self, drug_name: str) -> tuple[str, str]:
+    def _extract_active_ingredient(self, drug_name: str) -> tuple[str, str, str]:
         """
         Use LLM to extract the active ingredient from a drug name.
 
@@ -83,7 +88,7 @@ class EnhancedDrugInteractionTools:
             drug_name: The drug name (brand or generic)
 
         Returns:
-            Tuple of (active_ingredient, reasoning)
+            Tuple of (active_ingredient, reasoning, confidence)
         """
         system_prompt = """You are a pharmaceutical expert. Given a drug name (which could be a brand name, trade name, or generic name), identify the primary active ingredient or generic name.
 
@@ -109,10 +114,63 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
             result: ActiveIngredientResponse = llm_with_structured_output.invoke(
                 messages
             )
-            return result.active_ingredient, result.reasoning
+            return result.active_ingredient, result.reasoning, result.confidence
         except Exception as e:
             print(f"Error extracting ingredient for '{drug_name}': {e}")
-            return drug_name, f"Error: {str(e)}"
+            return drug_name, f"Error: {str(e)}", "low"
+
+    def _resolve_locally(self, drug_name: str) -> str | None:
+        """
+        Resolve a drug name without calling the LLM, if possible.
+
+        Known brand names and synonyms come from the alias index; names that
+        are already drugs in the interaction graph are kept as they are.
+
+        Args:
+            drug_name: The drug name (brand or generic)
+
+        Returns:
+            Canonical drug name, or None if the LLM is needed
+        """
+        alias = get_alias_index().resolve(drug_name)
+        if alias is not None:
+            return alias
+        if self._current_graph().degree(drug_name) > 0:
+            return drug_name.strip()
+        return None
+
+    def _learn_alias(
+        self,
+        drug_name: str,
+        active_ingredient: str,
+        mapped_name: str | None,
+        tier: str,
+        confidence: str,
+    ) -> None:
+        """
+        Remember a confident LLM extraction so the next lookup skips the LLM.
+
+        Only extractions whose ingredient is a graph drug, or that mapped to
+        the database through the exact or lexical tier, are learned; a weak
+        embedding match would otherwise be answered locally from then on.
+
+        Args:
+            drug_name: Name the LLM was asked about
+            active_ingredient: Ingredient the LLM extracted
+            mapped_name: Database name the extraction mapped to (None if none)
+            tier: Mapping tier that produced mapped_name (see MAPPING_TIERS)
+            confidence: Confidence reported by the LLM
+        """
+        if confidence.strip().lower() != "high":
+            return
+        if self._current_graph().degree(active_ingredient) > 0:
+            target = active_ingredient.strip()
+        elif mapped_name and tier in ("exact", "lexical"):
+            target = mapped_name
+        else:
+            return
+        if get_alias_index().learn(drug_name, target):
+            print(f"Learned drug alias: '{drug_name}' -> '{target}'")
 
     def _map_drug_name(self, drug_name: str) -> str:
         """
@@ -129,16 +187,25 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
             return drug_name
 
         try:
+            # Step 0: Known aliases and database names skip the LLM
+            local_name = self._resolve_locally(drug_name)
+            if local_name is not None:
+                print(f"Local mapping: '{drug_name}' -> '{local_name}'")
+                return local_name
+
             # Step 1: Extract active ingredient using LLM
-            active_ingredient, reasoning = self._extract_active_ingredient(drug_name)
+            active_ingredient, reasoning, confidence = self._extract_active_ingredient(
+                drug_name
+            )
             print(f"LLM extracted ingredient: '{drug_name}' -> '{active_ingredient}'")
             print(f"Reasoning: {reasoning}")
 
             # Step 2: Map the extracted ingredient to database
-            from ..core.drug_mapper import map_drug_name
+            from ..core.drug_mapper import map_drug_name_with_tier
 
-            mapped = map_drug_name(active_ingredient, threshold=0.5)
+            mapped, tier = map_drug_name_with_tier(active_ingredient, threshold=0.5)
             final_name = mapped if mapped else active_ingredient
+            self._learn_alias(drug_name, active_ingredient, mapped, tier, confidence)
 
             print(f"Database mapping: '{active_ingredient}' -> '{final_name}'")
             return final_name
@@ -218,8 +285,6 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
         Returns:
             List of tool functions decorated with @tool
         """
-        graph = self.graph
-
         # Initialize OpenAI client for web search
         openai_client = OpenAI(api_key=os.getenv("OPENAI_API_KEY"))
 
@@ -342,7 +407,9 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
             )
 
             # Search in graph
-            result = graph.search_interaction(mapped_drug1, mapped_drug2)
+            result = self._current_graph().search_interaction(
+                mapped_drug1, mapped_drug2
+            )
             print(f"enhanced_tools - interaction result: {result}")
 
             # Build response with detailed mapping information
@@ -390,7 +457,11 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
             original_drug_name = drug_name.strip()
             drug_name = self._map_drug_name(original_drug_name)
 
-            interactions = graph.get_all_interactions_for_drug(drug_name)
+            graph = self._current_graph()
+            total = graph.degree(drug_name)
+            interactions = graph.get_all_interactions_for_drug(
+                drug_name, limit=MAX_LISTED_INTERACTIONS
+            )
 
             # Build response with mapping information
             mapping_info = ""
@@ -406,12 +477,120 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
                 )
 
             # Format results
-            result = f"{mapping_info}Found {len(interactions)} interaction(s) for {drug_name.title()}:\n\n"
+            result = f"{mapping_info}Found {total} interaction(s) for {drug_name.title()}"
+            if total > len(interactions):
+                result += f" (showing first {len(interactions)})"
+            result += ":\n\n"
             for i, interaction in enumerate(interactions, 1):
                 result += f"{i}. {interaction['drug']}: {interaction['condition']}\n"
 
             return result.strip()
 
+        @tool
+        def check_regimen_interactions(drugs: str) -> str:
+            """
+            Check all pairwise interactions among a list of drugs at once, with automatic mapping.
+
+            Use this tool when the user takes THREE OR MORE drugs (a regimen)
+            instead of calling search_drug_interaction for every pair.
+            Input should be drug names separated by commas.
+            Each drug name will be converted to its active ingredient and mapped to the database.
+
+            Args:
+                drugs: Drug names. Example: "Coumadin, Aspirin, Advil, Omeprazole"
+
+            Returns:
+                Every interacting pair with its conditions
+            """
+            original_names = DrugInteractionTools._parse_drug_list(drugs)
+            if len(original_names) < 2:
+                return (
+                    "Error: Please provide at least two drug names separated by commas. "
+                    "Example: 'Warfarin, Aspirin, Ibuprofen'"
+                )
+
+            mapped_names = [self._map_drug_name(name) for name in original_names]
+            graph = self._current_graph()
+            interactions = graph.search_regimen_interactions(mapped_names)
+
+            conversions = [
+                f"• Converted '{original}' → '{mapped}'"
+                for original, mapped in zip(original_names, mapped_names)
+                if mapped.lower() != original.lower()
+            ]
+            mapping_info = (
+                "Drug Conversions:\n" + "\n".join(conversions) + "\n\n"
+                if conversions
+                else ""
+            )
+            return mapping_info + DrugInteractionTools._format_regimen_result(
+                mapped_names, interactions, graph
+            )
+
+        @tool
+        def find_indirect_interactions(query: str) -> str:
+            """
+            Find how two drugs are connected through other drugs, with automatic mapping.
+
+            Use this tool when the user asks whether two drugs share
+            interaction partners or are indirectly related (within a few
+            hops), e.g. when they have no direct interaction.
+            Input should be two drug names separated by 'and', 'with', or comma.
+
+            Args:
+                query: Two drug names. Example: "Coumadin and Metformin"
+
+            Returns:
+                Shared interaction partners and the shortest chain of interactions
+            """
+            drug1, drug2 = EnhancedDrugInteractionTools._parse_two_drugs(query)
+            if not drug1 or not drug2:
+                return (
+                    "Error: Please provide two drug names separated by 'and', 'with', or comma. "
+                    "Example: 'Warfarin and Metformin'"
+                )
+
+            mapped_drug1 = self._map_drug_name(drug1)
+            mapped_drug2 = self._map_drug_name(drug2)
+            connection = self._current_graph().find_indirect_interactions(
+                mapped_drug1, mapped_drug2, limit=MAX_LISTED_INTERACTIONS
+            )
+
+            conversions = [
+                f"• Converted '{original}' → '{mapped}'"
+                for original, mapped in ((drug1, mapped_drug1), (drug2, mapped_drug2))
+                if mapped.lower() != original.lower()
+            ]
+            mapping_info = (
+                "Drug Conversions:\n" + "\n".join(conversions) + "\n\n"
+                if conversions
+                else ""
+            )
+            return mapping_info + DrugInteractionTools._format_connection_result(
+                mapped_drug1, mapped_drug2, connection
+            )
+
+        @tool
+        def search_interactions_by_condition(query: str) -> str:
+            """
+            Find drug pairs whose interaction causes a given condition or side effect.
+
+            Use this tool when the user asks which drugs or drug pairs cause a
+            condition (e.g. "which combinations cause QT prolongation?").
+            All words must appear in the condition; separate alternatives with
+            OR and end a word with * to match a prefix.
+
+            Args:
+                query: Condition words. Examples: "qt prolonged", "lactic acidosis OR hypoglycaemia", "rhabdomyoly*"
+
+            Returns:
+                Matching drug pairs with the matching conditions
+            """
+            result = self._current_graph().search_by_condition(
+                query, limit=MAX_LISTED_INTERACTIONS
+            )
+            return DrugInteractionTools._format_condition_result(query, result)
+
         @tool
         def get_drug_statistics() -> str:
             """
@@ -423,7 +602,7 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
             Returns:
                 Database statistics
             """
-            stats = graph.get_stats()
+            stats = self._current_graph().get_stats()
             mapping_info = ""
             if self.enable_drug_mapping:
                 try:
@@ -460,16 +639,29 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
                 return f"Drug mapping is not enabled. Original name: '{drug_name}'"
 
             try:
+                # Known aliases skip the LLM
+                alias = get_alias_index().resolve(drug_name)
+                if alias is not None:
+                    return (
+                        f"✓ Known Alias: '{drug_name}' → '{alias}'\n\n"
+                        f"✓ Final Name: '{alias}'"
+                    )
+
                 # Step 1: Extract active ingredient using LLM
-                active_ingredient, reasoning = self._extract_active_ingredient(
-                    drug_name
+                active_ingredient, reasoning, confidence = (
+                    self._extract_active_ingredient(drug_name)
                 )
 
                 # Step 2: Map to database
-                from ..core.drug_mapper import map_drug_name
+                from ..core.drug_mapper import map_drug_name_with_tier
 
-                mapped_name = map_drug_name(active_ingredient, threshold=0.5)
+                mapped_name, tier = map_drug_name_with_tier(
+                    active_ingredient, threshold=0.5
+                )
                 final_name = mapped_name if mapped_name else active_ingredient
+                self._learn_alias(
+                    drug_name, active_ingredient, mapped_name, tier, confidence
+                )
 
                 # Build detailed response
                 response_parts = []
@@ -535,6 +727,9 @@ Respond with high confidence if you're certain, medium if somewhat certain, low
         base_tools = [
             find_drug_detail_links,
             search_drug_interaction,
+            check_regimen_interactions,
+            find_indirect_interactions,
+            search_interactions_by_condition,
             # get_all_drug_interactions,
             # get_drug_statistics,
         ]
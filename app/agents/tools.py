@@ -6,8 +6,13 @@ Defines the tools/functions that the agent can use to query drug interactions.
 
 from typing import List
 from langchain_core.tools import tool
+from drug_graph_engine import CONDITION_SEPARATOR
 from drug_interaction_graph import DrugInteractionGraph
 
+# Maximum number of interactions listed by a single tool call, so hub drugs
+# don't flood the LLM context
+MAX_LISTED_INTERACTIONS = 50
+
 
 class DrugInteractionTools:
     """Collection of tools for querying drug interactions."""
@@ -21,6 +26,16 @@ class DrugInteractionTools:
         """
         self.graph = graph
 
+    def _current_graph(self):
+        """
+        Return the graph to answer one tool call with.
+
+        A hot-swappable GraphHolder is pinned once per call, so every lookup
+        in the call sees the same graph version.
+        """
+        pin = getattr(self.graph, "pin", None)
+        return pin() if pin is not None else self.graph
+
     @staticmethod
     def _parse_two_drugs(query: str) -> tuple[str | None, str | None]:
         """
@@ -43,6 +58,136 @@ class DrugInteractionTools:
 
         return None, None
 
+    @staticmethod
+    def _parse_drug_list(query: str) -> List[str]:
+        """
+        Parse a list of drug names from a query string.
+
+        Args:
+            query: Drug names separated by commas, semicolons, newlines or 'and'
+
+        Returns:
+            List of non-empty drug names
+        """
+        for sep in [" and ", ";", "\n"]:
+            query = query.replace(sep, ",")
+        return [part.strip() for part in query.split(",") if part.strip()]
+
+    @staticmethod
+    def _format_regimen_result(
+        drug_names: List[str], interactions: List[dict], graph
+    ) -> str:
+        """
+        Format the result of a regimen check for the agent.
+
+        Args:
+            drug_names: Drug names that were checked
+            interactions: Output of graph.search_regimen_interactions
+            graph: Graph used to flag drugs missing from the database
+
+        Returns:
+            Human-readable summary of all interacting pairs
+        """
+        unknown = [name for name in drug_names if graph.degree(name) == 0]
+        if interactions:
+            result = (
+                f"Found {len(interactions)} interacting pair(s) among "
+                f"{len(drug_names)} drugs:\n\n"
+            )
+            for i, interaction in enumerate(interactions, 1):
+                result += (
+                    f"{i}. {interaction['drug1']} + {interaction['drug2']}: "
+                    f"{interaction['condition']}\n"
+                )
+        else:
+            result = (
+                f"No known interactions found among {len(drug_names)} drugs "
+                f"in the database.\n"
+            )
+        if unknown:
+            result += (
+                "\nNot found in the database (or no recorded interactions): "
+                + ", ".join(name.title() for name in unknown)
+            )
+        return result.strip()
+
+    @staticmethod
+    def _format_connection_result(
+        drug1: str, drug2: str, connection: dict | None
+    ) -> str:
+        """
+        Format the result of an indirect-interaction query for the agent.
+
+        Args:
+            drug1: First drug name as queried
+            drug2: Second drug name as queried
+            connection: Output of graph.find_indirect_interactions
+
+        Returns:
+            Human-readable summary of shared partners and the shortest path
+        """
+        if connection is None:
+            return (
+                f"Could not compare {drug1.title()} and {drug2.title()}: at least "
+                f"one of them is not in the database."
+            )
+
+        name1, name2 = connection["drug1"], connection["drug2"]
+        if connection["direct"]:
+            result = f"{name1} and {name2} interact directly.\n"
+        else:
+            result = f"{name1} and {name2} have no direct interaction.\n"
+
+        count = connection["shared_partner_count"]
+        if count:
+            shown = connection["shared_partners"]
+            result += f"They share {count} interaction partner(s)"
+            if count > len(shown):
+                result += f" (showing {len(shown)})"
+            result += ": " + ", ".join(shown) + "\n"
+        else:
+            result += "They share no interaction partners.\n"
+
+        path = connection["path"]
+        if path and connection["distance"] > 2:
+            result += (
+                f"Shortest chain found ({connection['distance']} interactions): "
+                + " → ".join(path)
+                + "\n"
+            )
+        elif not path:
+            result += "No chain of interactions found within the search limits"
+            if connection["truncated"]:
+                result += " (search was cut short; a longer chain may exist)"
+            result += ".\n"
+        return result.strip()
+
+    @staticmethod
+    def _format_condition_result(query: str, result: dict) -> str:
+        """
+        Format the result of a condition search for the agent.
+
+        Args:
+            query: Condition query that was searched
+            result: Output of graph.search_by_condition
+
+        Returns:
+            Human-readable list of matching drug pairs
+        """
+        total = result["total"]
+        interactions = result["interactions"]
+        if not total:
+            return f"No interactions found with conditions matching '{query}'."
+
+        text = f"Found {total} interacting pair(s) with conditions matching '{query}'"
+        if total > len(interactions):
+            text += f" (showing first {len(interactions)})"
+        text += ":\n\n"
+        for i, interaction in enumerate(interactions, 1):
+            matched = CONDITION_SEPARATOR.join(interaction["matched_conditions"])
+            text += f"{i}. {interaction['drug1']} + {interaction['drug2']}: {matched}\n"
+        return text.strip()
+
     def create_tools(self) -> List:
         """
         Create LangChain tools for the agent.
@@ -50,7 +195,6 @@ class DrugInteractionTools:
         Returns:
             List of tool functions decorated with @tool
         """
-        graph = self.graph
 
         @tool
         def search_drug_interaction(query: str) -> str:
@@ -76,7 +220,7 @@ class DrugInteractionTools:
                 )
 
             # Search in graph
-            result = graph.search_interaction(drug1, drug2)
+            result = self._current_graph().search_interaction(drug1, drug2)
             print(
                 f"Search interaction between {drug1} and {drug2} -->  result: {result}"
             )
@@ -106,7 +250,11 @@ class DrugInteractionTools:
                 List of all interactions for the drug
             """
             drug_name = drug_name.strip()
-            interactions = graph.get_all_interactions_for_drug(drug_name)
+            graph = self._current_graph()
+            total = graph.degree(drug_name)
+            interactions = graph.get_all_interactions_for_drug(
+                drug_name, limit=MAX_LISTED_INTERACTIONS
+            )
 
             if not interactions:
                 return (
@@ -115,14 +263,94 @@ class DrugInteractionTools:
                 )
 
             # Format results
-            result = (
-                f"Found {len(interactions)} interaction(s) for {drug_name.title()}:\n\n"
-            )
+            result = f"Found {total} interaction(s) for {drug_name.title()}"
+            if total > len(interactions):
+                result += f" (showing first {len(interactions)})"
+            result += ":\n\n"
             for i, interaction in enumerate(interactions, 1):
                 result += f"{i}. {interaction['drug']}: {interaction['condition']}\n"
 
             return result.strip()
 
+        @tool
+        def check_regimen_interactions(drugs: str) -> str:
+            """
+            Check all pairwise interactions among a list of drugs at once.
+
+            Use this tool when the user takes THREE OR MORE drugs (a regimen)
+            instead of calling search_drug_interaction for every pair.
+            Input should be drug names separated by commas.
+
+            Args:
+                drugs: Drug names. Example: "Warfarin, Aspirin, Ibuprofen, Omeprazole"
+
+            Returns:
+                Every interacting pair with its conditions
+            """
+            drug_names = DrugInteractionTools._parse_drug_list(drugs)
+            if len(drug_names) < 2:
+                return (
+                    "Error: Please provide at least two drug names separated by commas. "
+                    "Example: 'Warfarin, Aspirin, Ibuprofen'"
+                )
+
+            graph = self._current_graph()
+            interactions = graph.search_regimen_interactions(drug_names)
+            return DrugInteractionTools._format_regimen_result(
+                drug_names, interactions, graph
+            )
+
+        @tool
+        def find_indirect_interactions(query: str) -> str:
+            """
+            Find how two drugs are connected through other drugs.
+
+            Use this tool when the user asks whether two drugs share
+            interaction partners or are indirectly related (within a few
+            hops), e.g. when they have no direct interaction.
+            Input should be two drug names separated by 'and', 'with', or comma.
+
+            Args:
+                query: Two drug names. Example: "Warfarin and Metformin"
+
+            Returns:
+                Shared interaction partners and the shortest chain of interactions
+            """
+            drug1, drug2 = DrugInteractionTools._parse_two_drugs(query)
+            if not drug1 or not drug2:
+                return (
+                    "Error: Please provide two drug names separated by 'and', 'with', or comma. "
+                    "Example: 'Warfarin and Metformin'"
+                )
+
+            connection = self._current_graph().find_indirect_interactions(
+                drug1, drug2, limit=MAX_LISTED_INTERACTIONS
+            )
+            return DrugInteractionTools._format_connection_result(
+                drug1, drug2, connection
+            )
+
+        @tool
+        def search_interactions_by_condition(query: str) -> str:
+            """
+            Find drug pairs whose interaction causes a given condition or side effect.
+
+            Use this tool when the user asks which drugs or drug pairs cause a
+            condition (e.g. "which combinations cause QT prolongation?").
+            All words must appear in the condition; separate alternatives with
+            OR and end a word with * to match a prefix.
+
+            Args:
+                query: Condition words. Examples: "qt prolonged", "lactic acidosis OR hypoglycaemia", "rhabdomyoly*"
+
+            Returns:
+                Matching drug pairs with the matching conditions
+            """
+            result = self._current_graph().search_by_condition(
+                query, limit=MAX_LISTED_INTERACTIONS
+            )
+            return DrugInteractionTools._format_condition_result(query, result)
+
         @tool
         def get_drug_statistics() -> str:
             """
@@ -134,7 +362,7 @@ class DrugInteractionTools:
             Returns:
                 Database statistics
             """
-            stats = graph.get_stats()
+            stats = self._current_graph().get_stats()
             return (
                 f"Database Statistics:\n"
                 f"- Total drugs: {stats['drugs']}\n"
@@ -143,6 +371,9 @@ class DrugInteractionTools:
 
         return [
             search_drug_interaction,
+            check_regimen_interactions,
+            find_indirect_interactions,
+            search_interactions_by_condition,
             # get_all_drug_interactions,
             # get_drug_statistics,
         ]
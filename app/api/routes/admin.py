@@ -0,0 +1,79 @@
+"""Admin endpoints for managing the served interaction graph."""
+
+import secrets
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, status
+
+from app.models import ErrorResponse, GraphReloadResponse, GraphStatusResponse
+from app.core.agent import agent_manager
+from app.core.config import settings
+
+router = APIRouter()
+
+
+def require_admin_token(x_admin_token: Optional[str] = Header(None)) -> None:
+    """
+    Check the X-Admin-Token header against ADMIN_TOKEN.
+
+    The admin endpoints are disabled while no token is configured.
+
+    Raises:
+        HTTPException: 503 if ADMIN_TOKEN is not set, 401 if the token is
+            missing or wrong
+    """
+    if not settings.ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Admin endpoints are disabled: ADMIN_TOKEN is not set",
+        )
+    if x_admin_token is None or not secrets.compare_digest(
+        x_admin_token, settings.ADMIN_TOKEN
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid admin token"
+        )
+
+
+@router.get(
+    "/admin/graph",
+    response_model=GraphStatusResponse,
+    summary="Graph Status",
+    description="Get the version of the interaction graph being served",
+    tags=["Admin"],
+    dependencies=[Depends(require_admin_token)],
+    responses={
+        401: {"model": ErrorResponse, "description": "Invalid admin token"},
+        503: {"model": ErrorResponse, "description": "ADMIN_TOKEN is not set"},
+    },
+)
+async def get_graph_status():
+    """Get the served graph version and reload state."""
+    return GraphStatusResponse(**agent_manager.graph_holder.status())
+
+
+@router.post(
+    "/admin/graph/reload",
+    response_model=GraphReloadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Reload Graph",
+    description=(
+        "Rebuild the interaction graph from the snapshot and delta log in the "
+        "background, then swap it in without interrupting queries"
+    ),
+    tags=["Admin"],
+    dependencies=[Depends(require_admin_token)],
+    responses={
+        401: {"model": ErrorResponse, "description": "Invalid admin token"},
+        503: {"model": ErrorResponse, "description": "ADMIN_TOKEN is not set"},
+    },
+)
+async def reload_graph():
+    """Start a background reload of the interaction graph."""
+    accepted = agent_manager.reload_graph()
+    message = "Reload started" if accepted else "A reload is already in progress"
+    return GraphReloadResponse(
+        accepted=accepted,
+        message=message,
+        graph=GraphStatusResponse(**agent_manager.graph_holder.status()),
+    )
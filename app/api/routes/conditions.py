@@ -0,0 +1,59 @@
+"""Condition (side effect) search endpoints backed by the condition index."""
+
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.models import ConditionMatch, ConditionSearchResponse, ErrorResponse
+from app.core.agent import agent_manager
+
+router = APIRouter()
+
+
+@router.get(
+    "/conditions/search",
+    response_model=ConditionSearchResponse,
+    summary="Search Interactions by Condition",
+    description=(
+        "Find the drug pairs with an interaction condition containing all "
+        "words of a query. Separate alternatives with OR and end a word with * to "
+        'match a prefix, e.g. "qt prolong* OR torsade*"'
+    ),
+    tags=["Conditions"],
+    responses={
+        200: {"description": "Successful response"},
+        503: {"model": ErrorResponse, "description": "Graph not available"},
+    },
+)
+async def search_conditions(
+    q: str = Query(..., min_length=1, description="Condition query"),
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    offset: int = Query(0, ge=0, description="Number of interactions to skip"),
+):
+    """
+    Page through the interactions matching a condition query.
+
+    Answered from per-word posting lists, so the cost follows the number
+    of matches rather than the number of interactions in the database. The
+    first query of a graph version builds the index over every edge, so the
+    search runs in the thread pool to keep the event loop free.
+    """
+    try:
+        graph = agent_manager.get_graph()
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Graph not loaded"
+        )
+
+    result = await run_in_threadpool(
+        graph.search_by_condition, q, limit=limit, offset=offset
+    )
+    return ConditionSearchResponse(
+        query=q,
+        total=result["total"],
+        limit=limit,
+        offset=offset,
+        interactions=[ConditionMatch(**i) for i in result["interactions"]],
+        timestamp=datetime.utcnow().isoformat(),
+    )
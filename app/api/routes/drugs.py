@@ -0,0 +1,186 @@
+"""Drug lookup endpoints backed directly by the interaction graph."""
+
+from datetime import datetime
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
+
+from app.models import (
+    DrugCompletion,
+    DrugConnectionResponse,
+    DrugInteractionListResponse,
+    DrugPartnerInteraction,
+    DrugSearchResponse,
+    ErrorResponse,
+)
+from app.core.agent import agent_manager
+from drug_graph_traversal import (
+    DEFAULT_MAX_FANOUT,
+    DEFAULT_PATH_DEPTH,
+    DEFAULT_TIME_BUDGET,
+    MAX_PATH_DEPTH,
+)
+
+router = APIRouter()
+
+
+@router.get(
+    "/drugs/search",
+    response_model=DrugSearchResponse,
+    summary="Search Drug Names",
+    description="Type-ahead completions for a drug name prefix",
+    tags=["Drugs"],
+    responses={
+        200: {"description": "Successful response"},
+        503: {"model": ErrorResponse, "description": "Graph not available"},
+    },
+)
+async def search_drugs(
+    q: str = Query(..., min_length=1, description="Prefix typed so far"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum completions"),
+):
+    """
+    Complete a drug name prefix from graph drugs and the mapper vocabulary.
+
+    Matches full names and word starts ("sod" finds "Valproate sodium"),
+    ranked by exact match, match position and interaction count. The index
+    is built in the thread pool on the first request of a graph version.
+    """
+    try:
+        index = await run_in_threadpool(agent_manager.get_name_index)
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Graph not loaded"
+        )
+
+    return DrugSearchResponse(
+        query=q,
+        results=[DrugCompletion(**result) for result in index.search(q, limit)],
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+@router.get(
+    "/drugs/{drug_name}/interactions",
+    response_model=DrugInteractionListResponse,
+    summary="List Drug Interactions",
+    description="Page through the known interactions of a single drug",
+    tags=["Drugs"],
+    responses={
+        200: {"description": "Successful response"},
+        404: {"model": ErrorResponse, "description": "Drug not found"},
+        503: {"model": ErrorResponse, "description": "Agent not available"},
+    },
+)
+async def list_drug_interactions(
+    drug_name: str,
+    limit: int = Query(50, ge=1, le=500, description="Page size"),
+    offset: int = Query(0, ge=0, description="Number of interactions to skip"),
+    condition: Optional[str] = Query(
+        None, description="Only include conditions containing this text"
+    ),
+):
+    """
+    List interactions for a drug without materializing the full list.
+
+    Only the requested page is built, so hub drugs with thousands of
+    partners stay cheap.
+    """
+    try:
+        graph = agent_manager.get_graph()
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Graph not loaded"
+        )
+
+    total = graph.degree(drug_name)
+    if total == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No interactions found for '{drug_name}'",
+        )
+
+    interactions = graph.get_all_interactions_for_drug(
+        drug_name, limit=limit, offset=offset, condition=condition
+    )
+
+    return DrugInteractionListResponse(
+        drug_name=drug_name,
+        total_partners=total,
+        limit=limit,
+        offset=offset,
+        interactions=[DrugPartnerInteraction(**i) for i in interactions],
+        timestamp=datetime.utcnow().isoformat(),
+    )
+
+
+@router.get(
+    "/drugs/{drug1}/connection/{drug2}",
+    response_model=DrugConnectionResponse,
+    summary="Indirect Drug Interactions",
+    description=(
+        "Find the drugs two drugs both interact with and the shortest chain "
+        "of interactions between them, within depth, fan-out and time limits"
+    ),
+    tags=["Drugs"],
+    responses={
+        200: {"description": "Successful response"},
+        404: {"model": ErrorResponse, "description": "Drug not found"},
+        503: {"model": ErrorResponse, "description": "Graph not available"},
+    },
+)
+async def get_drug_connection(
+    drug1: str,
+    drug2: str,
+    max_depth: int = Query(
+        DEFAULT_PATH_DEPTH,
+        ge=1,
+        le=MAX_PATH_DEPTH,
+        description="Longest chain of interactions to look for",
+    ),
+    max_fanout: int = Query(
+        DEFAULT_MAX_FANOUT,
+        ge=1,
+        le=5000,
+        description="Maximum partners expanded per drug in the path search",
+    ),
+    time_budget_ms: int = Query(
+        int(DEFAULT_TIME_BUDGET * 1000),
+        ge=1,
+        le=1000,
+        description="Time the path search may spend, in milliseconds",
+    ),
+    limit: int = Query(20, ge=0, le=500, description="Maximum shared partners"),
+):
+    """
+    Describe how two drugs are connected through the interaction graph.
+
+    Shared partners are exact; the path search is bounded, so hub drugs
+    answer within the time budget and flag a cut search as truncated.
+    """
+    try:
+        graph = agent_manager.get_graph()
+    except RuntimeError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Graph not loaded"
+        )
+
+    # The path search may run for the whole time budget
+    connection = await run_in_threadpool(
+        graph.find_indirect_interactions,
+        drug1,
+        drug2,
+        limit=limit,
+        max_depth=max_depth,
+        max_fanout=max_fanout,
+        time_budget=time_budget_ms / 1000,
+    )
+    if connection is None:
+        missing = drug1 if graph.vertex_ids([drug1])[0] < 0 else drug2
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Drug '{missing}' not found",
+        )
+
+    return DrugConnectionResponse(**connection, timestamp=datetime.utcnow().isoformat())
@@ -1,9 +1,11 @@
 """Statistics endpoints."""
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 
-from app.models import StatsResponse
+from app.models import DegreeBucket, HubDrug, StatsResponse
 from app.core.agent import agent_manager
+from drug_graph_stats import DEFAULT_TOP_K
 
 router = APIRouter()
 
@@ -15,19 +17,49 @@ router = APIRouter()
     description="Get statistics about the drug interaction database and active sessions",
     tags=["Statistics"],
 )
-async def get_stats():
-    """Get database and session statistics."""
+async def get_stats(
+    top: int = Query(
+        10, ge=0, le=DEFAULT_TOP_K, description="Number of hub drugs to list"
+    ),
+):
+    """
+    Get database and session statistics.
+
+    Per-drug statistics are computed once per graph version and cached on
+    disk, so this endpoint does not touch the edges after the first call;
+    that one runs in the thread pool to keep the event loop free.
+    """
     try:
-        agent = agent_manager.get_agent()
+        agent_manager.get_agent()
+        statistics = await run_in_threadpool(agent_manager.get_graph_statistics)
+        summary = statistics.summary(top)
     except RuntimeError:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail="Agent not loaded"
         )
 
-    stats = agent.get_graph_stats()
+    name_mapping_tiers = None
+    try:
+        from app.core.drug_mapper import get_loaded_drug_mapper
+
+        mapper = get_loaded_drug_mapper()
+        if mapper:
+            name_mapping_tiers = mapper.get_tier_stats()
+    except ImportError:
+        pass
 
     return StatsResponse(
-        total_drugs=stats["drugs"],
-        total_interactions=stats["interactions"],
+        total_drugs=summary["drugs"],
+        total_interactions=summary["interactions"],
         active_sessions=agent_manager.get_active_sessions_count(),
+        graph_version=agent_manager.graph_holder.version,
+        name_mapping_tiers=name_mapping_tiers,
+        distinct_conditions=summary["conditions"],
+        mean_degree=summary["mean_degree"],
+        max_degree=summary["max_degree"],
+        isolated_drugs=summary["isolated_drugs"],
+        top_drugs=[HubDrug(**hub) for hub in summary["top_drugs"]],
+        degree_histogram=[
+            DegreeBucket(**bucket) for bucket in summary["degree_histogram"]
+        ],
     )
@@ -1,15 +1,25 @@
 """Agent management and initialization."""
 
 import os
+import threading
 import uuid
-from typing import Dict, Optional
+from typing import Dict, List, Optional, Tuple
 
-from app.agents import create_agent, DrugInteractionAgent
+from app.agents import create_agent, load_graph, DrugInteractionAgent
 from app.agents.medical_specialist_agent import (
     MedicalSpecialistAgent,
     create_medical_specialist_agent,
 )
 from app.core.config import settings
+from app.core.drug_name_index import (
+    PrefixIndex,
+    load_alias_index,
+    load_mapper_vocabulary,
+)
+from app.core.graph_holder import GraphHolder
+from drug_graph_snapshot import source_stamp
+from drug_graph_stats import GraphStatistics, load_or_compute_statistics
+from drug_interaction_graph import DrugInteractionGraph
 
 
 class AgentManager:
@@ -21,21 +31,83 @@ class AgentManager:
         self.sessions: Dict[str, DrugInteractionAgent] = {}
         self.query_answers: Dict[str, str] = {}  # Store query answers per session
         self.medical_specialist: Optional[MedicalSpecialistAgent] = None
+        self.graph_holder = GraphHolder(
+            self._load_graph, lambda: source_stamp(self._graph_sources())
+        )
+        self._graph_file: Optional[str] = None
+        self._name_index: Optional[Tuple[int, PrefixIndex]] = None
+        self._name_index_lock = threading.Lock()
+        self._statistics: Optional[Tuple[int, GraphStatistics]] = None
+        self._statistics_lock = threading.Lock()
 
-    def initialize_agent(self) -> None:
-        """Initialize the main agent."""
-        # Use GraphML file instead of CSV
-        graphml_file = "drug_interactions.graphml"
+    def _resolve_graph_file(self) -> str:
+        """
+        Return the graph file to load, preferring the binary snapshot.
+
+        If only the GraphML file exists it is imported once and converted to
+        a snapshot so that later starts skip GraphML parsing.
+
+        Returns:
+            Path to the snapshot, or to the GraphML file if it can't be written
+        """
+        snapshot_file = settings.GRAPH_SNAPSHOT_FILE
+        graphml_file = settings.GRAPHML_FILE
+
+        if os.path.exists(snapshot_file):
+            return snapshot_file
 
         if not os.path.exists(graphml_file):
-            raise FileNotFoundError(f"GraphML file '{graphml_file}' not found")
+            raise FileNotFoundError(
+                f"Neither snapshot '{snapshot_file}' nor GraphML file "
+                f"'{graphml_file}' found"
+            )
+
+        print(f"📦 Converting '{graphml_file}' to snapshot '{snapshot_file}'...")
+        try:
+            DrugInteractionGraph(graphml_file).save_snapshot(snapshot_file)
+        except OSError as e:
+            print(f"⚠️ Could not write snapshot, using GraphML: {e}")
+            return graphml_file
+        return snapshot_file
+
+    def _graph_sources(self) -> List[str]:
+        """
+        Return the files the graph is built from (graph file, delta log).
+
+        The graph file is resolved once, by the first load at startup, so
+        later reloads and requests never start a GraphML conversion.
+        """
+        if self._graph_file is None:
+            self._graph_file = self._resolve_graph_file()
+        return [self._graph_file, settings.GRAPH_DELTA_LOG_FILE]
+
+    def _load_graph(self):
+        """
+        Build the interaction graph from the configured snapshot and delta log.
+
+        Used both at startup and by hot reloads, so a reload picks up a newly
+        written snapshot and any deltas appended since.
+
+        Returns:
+            Loaded DrugInteractionGraph or FrozenDrugGraph
+        """
+        return load_graph(
+            self._graph_sources()[0],
+            read_only=settings.GRAPH_READ_ONLY,
+            delta_log_filepath=settings.GRAPH_DELTA_LOG_FILE,
+            shared_filepath=settings.GRAPH_SHARED_FILE,
+        )
 
+    def initialize_agent(self) -> None:
+        """Initialize the main agent."""
         if not settings.OPENAI_API_KEY:
             raise ValueError("OPENAI_API_KEY not found in environment variables")
 
         print("🚀 Starting Drug Interaction Agent API (LangGraph)...")
+        self.graph_holder.load()
+        load_alias_index(settings.DRUG_ALIAS_FILE, settings.DRUG_ALIAS_LEARNED_FILE)
         self.agent = create_agent(
-            data_filepath=graphml_file,
+            graph=self.graph_holder,
             openai_api_key=settings.OPENAI_API_KEY,
             model_name=settings.OPENAI_MODEL,
             verbose=settings.AGENT_VERBOSE,
@@ -48,6 +120,69 @@ class AgentManager:
             raise RuntimeError("Agent not initialized")
         return self.agent
 
+    def get_graph(self):
+        """
+        Get the current interaction graph, pinned for one request.
+
+        Raises:
+            RuntimeError: If the graph has not been loaded yet
+        """
+        return self.graph_holder.pin()
+
+    def get_name_index(self) -> PrefixIndex:
+        """
+        Get the type-ahead index for the current graph version.
+
+        The index is built from graph vertex names plus the drug mapper
+        vocabulary on first use and rebuilt after a graph reload. Building
+        it reads every name, so call it from a worker thread rather than the
+        event loop; concurrent first calls build it once.
+
+        Raises:
+            RuntimeError: If the graph has not been loaded yet
+        """
+        current = self.graph_holder.current()
+        with self._name_index_lock:
+            if self._name_index is None or self._name_index[0] != current.version:
+                index = PrefixIndex.from_graph(current.graph, load_mapper_vocabulary())
+                self._name_index = (current.version, index)
+            return self._name_index[1]
+
+    def get_graph_statistics(self) -> GraphStatistics:
+        """
+        Get per-drug statistics for the current graph version.
+
+        Read from GRAPH_STATS_FILE when it was computed from the snapshot and
+        delta log as they were when this version was loaded, otherwise
+        computed once and written there. A cold call touches every edge, so
+        call it from a worker thread rather than the event loop.
+
+        Raises:
+            RuntimeError: If the graph has not been loaded yet
+        """
+        current = self.graph_holder.current()
+        with self._statistics_lock:
+            if self._statistics is None or self._statistics[0] != current.version:
+                statistics = load_or_compute_statistics(
+                    settings.GRAPH_STATS_FILE,
+                    current.source_stamp or source_stamp(self._graph_sources()),
+                    current.graph,
+                )
+                self._statistics = (current.version, statistics)
+            return self._statistics[1]
+
+    def reload_graph(self) -> bool:
+        """
+        Rebuild the interaction graph in the background and swap it in.
+
+        Queries keep being served from the current graph until the new one
+        is ready; sessions share the holder, so they all switch together.
+
+        Returns:
+            False if a reload is already in progress, True otherwise
+        """
+        return self.graph_holder.reload_in_background()
+
     def get_or_create_session(
         self, session_id: Optional[str] = None
     ) -> tuple[str, DrugInteractionAgent]:
@@ -70,7 +205,7 @@ class AgentManager:
         # Create new session if it doesn't exist
         if session_id not in self.sessions:
             self.sessions[session_id] = DrugInteractionAgent(
-                graph=self.agent.graph,  # Share the same graph
+                graph=self.graph_holder,  # Share the same (hot-swappable) graph
                 openai_api_key=settings.OPENAI_API_KEY,
                 model_name=settings.OPENAI_MODEL,
                 verbose=settings.AGENT_VERBOSE,
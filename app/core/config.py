@@ -33,6 +33,17 @@ class Settings(BaseSettings):
 
     # Data Configuration
     DATA_FILE: str = "TWOSIDES_preprocessed.csv"
+    GRAPHML_FILE: str = "drug_interactions.graphml"
+    GRAPH_SNAPSHOT_FILE: str = "drug_interactions.snap"
+    GRAPH_READ_ONLY: bool = False
+    GRAPH_DELTA_LOG_FILE: str = "drug_interactions.delta.ndjson"
+    GRAPH_SHARED_FILE: Optional[str] = None
+    GRAPH_STATS_FILE: str = "drug_interactions.stats"
+    DRUG_ALIAS_FILE: str = "drug_aliases.ndjson"
+    DRUG_ALIAS_LEARNED_FILE: str = "drug_aliases.learned.ndjson"
+
+    # Admin Configuration
+    ADMIN_TOKEN: Optional[str] = None
 
     # CORS Configuration
     CORS_ORIGINS: list = ["*"]
@@ -67,6 +78,21 @@ class Settings(BaseSettings):
             "CLOUDINARY_API_SECRET", self.CLOUDINARY_API_SECRET
         )
         self.DATA_FILE = os.getenv("DATA_FILE", self.DATA_FILE)
+        self.GRAPHML_FILE = os.getenv("GRAPHML_FILE", self.GRAPHML_FILE)
+        self.GRAPH_SNAPSHOT_FILE = os.getenv(
+            "GRAPH_SNAPSHOT_FILE", self.GRAPH_SNAPSHOT_FILE
+        )
+        self.GRAPH_READ_ONLY = os.getenv("GRAPH_READ_ONLY", "false").lower() == "true"
+        self.GRAPH_DELTA_LOG_FILE = os.getenv(
+            "GRAPH_DELTA_LOG_FILE", self.GRAPH_DELTA_LOG_FILE
+        )
+        self.GRAPH_SHARED_FILE = os.getenv("GRAPH_SHARED_FILE", self.GRAPH_SHARED_FILE)
+        self.GRAPH_STATS_FILE = os.getenv("GRAPH_STATS_FILE", self.GRAPH_STATS_FILE)
+        self.DRUG_ALIAS_FILE = os.getenv("DRUG_ALIAS_FILE", self.DRUG_ALIAS_FILE)
+        self.DRUG_ALIAS_LEARNED_FILE = os.getenv(
+            "DRUG_ALIAS_LEARNED_FILE", self.DRUG_ALIAS_LEARNED_FILE
+        )
+        self.ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", self.ADMIN_TOKEN)
         self.API_HOST = os.getenv("API_HOST", self.API_HOST)
         self.API_PORT = int(os.getenv("API_PORT", str(self.API_PORT)))
         self.API_RELOAD = os.getenv("API_RELOAD", "true").lower() == "true"
@@ -2,20 +2,57 @@
 Drug Name Mapping Utility
 
 This module provides functionality to map extracted drug names to standardized
-drug names using semantic similarity via embeddings.
+drug names. Names are resolved by the cheapest tier that is confident:
+
+1. exact: case-insensitive dictionary lookup
+2. lexical: unambiguous misspelling found by the trigram/edit-distance index,
+   with fewer edits tolerated as the caller's threshold rises (see
+   lexical_edit_budget); skipped at STRICT_THRESHOLD and above
+3. embedding: semantic similarity via sentence-transformer embeddings
 """
 
 import json
 import pickle
+import threading
 import numpy as np
+from collections import Counter
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional
 from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 import logging
 
+from app.core.drug_name_index import TrigramIndex, normalize_drug_name
+
 logger = logging.getLogger(__name__)
 
+# Tiers reported by DrugNameMapper.get_tier_stats, cheapest first
+MAPPING_TIERS = ("exact", "lexical", "embedding", "miss")
+
+# From this threshold on, only exact names (or embeddings) match
+STRICT_THRESHOLD = 0.9
+
+
+def lexical_edit_budget(threshold: float) -> Optional[int]:
+    """
+    Edits the lexical tier may tolerate for a similarity threshold.
+
+    Two edits can turn one drug into another ("prednisone" and
+    "prednisolone"), so they are only allowed for loose thresholds.
+
+    Args:
+        threshold: Minimum similarity requested by the caller
+
+    Returns:
+        0 at STRICT_THRESHOLD and above (lexical tier skipped), 1 from 0.7,
+        None below (up to allowed_typos() edits, i.e. 2 for long names)
+    """
+    if threshold >= STRICT_THRESHOLD:
+        return 0
+    if threshold >= 0.7:
+        return 1
+    return None
+
 
 class DrugNameMapper:
     """
@@ -35,6 +72,24 @@ class DrugNameMapper:
         self.embeddings = None
         self.drug_to_index = {}
         self.is_loaded = False
+        self.name_lookup: Dict[str, str] = {}
+        self.lexical_index: Optional[TrigramIndex] = None
+        self.tier_hits: Counter = Counter()
+        self._tier_lock = threading.Lock()
+
+    def _count_tier(self, tier: str) -> None:
+        """Count a resolution by a tier; called from concurrent requests."""
+        with self._tier_lock:
+            self.tier_hits[tier] += 1
+
+    def _build_lexical_indexes(self) -> None:
+        """Index drug_names for the exact and lexical tiers."""
+        self.name_lookup = {}
+        for drug_name in self.drug_names:
+            self.name_lookup.setdefault(normalize_drug_name(drug_name), drug_name)
+        self.lexical_index = TrigramIndex(self.drug_names)
+        with self._tier_lock:
+            self.tier_hits = Counter()
 
     def load_embeddings(self, embeddings_path: str) -> bool:
         """
@@ -56,6 +111,7 @@ class DrugNameMapper:
                     self.drug_names = saved_mapper.drug_names
                     self.embeddings = saved_mapper.embeddings
                     self.drug_to_index = saved_mapper.drug_to_index
+                    self._build_lexical_indexes()
                     self.is_loaded = True
                     logger.info(f"Loaded drug mapper from {pickle_path}")
                     return True
@@ -79,6 +135,7 @@ class DrugNameMapper:
                 # Load model
                 self.model = SentenceTransformer(self.model_name)
 
+                self._build_lexical_indexes()
                 self.is_loaded = True
                 logger.info(
                     f"Loaded drug mapper from {mapping_path} and {embeddings_file}"
@@ -106,31 +163,74 @@ class DrugNameMapper:
         Returns:
             The closest matching standardized drug name, or None if no match found
         """
+        return self.map_drug_name_with_tier(extracted_name, threshold, top_k)[0]
+
+    def map_drug_name_with_tier(
+        self, extracted_name: str, threshold: float = 0.7, top_k: int = 1
+    ) -> Tuple[Optional[str], str]:
+        """
+        Map a drug name and report which tier resolved it.
+
+        Args:
+            extracted_name: The drug name extracted from text/image
+            threshold: Minimum similarity threshold for matching
+            top_k: Number of top matches to consider
+
+        Returns:
+            Tuple of (standardized drug name or None, tier in MAPPING_TIERS)
+        """
         if not self.is_loaded:
             logger.error("Drug mapper not loaded. Call load_embeddings first.")
-            return None
+            return None, "miss"
 
         if not extracted_name or not extracted_name.strip():
-            return None
+            return None, "miss"
 
         # Clean the extracted name
         cleaned_name = extracted_name.strip().lower()
 
-        # Check for exact match first (case-insensitive)
-        for drug_name in self.drug_names:
-            if drug_name.lower() == cleaned_name:
-                return drug_name
-
-        # Find closest match using embeddings
+        # Tier 1: exact match (case-insensitive)
+        exact = self.name_lookup.get(normalize_drug_name(cleaned_name))
+        if exact is not None:
+            self._count_tier("exact")
+            return exact, "exact"
+
+        # Tier 2: unambiguous misspelling, without encoding the query
+        max_typos = lexical_edit_budget(threshold)
+        if self.lexical_index is not None and max_typos != 0:
+            match = self.lexical_index.lookup(cleaned_name, max_typos)
+            if match is not None:
+                self._count_tier("lexical")
+                return match[0], "lexical"
+
+        # Tier 3: find closest match using embeddings
         try:
             results = self._find_closest_drugs(cleaned_name, top_k, threshold)
             print(f"drug_mapper - drug_name: {cleaned_name} results: {results}")
             if results:
-                return results[0][0]  # Return the drug name of the best match
+                self._count_tier("embedding")
+                return results[0][0], "embedding"  # Drug name of the best match
         except Exception as e:
             logger.error(f"Error finding closest drug for '{extracted_name}': {e}")
 
-        return None
+        self._count_tier("miss")
+        return None, "miss"
+
+    def get_tier_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Report how often each mapping tier resolved a name.
+
+        Returns:
+            Dictionary mapping each tier in MAPPING_TIERS to its 'hits' and
+            'rate' (share of all map_drug_name calls since loading)
+        """
+        with self._tier_lock:
+            hits = {tier: self.tier_hits[tier] for tier in MAPPING_TIERS}
+        total = sum(hits.values())
+        return {
+            tier: {"hits": hits[tier], "rate": hits[tier] / total if total else 0.0}
+            for tier in MAPPING_TIERS
+        }
 
     def map_multiple_drugs(
         self, extracted_names: List[str], threshold: float = 0.7
@@ -233,7 +333,7 @@ class DrugNameMapper:
         if not self.is_loaded:
             return False
 
-        return drug_name.lower() in [name.lower() for name in self.drug_names]
+        return normalize_drug_name(drug_name) in self.name_lookup
 
 
 # Global mapper instance
@@ -261,6 +361,18 @@ def get_drug_mapper(embeddings_path: str = "drug_embeddings") -> DrugNameMapper:
     return _drug_mapper
 
 
+def get_loaded_drug_mapper() -> Optional[DrugNameMapper]:
+    """
+    Get the global drug mapper if it has been loaded, without loading it.
+
+    Returns:
+        DrugNameMapper instance, or None if it is not loaded
+    """
+    if _drug_mapper is not None and _drug_mapper.is_loaded:
+        return _drug_mapper
+    return None
+
+
 def map_drug_name(
     extracted_name: str,
     threshold: float = 0.7,
@@ -283,6 +395,28 @@ def map_drug_name(
     return None
 
 
+def map_drug_name_with_tier(
+    extracted_name: str,
+    threshold: float = 0.7,
+    embeddings_path: str = "drug_embeddings",
+) -> Tuple[Optional[str], str]:
+    """
+    Convenience function to map a single drug name and report the tier used.
+
+    Args:
+        extracted_name: The drug name to map
+        threshold: Minimum similarity threshold
+        embeddings_path: Path to the embedding files
+
+    Returns:
+        Tuple of (mapped drug name or None, tier in MAPPING_TIERS)
+    """
+    mapper = get_drug_mapper(embeddings_path)
+    if mapper:
+        return mapper.map_drug_name_with_tier(extracted_name, threshold)
+    return None, "miss"
+
+
 def map_multiple_drugs(
     extracted_names: List[str],
     threshold: float = 0.7,
@@ -0,0 +1,515 @@
+"""
+Lightweight drug name indexes.
+
+These answer name lookups from plain arrays and dicts, without loading
+the sentence-transformer model used by DrugNameMapper.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Sorts after any character that can follow a prefix
+_PREFIX_END = "\U0010ffff"
+# Candidates ranked per requested completion before removing duplicate names
+_CANDIDATES_PER_RESULT = 4
+# Trigram candidates checked with edit distance per lexical lookup
+_LEXICAL_CANDIDATES = 8
+_WORD_START = re.compile(r"(?<![a-z0-9])[a-z0-9]")
+
+
+def normalize_drug_name(name: str) -> str:
+    """Lowercase a drug name and collapse internal whitespace."""
+    return " ".join(name.lower().split())
+
+
+def load_mapper_vocabulary(embeddings_path: str = "drug_embeddings") -> List[str]:
+    """
+    Read the DrugNameMapper vocabulary without loading its model.
+
+    Args:
+        embeddings_path: Base path of the embedding files (without extension)
+
+    Returns:
+        Drug names from the mapping file, or an empty list if it is missing
+    """
+    mapping_path = Path(f"{embeddings_path}_mapping.json")
+    if not mapping_path.exists():
+        return []
+    with open(mapping_path, "r", encoding="utf-8") as f:
+        return json.load(f).get("drug_names", [])
+
+
+class PrefixIndex:
+    """
+    Type-ahead index over drug names.
+
+    Every name is indexed under its full normalized form and under each
+    word start ("valproate sodium" is also found by "sod"). Keys live in one
+    sorted list, so a prefix query is two binary searches plus vectorized
+    ranking of the matching range.
+
+    Ranking: exact match, then full-name prefix before word prefix, then
+    more interactions, then shorter names, then alphabetical. Ranking
+    criteria other than the exact match are packed into one integer per
+    key, so a large range is cut to the best candidates with argpartition
+    instead of being sorted.
+    """
+
+    def __init__(self, names: Dict[str, int], graph_names: Iterable[str] = ()):
+        """
+        Build the index.
+
+        Args:
+            names: Display names mapped to their interaction count
+            graph_names: Names that are vertices of the interaction graph
+        """
+        by_key: Dict[str, str] = {}
+        for name in names:
+            key = normalize_drug_name(name)
+            if key:
+                by_key.setdefault(key, name)
+        in_graph = {normalize_drug_name(name) for name in graph_names}
+
+        sorted_keys = sorted(by_key)
+        self.names = [by_key[key] for key in sorted_keys]
+        self._entry_by_key = {key: entry for entry, key in enumerate(sorted_keys)}
+        self.interactions = np.array(
+            [names[name] for name in self.names], dtype=np.int64
+        )
+        self.in_graph = np.array([key in in_graph for key in sorted_keys], dtype=bool)
+        self._name_lengths = np.array([len(key) for key in sorted_keys], dtype=np.int64)
+
+        entries = []
+        for entry, key in enumerate(sorted_keys):
+            for match in _WORD_START.finditer(key):
+                entries.append((key[match.start() :], entry, match.start() == 0))
+        entries.sort()
+        self._keys = [key for key, _, _ in entries]
+        self._key_entries = np.array([e for _, e, _ in entries], dtype=np.int32)
+        is_full = np.array([full for _, _, full in entries], dtype=bool)
+
+        # Static part of the ranking packed into one integer per key:
+        # full-name match, then interaction count, then shorter name
+        interactions = np.minimum(self.interactions[self._key_entries], 2**40 - 1)
+        lengths = np.minimum(self._name_lengths[self._key_entries], 1023)
+        self._key_scores = (
+            (is_full.astype(np.int64) << 51) | (interactions << 10) | (1023 - lengths)
+        )
+
+    @classmethod
+    def from_graph(cls, graph, extra_names: Iterable[str] = ()) -> "PrefixIndex":
+        """
+        Build an index from graph vertex names plus extra vocabulary.
+
+        Args:
+            graph: DrugInteractionGraph or FrozenDrugGraph
+            extra_names: Additional names, e.g. the DrugNameMapper vocabulary
+
+        Returns:
+            PrefixIndex where graph names carry their interaction counts
+        """
+        degrees = graph.get_drug_degrees()
+        names = dict(degrees)
+        for name in extra_names:
+            names.setdefault(name, graph.degree(name))
+        return cls(names, graph_names=degrees)
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Find ranked completions for a prefix.
+
+        Args:
+            query: Prefix typed so far (case-insensitive)
+            limit: Maximum number of completions
+
+        Returns:
+            List of dictionaries with keys: 'name', 'interactions', 'in_graph'
+        """
+        prefix = normalize_drug_name(query)
+        if not prefix or limit <= 0:
+            return []
+
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + _PREFIX_END, lo)
+        if lo == hi:
+            return []
+
+        # Only the best-scoring keys of a large range need sorting; widen
+        # the cut if names matched at several word starts crowd it
+        scores = self._key_scores[lo:hi]
+        entries = self._key_entries[lo:hi]
+        count = (limit + 1) * _CANDIDATES_PER_RESULT
+        while True:
+            if count < len(scores):
+                top = np.argpartition(-scores, count - 1)[:count]
+            else:
+                top = np.arange(len(scores))
+            ranked = entries[top[np.lexsort((entries[top], -scores[top]))]]
+            # A name keeps its first (best-scoring) key
+            _, first = np.unique(ranked, return_index=True)
+            ranked = ranked[np.sort(first)]
+            if len(ranked) > limit or len(top) == len(scores):
+                break
+            count *= _CANDIDATES_PER_RESULT
+
+        ranked = ranked.tolist()
+        exact = self._entry_by_key.get(prefix)
+        if exact is not None:
+            ranked = [exact] + [entry for entry in ranked if entry != exact]
+        return [
+            {
+                "name": self.names[entry],
+                "interactions": int(self.interactions[entry]),
+                "in_graph": bool(self.in_graph[entry]),
+            }
+            for entry in ranked[:limit]
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of indexed names."""
+        return len(self.names)
+
+
+def edit_distance(a: str, b: str, max_distance: int) -> int:
+    """
+    Optimal string alignment distance, giving up past a bound.
+
+    Counts insertions, deletions, substitutions and swaps of adjacent
+    characters ("wafrarin" is one edit from "warfarin").
+
+    Args:
+        a: First string
+        b: Second string
+        max_distance: Largest distance of interest
+
+    Returns:
+        The distance, or max_distance + 1 if it is larger than max_distance
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous2: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = a[i - 1] != b[j - 1]
+            current[j] = min(
+                previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous2, previous = previous, current
+    return min(previous[-1], max_distance + 1)
+
+
+def allowed_typos(name: str) -> int:
+    """
+    Edits tolerated when matching a name of this length with confidence.
+
+    Names under 4 characters must match exactly; up to 7 characters one
+    edit is allowed, and longer names allow two.
+    """
+    if len(name) < 4:
+        return 0
+    return 1 if len(name) < 8 else 2
+
+
+class TrigramIndex:
+    """
+    Typo-tolerant drug name lookup.
+
+    Names are split into character trigrams (padded, so word starts and
+    ends count). A query's trigram postings are counted with bincount to
+    find the few names sharing the most trigrams, which are then checked
+    with a bounded edit distance.
+    """
+
+    def __init__(self, names: Sequence[str]):
+        """
+        Build the index.
+
+        Args:
+            names: Names to match against
+        """
+        self.names = list(names)
+        self._keys = [normalize_drug_name(name) for name in self.names]
+        postings: Dict[str, List[int]] = {}
+        trigram_counts = []
+        for entry, key in enumerate(self._keys):
+            trigrams = self._trigrams(key)
+            trigram_counts.append(len(trigrams))
+            for trigram in trigrams:
+                postings.setdefault(trigram, []).append(entry)
+        self._postings = {
+            trigram: np.array(entries, dtype=np.int32)
+            for trigram, entries in postings.items()
+        }
+        self._trigram_counts = np.array(trigram_counts, dtype=np.int64)
+
+    @staticmethod
+    def _trigrams(key: str) -> set:
+        """Distinct trigrams of a normalized name, padded at both ends."""
+        padded = f"  {key} "
+        return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+    def _overlaps(self, key: str) -> Tuple[np.ndarray, int]:
+        """Count the trigrams each name shares with a normalized query."""
+        trigrams = self._trigrams(key)
+        postings = [
+            self._postings[trigram] for trigram in trigrams if trigram in self._postings
+        ]
+        if not postings:
+            return np.zeros(len(self.names), dtype=np.int64), len(trigrams)
+        overlap = np.bincount(np.concatenate(postings), minlength=len(self.names))
+        return overlap, len(trigrams)
+
+    def candidates(
+        self, query: str, limit: int = _LEXICAL_CANDIDATES
+    ) -> List[Tuple[int, float]]:
+        """
+        Find the names sharing the most trigrams with a query.
+
+        Args:
+            query: Name to look up (case-insensitive)
+            limit: Maximum number of candidates
+
+        Returns:
+            List of (name position, Dice similarity) pairs, most similar first
+        """
+        overlap, query_count = self._overlaps(normalize_drug_name(query))
+        count = min(limit, int(np.count_nonzero(overlap)))
+        if count == 0:
+            return []
+        dice = 2.0 * overlap / (query_count + self._trigram_counts)
+        top = np.argpartition(-dice, count - 1)[:count]
+        top = top[np.argsort(-dice[top], kind="stable")]
+        return [(entry, float(dice[entry])) for entry in top.tolist()]
+
+    def lookup(
+        self, query: str, max_typos: Optional[int] = None
+    ) -> Optional[Tuple[str, int]]:
+        """
+        Resolve a possibly misspelled name when the match is unambiguous.
+
+        Args:
+            query: Name to look up (case-insensitive)
+            max_typos: Cap on the edits tolerated (None for allowed_typos())
+
+        Returns:
+            Tuple of (name, edit distance) if exactly one candidate is
+            closest and within allowed_typos() and max_typos, otherwise None
+        """
+        key = normalize_drug_name(query)
+        max_distance = allowed_typos(key)
+        if max_typos is not None:
+            max_distance = min(max_distance, max(0, max_typos))
+        overlap, query_count = self._overlaps(key)
+
+        # Each edit changes at most 4 padded trigrams (3, or 4 for a swap),
+        # which bounds the distance from below without running the DP
+        missing = np.maximum(query_count, self._trigram_counts) - overlap
+        lower_bounds = -(-missing // 4)
+        possible = np.flatnonzero((lower_bounds <= max_distance) & (overlap > 0))
+        possible = possible[np.argsort(lower_bounds[possible], kind="stable")]
+
+        best: Optional[int] = None
+        best_distance = max_distance + 1
+        tied = False
+        for entry in possible[:_LEXICAL_CANDIDATES].tolist():
+            if lower_bounds[entry] > best_distance or (
+                best_distance == 0 and best is not None
+            ):
+                break
+            distance = edit_distance(key, self._keys[entry], best_distance)
+            if distance < best_distance:
+                best, best_distance, tied = entry, distance, False
+            elif distance == best_distance and distance <= max_distance:
+                tied = True
+        # Candidates past the cut could still tie with the best one
+        truncated = len(possible) > _LEXICAL_CANDIDATES and (
+            lower_bounds[possible[_LEXICAL_CANDIDATES]] <= best_distance
+        )
+        if best is None or tied or truncated:
+            return None
+        return self.names[best], best_distance
+
+    def __len__(self) -> int:
+        """Return the number of indexed names."""
+        return len(self.names)
+
+
+class AliasIndex:
+    """
+    Brand-name and synonym lookup, e.g. "Tylenol" -> "Acetaminophen".
+
+    Aliases map a normalized name to the canonical drug name of a graph
+    vertex, so resolving one is a single dict lookup. They are stored as
+    newline-delimited JSON ({"alias": ..., "drug": ...}). The seed file is
+    only read; aliases learned at runtime, such as confident LLM ingredient
+    extractions, are appended to a separate learned file so later processes
+    start with them and a bad one can be dropped without touching the seed.
+    """
+
+    def __init__(
+        self, filepath: Optional[str] = None, learned_filepath: Optional[str] = None
+    ):
+        """
+        Initialize the index, loading the alias files that exist.
+
+        Args:
+            filepath: Seed alias file
+            learned_filepath: File to load and to append learned aliases to
+        """
+        self.filepath = filepath
+        self.learned_filepath = learned_filepath
+        self._aliases: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        for path in (filepath, learned_filepath):
+            if path and os.path.exists(path):
+                self.load(path)
+
+    def load(self, filepath: str) -> int:
+        """
+        Add the aliases from a file; later lines override earlier ones.
+
+        Malformed lines are logged and skipped.
+
+        Args:
+            filepath: Newline-delimited JSON alias file
+
+        Returns:
+            Number of aliases read
+        """
+        count = 0
+        with open(filepath, "r", encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                    self.add(record["alias"], record["drug"])
+                    count += 1
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    logger.warning(f"Skipping alias at {filepath}:{line_number}: {e}")
+        return count
+
+    def add(self, alias: str, drug: str) -> bool:
+        """
+        Register an alias in memory.
+
+        Args:
+            alias: Brand name or synonym
+            drug: Canonical drug name
+
+        Returns:
+            True if the alias is new or now points to a different drug
+        """
+        key = normalize_drug_name(alias)
+        drug = drug.strip()
+        if not key or not drug or key == normalize_drug_name(drug):
+            return False
+        if self._aliases.get(key) == drug:
+            return False
+        self._aliases[key] = drug
+        return True
+
+    def learn(self, alias: str, drug: str, source: str = "llm") -> bool:
+        """
+        Register an alias and append it to the learned alias file.
+
+        Args:
+            alias: Brand name or synonym
+            drug: Canonical drug name
+            source: Where the alias came from, recorded in the file
+
+        Returns:
+            True if the alias was new or changed
+        """
+        with self._lock:
+            if not self.add(alias, drug):
+                return False
+            if self.learned_filepath:
+                record = {
+                    "alias": alias.strip(),
+                    "drug": drug.strip(),
+                    "source": source,
+                }
+                with open(self.learned_filepath, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        return True
+
+    def resolve(self, name: str) -> Optional[str]:
+        """
+        Look up the canonical drug name for an alias.
+
+        Args:
+            name: Brand name or synonym (case-insensitive)
+
+        Returns:
+            Canonical drug name, or None if the alias is unknown
+        """
+        return self._aliases.get(normalize_drug_name(name))
+
+    def __contains__(self, name: str) -> bool:
+        """Check whether a name is a known alias."""
+        return normalize_drug_name(name) in self._aliases
+
+    def __len__(self) -> int:
+        """Return the number of aliases."""
+        return len(self._aliases)
+
+
+# Global alias index instance
+_alias_index: Optional[AliasIndex] = None
+
+
+def load_alias_index(
+    filepath: str, learned_filepath: Optional[str] = None
+) -> AliasIndex:
+    """
+    Load the global alias index from its files.
+
+    Args:
+        filepath: Seed alias file
+        learned_filepath: Learned alias file (created when the first alias
+            is learned)
+
+    Returns:
+        AliasIndex instance
+    """
+    global _alias_index
+    _alias_index = AliasIndex(filepath, learned_filepath)
+    logger.info(f"Loaded {len(_alias_index)} drug aliases from {filepath}")
+    return _alias_index
+
+
+def get_alias_index(
+    filepath: str = "drug_aliases.ndjson",
+    learned_filepath: Optional[str] = "drug_aliases.learned.ndjson",
+) -> AliasIndex:
+    """
+    Get the global alias index, loading it on first use.
+
+    Args:
+        filepath: Seed alias file used if the index has not been loaded yet
+        learned_filepath: Learned alias file used if the index has not been
+            loaded yet
+
+    Returns:
+        AliasIndex instance
+    """
+    if _alias_index is None:
+        return load_alias_index(filepath, learned_filepath)
+    return _alias_index
@@ -0,0 +1,212 @@
+"""Versioned, hot-swappable holder for the drug interaction graph."""
+
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+
+class GraphVersion:
+    """One loaded version of the interaction graph."""
+
+    def __init__(
+        self,
+        graph: Any,
+        version: int,
+        load_seconds: float,
+        source_stamp: Optional[Any] = None,
+    ):
+        """
+        Initialize a graph version.
+
+        Args:
+            graph: DrugInteractionGraph or FrozenDrugGraph
+            version: Monotonically increasing version number
+            load_seconds: Time it took to build the graph
+            source_stamp: Stamp of the source files taken before the load
+        """
+        self.graph = graph
+        self.version = version
+        self.load_seconds = load_seconds
+        self.source_stamp = source_stamp
+        self.loaded_at = datetime.now(timezone.utc).isoformat()
+
+
+class GraphHolder:
+    """
+    Holds the current interaction graph and swaps in new versions atomically.
+
+    A new graph is built by the loader without holding any lock, then the
+    reference is replaced in one step. Callers that pinned the old graph
+    (see pin()) finish on it; once the last reference is dropped the old
+    graph is freed. Note that both graphs are in memory during a reload.
+
+    Attribute access is forwarded to the current graph, so a holder can be
+    passed anywhere a graph is expected.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[], Any],
+        stamp: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        Initialize the holder.
+
+        Args:
+            loader: Function that builds a new graph from the configured files
+            stamp: Function identifying the current contents of those files;
+                called right before each load and kept on the GraphVersion
+        """
+        self._loader = loader
+        self._stamp = stamp
+        self._current: Optional[GraphVersion] = None
+        self._swap_lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self.last_error: Optional[str] = None
+
+    def current(self) -> GraphVersion:
+        """
+        Get the current graph version.
+
+        Raises:
+            RuntimeError: If no graph has been loaded yet
+        """
+        current = self._current
+        if current is None:
+            raise RuntimeError("Graph not loaded")
+        return current
+
+    def pin(self) -> Any:
+        """
+        Get the current graph for the duration of one request.
+
+        Keep using the returned object rather than the holder, so every
+        lookup in the request sees the same version.
+        """
+        return self.current().graph
+
+    @property
+    def version(self) -> Optional[int]:
+        """Version number of the current graph (None before the first load)."""
+        current = self._current
+        return current.version if current is not None else None
+
+    @property
+    def reloading(self) -> bool:
+        """Whether a reload is in progress."""
+        return self._reload_lock.locked()
+
+    def swap(
+        self,
+        graph: Any,
+        load_seconds: float = 0.0,
+        source_stamp: Optional[Any] = None,
+    ) -> GraphVersion:
+        """
+        Make a graph the current version.
+
+        Args:
+            graph: Newly built graph
+            load_seconds: Time it took to build the graph
+            source_stamp: Stamp of the source files the graph was built from
+
+        Returns:
+            The new GraphVersion
+        """
+        with self._swap_lock:
+            version = (self.version or 0) + 1
+            self._current = GraphVersion(graph, version, load_seconds, source_stamp)
+            return self._current
+
+    def load(self) -> GraphVersion:
+        """
+        Build a new graph with the loader and swap it in.
+
+        Only one load runs at a time; concurrent calls wait for it.
+
+        Returns:
+            The new GraphVersion
+        """
+        with self._reload_lock:
+            return self._load_locked()
+
+    def _load_locked(self) -> GraphVersion:
+        """Build and swap in a new graph; the caller holds the reload lock."""
+        start_time = time.perf_counter()
+        try:
+            stamp = self._stamp() if self._stamp is not None else None
+            graph = self._loader()
+        except Exception as e:
+            self.last_error = str(e)
+            raise
+        self.last_error = None
+        return self.swap(graph, time.perf_counter() - start_time, stamp)
+
+    def reload_in_background(self) -> bool:
+        """
+        Start building a new graph in a background thread.
+
+        The reload lock is taken before the thread starts, so concurrent
+        calls start at most one reload.
+
+        Returns:
+            False if a reload is already in progress, True otherwise
+        """
+        if not self._reload_lock.acquire(blocking=False):
+            return False
+
+        def run():
+            try:
+                version = self._load_locked()
+                print(f"✅ Graph version {version.version} loaded")
+            except Exception as e:
+                print(f"⚠️ Graph reload failed, keeping current version: {e}")
+            finally:
+                self._reload_lock.release()
+
+        try:
+            threading.Thread(target=run, name="graph-reload", daemon=True).start()
+        except Exception:
+            self._reload_lock.release()
+            raise
+        return True
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Describe the current graph version and reload state.
+
+        Returns:
+            Dictionary with version, loaded_at, load_seconds, drugs,
+            interactions, reloading and last_error
+        """
+        current = self._current
+        status = {
+            "version": None,
+            "loaded_at": None,
+            "load_seconds": None,
+            "drugs": None,
+            "interactions": None,
+            "reloading": self.reloading,
+            "last_error": self.last_error,
+        }
+        if current is not None:
+            stats = current.graph.get_stats()
+            status.update(
+                version=current.version,
+                loaded_at=current.loaded_at,
+                load_seconds=current.load_seconds,
+                drugs=stats["drugs"],
+                interactions=stats["interactions"],
+            )
+        return status
+
+    def __getattr__(self, name: str) -> Any:
+        """Forward graph methods (search_interaction, get_stats, ...) to the current graph."""
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.pin(), name)
+
+    def __len__(self) -> int:
+        """Return the number of interactions in the current graph."""
+        return len(self.pin())
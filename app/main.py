@@ -7,7 +7,15 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.core.agent import agent_manager
-from app.api.routes import health, stats, queries, medicine_cabinet
+from app.api.routes import (
+    health,
+    stats,
+    queries,
+    medicine_cabinet,
+    drugs,
+    conditions,
+    admin,
+)
 
 
 @asynccontextmanager
@@ -43,6 +51,9 @@ app.add_middleware(
 app.include_router(health.router)
 app.include_router(stats.router)
 app.include_router(queries.router)
+app.include_router(drugs.router)
+app.include_router(conditions.router)
+app.include_router(admin.router)
 app.include_router(medicine_cabinet.router, prefix="/medicine-cabinet", tags=["Medicine Cabinet"])
 
 
@@ -10,6 +10,8 @@ from .responses import (
     QueryResponse,
     ChatResponse,
     StatsResponse,
+    HubDrug,
+    DegreeBucket,
     HealthResponse,
     ErrorResponse,
     DrugNamesFromImageResponse,
@@ -18,6 +20,15 @@ from .responses import (
     DrugInteractionsResponse,
     DrugInteractionInfo,
     DrugWithInteractions,
+    DrugPartnerInteraction,
+    DrugInteractionListResponse,
+    DrugCompletion,
+    DrugSearchResponse,
+    DrugConnectionResponse,
+    ConditionMatch,
+    ConditionSearchResponse,
+    GraphStatusResponse,
+    GraphReloadResponse,
 )
 
 __all__ = [
@@ -28,6 +39,8 @@ __all__ = [
     "QueryResponse",
     "ChatResponse",
     "StatsResponse",
+    "HubDrug",
+    "DegreeBucket",
     "HealthResponse",
     "ErrorResponse",
     "DrugNamesFromImageResponse",
@@ -36,4 +49,13 @@ __all__ = [
     "DrugInteractionsResponse",
     "DrugInteractionInfo",
     "DrugWithInteractions",
+    "DrugPartnerInteraction",
+    "DrugInteractionListResponse",
+    "DrugCompletion",
+    "DrugSearchResponse",
+    "DrugConnectionResponse",
+    "ConditionMatch",
+    "ConditionSearchResponse",
+    "GraphStatusResponse",
+    "GraphReloadResponse",
 ]
@@ -20,6 +20,24 @@ class ChatResponse(BaseModel):
     timestamp: str = Field(..., description="ISO timestamp of the response")
 
 
+class HubDrug(BaseModel):
+    """Model for one of the drugs with the most interactions."""
+
+    drug: str = Field(..., description="Drug name")
+    interactions: int = Field(..., description="Number of interaction partners")
+    conditions: int = Field(
+        ..., description="Condition reports over all of the drug's interactions"
+    )
+
+
+class DegreeBucket(BaseModel):
+    """Model for one bucket of the degree histogram."""
+
+    min_degree: int = Field(..., description="Smallest number of partners")
+    max_degree: int = Field(..., description="Largest number of partners")
+    drugs: int = Field(..., description="Number of drugs in this range")
+
+
 class StatsResponse(BaseModel):
     """Response model for statistics."""
 
@@ -28,6 +46,33 @@ class StatsResponse(BaseModel):
         ..., description="Total number of drug interactions"
     )
     active_sessions: int = Field(..., description="Number of active chat sessions")
+    graph_version: Optional[int] = Field(
+        None, description="Version of the interaction graph being served"
+    )
+    name_mapping_tiers: Optional[Dict[str, Dict[str, float]]] = Field(
+        None,
+        description="Hits and hit rate of each drug name mapping tier "
+        "(exact, lexical, embedding, miss)",
+    )
+    distinct_conditions: Optional[int] = Field(
+        None, description="Number of distinct interaction conditions"
+    )
+    mean_degree: Optional[float] = Field(
+        None, description="Mean number of interaction partners per drug"
+    )
+    max_degree: Optional[int] = Field(
+        None, description="Largest number of interaction partners of any drug"
+    )
+    isolated_drugs: Optional[int] = Field(
+        None, description="Drugs without any recorded interaction"
+    )
+    top_drugs: List[HubDrug] = Field(
+        default_factory=list, description="Drugs with the most interactions"
+    )
+    degree_histogram: List[DegreeBucket] = Field(
+        default_factory=list,
+        description="Number of drugs per power-of-two range of partners",
+    )
 
 
 class HealthResponse(BaseModel):
@@ -106,3 +151,134 @@ class DrugInteractionsResponse(BaseModel):
     )
     total_interactions: int = Field(..., description="Total number of interactions")
     timestamp: str = Field(..., description="ISO timestamp")
+
+
+class DrugPartnerInteraction(BaseModel):
+    """Model for one interaction partner of a drug."""
+
+    drug: str = Field(..., description="Interacting drug name")
+    condition: Optional[str] = Field(
+        None, description="All interaction conditions as one string"
+    )
+    conditions: List[str] = Field(
+        default_factory=list, description="Individual interaction conditions"
+    )
+
+
+class DrugInteractionListResponse(BaseModel):
+    """Response model for a page of a drug's interactions."""
+
+    drug_name: str = Field(..., description="Drug name queried")
+    total_partners: int = Field(
+        ..., description="Total number of interacting drugs before filtering"
+    )
+    limit: int = Field(..., description="Page size")
+    offset: int = Field(..., description="Number of interactions skipped")
+    interactions: List[DrugPartnerInteraction] = Field(
+        ..., description="Interactions in this page"
+    )
+    timestamp: str = Field(..., description="ISO timestamp")
+
+
+class DrugCompletion(BaseModel):
+    """Model for one type-ahead completion."""
+
+    name: str = Field(..., description="Drug name")
+    interactions: int = Field(..., description="Number of known interaction partners")
+    in_graph: bool = Field(
+        ..., description="Whether the drug is in the interaction database"
+    )
+
+
+class DrugSearchResponse(BaseModel):
+    """Response model for drug name type-ahead search."""
+
+    query: str = Field(..., description="Prefix searched for")
+    results: List[DrugCompletion] = Field(..., description="Ranked completions")
+    timestamp: str = Field(..., description="ISO timestamp")
+
+
+class DrugConnectionResponse(BaseModel):
+    """Response model for a bounded indirect-interaction query."""
+
+    drug1: str = Field(..., description="First drug")
+    drug2: str = Field(..., description="Second drug")
+    direct: bool = Field(..., description="Whether the drugs interact directly")
+    shared_partner_count: int = Field(
+        ..., description="Number of drugs interacting with both"
+    )
+    shared_partners: List[str] = Field(
+        ..., description="Drugs interacting with both (up to the limit)"
+    )
+    path: Optional[List[str]] = Field(
+        None, description="Shortest chain of interactions found, if any"
+    )
+    distance: Optional[int] = Field(
+        None, description="Number of interactions on the path"
+    )
+    truncated: bool = Field(
+        ...,
+        description=(
+            "Whether a fan-out or time limit cut the path search, so a longer "
+            "or missing path is not definitive"
+        ),
+    )
+    elapsed_ms: float = Field(..., description="Query time in milliseconds")
+    timestamp: str = Field(..., description="ISO timestamp")
+
+
+class ConditionMatch(BaseModel):
+    """Model for one interaction matching a condition search."""
+
+    drug1: str = Field(..., description="First drug")
+    drug2: str = Field(..., description="Second drug")
+    condition: Optional[str] = Field(
+        None, description="All interaction conditions as one string"
+    )
+    conditions: List[str] = Field(
+        default_factory=list, description="Individual interaction conditions"
+    )
+    matched_conditions: List[str] = Field(
+        default_factory=list, description="Conditions matching the query on their own"
+    )
+
+
+class ConditionSearchResponse(BaseModel):
+    """Response model for a page of a condition search."""
+
+    query: str = Field(..., description="Condition query")
+    total: int = Field(..., description="Number of matching interactions")
+    limit: int = Field(..., description="Page size")
+    offset: int = Field(..., description="Number of interactions skipped")
+    interactions: List[ConditionMatch] = Field(
+        ..., description="Matching interactions in this page"
+    )
+    timestamp: str = Field(..., description="ISO timestamp")
+
+
+class GraphStatusResponse(BaseModel):
+    """Response model for the served interaction graph version."""
+
+    version: Optional[int] = Field(None, description="Graph version being served")
+    loaded_at: Optional[str] = Field(
+        None, description="ISO timestamp when this version was swapped in"
+    )
+    load_seconds: Optional[float] = Field(
+        None, description="Time it took to build this version"
+    )
+    drugs: Optional[int] = Field(None, description="Number of drugs in this version")
+    interactions: Optional[int] = Field(
+        None, description="Number of interactions in this version"
+    )
+    reloading: bool = Field(..., description="Whether a reload is in progress")
+    last_error: Optional[str] = Field(
+        None, description="Error from the last failed reload, if any"
+    )
+
+
+class GraphReloadResponse(BaseModel):
+    """Response model for a graph reload request."""
+
+    accepted: bool = Field(..., description="Whether a new reload was started")
+    message: str = Field(..., description="Status message")
+    graph: GraphStatusResponse = Field(..., description="Currently served graph")
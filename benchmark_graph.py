@@ -0,0 +1,702 @@
+"""
+Benchmarks for the DrugInteractionGraph data layer.
+
+Usage:
+    python benchmark_graph.py csv-memory --rows 200000
+    python benchmark_graph.py search-all --sizes 10000 100000 1000000
+    python benchmark_graph.py pair-lookup --edges 1000000 --pairs 1000000
+    python benchmark_graph.py connection --edges 1000000 --queries 200
+    python benchmark_graph.py suite --sizes 10000 100000 1000000 10000000 \
+        --output results.json --baseline previous.json
+"""
+
+import argparse
+import csv
+import json
+import multiprocessing
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+import igraph as ig
+import numpy as np
+
+from drug_interaction_graph import DrugInteractionGraph, _InteractionGraphBuilder
+
+
+def generate_csv(
+    filepath: str,
+    rows: int,
+    drugs: int = 2000,
+    conditions: int = 5000,
+    seed: int = 42,
+) -> str:
+    """
+    Write a synthetic interaction CSV in the TWOSIDES column layout.
+
+    Args:
+        filepath: Output path
+        rows: Number of interaction rows
+        drugs: Size of the drug vocabulary
+        conditions: Size of the condition vocabulary
+        seed: Random seed for reproducible output
+
+    Returns:
+        The output path
+    """
+    rng = random.Random(seed)
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["drug1", "drug2", "condition"])
+        for _ in range(rows):
+            writer.writerow(
+                [
+                    f"Drug{rng.randrange(drugs)}",
+                    f"Drug{rng.randrange(drugs)}",
+                    f"Condition {rng.randrange(conditions)}",
+                ]
+            )
+    return filepath
+
+
+def _load_eager(filepath: str) -> DrugInteractionGraph:
+    """Reference loader that parses every row up front, like the old code."""
+    graph = DrugInteractionGraph()
+    builder = _InteractionGraphBuilder()
+    with open(filepath, "r", encoding="utf-8") as f:
+        rows = list(csv.DictReader(f))
+    for row in rows:
+        builder.add(row["drug1"], row["drug2"], row["condition"])
+    graph._adopt(builder)
+    return graph
+
+
+def synthetic_graph(
+    edges: int, mean_degree: int = 20, seed: int = 42
+) -> DrugInteractionGraph:
+    """
+    Build a random graph with a fixed mean degree, without going through CSV.
+
+    Args:
+        edges: Approximate number of interactions
+        mean_degree: Mean number of partners per drug
+        seed: Random seed for reproducible output
+
+    Returns:
+        DrugInteractionGraph with drugs named Drug0, Drug1, ...
+    """
+    rng = random.Random(seed)
+    drugs = max(2, 2 * edges // mean_degree)
+    builder = _InteractionGraphBuilder()
+    for i in range(edges):
+        builder.add(
+            f"Drug{rng.randrange(drugs)}",
+            f"Drug{rng.randrange(drugs)}",
+            f"Condition {i % 1000}",
+        )
+    graph = DrugInteractionGraph()
+    graph._adopt(builder)
+    return graph
+
+
+def _search_all_scan(graph: DrugInteractionGraph, drug1: str, drug2: str) -> List:
+    """Reference full edge scan used by search_all_interactions before indexing."""
+    v1 = graph._name_to_vertex[graph._normalize_name(drug1)]
+    v2 = graph._name_to_vertex[graph._normalize_name(drug2)]
+    return [
+        e["condition_ids"]
+        for e in graph.graph.es
+        if e.source in (v1, v2) or e.target in (v1, v2)
+    ]
+
+
+def _time_per_call(fn: Callable[[], object], repeat: int) -> float:
+    """Return the mean wall time of fn in microseconds."""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start_time) / repeat * 1e6
+
+
+def bench_search_all(
+    sizes: Sequence[int], repeat: int = 20
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare the full edge scan with the incidence-indexed search_all_interactions.
+
+    The mean degree is fixed, so the indexed cost should stay flat as the
+    edge count grows while the scan grows linearly.
+
+    Args:
+        sizes: Edge counts to test
+        repeat: Calls per measurement
+
+    Returns:
+        Measurements keyed by graph size
+    """
+    results = {}
+    for size in sizes:
+        graph = synthetic_graph(size)
+        drug1, drug2 = "Drug0", "Drug1"
+        degree_sum = len(graph.get_all_interactions_for_drug(drug1)) + len(
+            graph.get_all_interactions_for_drug(drug2)
+        )
+        results[f"E={graph.get_stats()['interactions']:,}"] = {
+            "deg_sum": degree_sum,
+            "scan_us": _time_per_call(
+                lambda: _search_all_scan(graph, drug1, drug2), max(1, repeat // 10)
+            ),
+            "indexed_us": _time_per_call(
+                lambda: graph.search_all_interactions(drug1, drug2), repeat
+            ),
+        }
+    return results
+
+
+def bench_pair_lookup(edges: int, pairs: int) -> Dict[str, Dict[str, float]]:
+    """
+    Compare per-pair search_interaction with the vectorized pair-key index.
+
+    Half of the query pairs are existing edges, half are random pairs.
+
+    Args:
+        edges: Approximate number of interactions in the graph
+        pairs: Number of query pairs
+
+    Returns:
+        Measurements keyed by lookup method
+    """
+    graph = synthetic_graph(edges)
+    rng = np.random.default_rng(42)
+    edge_list = np.array(graph.graph.get_edgelist(), dtype=np.int64)
+    picked = edge_list[rng.integers(0, len(edge_list), pairs // 2)]
+    random_pairs = rng.integers(0, graph.graph.vcount(), (pairs - len(picked), 2))
+    queries = np.concatenate([picked, random_pairs])
+    names = graph.graph.vs["name"]
+    drugs1 = [names[v] for v in queries[:, 0].tolist()]
+    drugs2 = [names[v] for v in queries[:, 1].tolist()]
+
+    start_time = time.perf_counter()
+    index = graph.build_pair_index()
+    build_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    found = index.lookup(graph.vertex_ids(drugs1), graph.vertex_ids(drugs2))
+    batch_seconds = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    index.lookup(queries[:, 0], queries[:, 1])
+    ids_seconds = time.perf_counter() - start_time
+
+    sample = min(pairs, 100_000)
+    start_time = time.perf_counter()
+    for drug1, drug2 in zip(drugs1[:sample], drugs2[:sample]):
+        graph.search_interaction(drug1, drug2)
+    loop_seconds = (time.perf_counter() - start_time) * pairs / sample
+
+    return {
+        "search_interaction": {
+            "seconds": loop_seconds,
+            "mpairs_s": pairs / loop_seconds / 1e6,
+        },
+        "index_from_names": {
+            "seconds": batch_seconds,
+            "mpairs_s": pairs / batch_seconds / 1e6,
+        },
+        "index_from_ids": {
+            "seconds": ids_seconds,
+            "mpairs_s": pairs / ids_seconds / 1e6,
+            "build_s": build_seconds,
+            "hits": float((found >= 0).sum()),
+        },
+    }
+
+
+def scale_free_graph(edges: int, seed: int = 42) -> DrugInteractionGraph:
+    """
+    Build a preferential-attachment graph, whose hub drugs have thousands of
+    partners like the most-prescribed drugs in TWOSIDES.
+
+    Args:
+        edges: Approximate number of interactions
+        seed: Random seed for reproducible output
+
+    Returns:
+        DrugInteractionGraph with drugs named Drug0, Drug1, ...
+    """
+    random.seed(seed)
+    g = ig.Graph.Barabasi(max(2, edges // 10), 10)
+    g.simplify()
+    builder = _InteractionGraphBuilder()
+    for i, (v1, v2) in enumerate(g.get_edgelist()):
+        builder.add(f"Drug{v1}", f"Drug{v2}", f"Condition {i % 1000}")
+    graph = DrugInteractionGraph()
+    graph._adopt(builder)
+    return graph
+
+
+def bench_connection(edges: int, queries: int) -> Dict[str, Dict[str, float]]:
+    """
+    Measure find_indirect_interactions latency on hub and random drug pairs.
+
+    Args:
+        edges: Approximate number of interactions in the graph
+        queries: Number of random pairs (hub pairs use the 20 largest hubs)
+
+    Returns:
+        Latency percentiles in milliseconds keyed by engine and pair kind
+    """
+    graph = scale_free_graph(edges)
+    engine = graph.freeze()
+    names = graph.graph.vs["name"]
+    degrees = np.array(graph.graph.degree())
+    hubs = np.argsort(-degrees)[:20].tolist()
+    rng = random.Random(42)
+    pair_sets = {
+        "hub_pairs": [(hubs[i], hubs[j]) for i in range(20) for j in range(i)],
+        "hub_to_random": [
+            (hubs[i % 20], rng.randrange(len(names))) for i in range(queries)
+        ],
+        "random_pairs": [
+            (rng.randrange(len(names)), rng.randrange(len(names)))
+            for _ in range(queries)
+        ],
+    }
+
+    results = {}
+    for label, target in (("graph", graph), ("engine", engine)):
+        for kind, pairs in pair_sets.items():
+            timings = []
+            truncated = 0
+            for v1, v2 in pairs:
+                connection = target.find_indirect_interactions(
+                    names[v1], names[v2], max_depth=4
+                )
+                timings.append(connection["elapsed_ms"])
+                truncated += connection["truncated"]
+            results[f"{label}_{kind}"] = {
+                "p50_ms": float(np.percentile(timings, 50)),
+                "p99_ms": float(np.percentile(timings, 99)),
+                "max_ms": max(timings),
+                "truncated": float(truncated),
+            }
+    results["graph_hub_pairs"]["max_degree"] = float(degrees.max())
+    return results
+
+
+def _measure(load: Callable[[], object]) -> Dict[str, float]:
+    """Run a loader under tracemalloc and return its time and peak memory."""
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    load()
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"seconds": elapsed, "peak_mb": peak / 1e6}
+
+
+def bench_csv_memory(filepath: str, chunk_size: int) -> Dict[str, Dict[str, float]]:
+    """
+    Compare peak Python heap usage of eager and streaming CSV ingestion.
+
+    Args:
+        filepath: CSV file to load
+        chunk_size: Rows per chunk for the streaming loader
+
+    Returns:
+        Measurements keyed by loader name
+    """
+    return {
+        "eager_list": _measure(lambda: _load_eager(filepath)),
+        "streaming": _measure(
+            lambda: DrugInteractionGraph().load_from_csv(
+                filepath, chunk_size=chunk_size
+            )
+        ),
+    }
+
+
+def _print_results(title: str, results: Dict[str, Dict[str, float]]) -> None:
+    """Print benchmark results as an aligned table."""
+    print(title)
+    print("-" * 70)
+    for name, metrics in results.items():
+        cells = "  ".join(f"{key}={value:,.3f}" for key, value in metrics.items())
+        print(f"  {name:20s} {cells}")
+    print()
+
+
+# Power-law exponent of the drug degree distribution in suite datasets
+SUITE_DEGREE_EXPONENT = 2.5
+
+# Default sizes of the benchmark suite, in distinct interactions
+SUITE_SIZES = [10_000, 100_000, 1_000_000, 10_000_000]
+
+
+def generate_twosides_csv(
+    filepath: str,
+    edges: int,
+    mean_degree: int = 20,
+    conditions: int = 10_000,
+    conditions_per_pair: float = 3.0,
+    seed: int = 42,
+) -> Dict[str, int]:
+    """
+    Write a synthetic CSV shaped like TWOSIDES: skewed degrees, repeated conditions.
+
+    Drug pairs are drawn with a Chung-Lu model, i.e. each endpoint with
+    probability proportional to a power-law weight, so a few hub drugs have
+    a large share of all partners. Every pair gets a geometric number of
+    rows (one per condition), with conditions drawn from a Zipf distribution
+    so the common ones repeat across many pairs. Rows of a pair are
+    consecutive, as in the TWOSIDES export.
+
+    Args:
+        filepath: Output path
+        edges: Number of distinct interactions (drug pairs)
+        mean_degree: Mean number of partners per drug
+        conditions: Size of the condition vocabulary
+        conditions_per_pair: Mean rows per pair
+        seed: Random seed for reproducible output
+
+    Returns:
+        Dictionary with 'drugs', 'interactions' and 'rows' counts
+    """
+    rng = np.random.default_rng(seed)
+    drugs = max(10, 2 * edges // mean_degree)
+
+    # Expected degrees follow the power law, capped so hubs do not saturate
+    weights = np.arange(1, drugs + 1, dtype=np.float64) ** (
+        -1 / (SUITE_DEGREE_EXPONENT - 1)
+    )
+    weights = np.minimum(weights / weights.sum() * 2 * edges, drugs / 4)
+    weights /= weights.sum()
+
+    keys = np.zeros(0, dtype=np.int64)
+    for _ in range(20):
+        needed = edges - len(keys)
+        if needed <= 0:
+            break
+        count = int(needed * 1.1) + 16
+        drug1 = rng.choice(drugs, count, p=weights)
+        drug2 = rng.choice(drugs, count, p=weights)
+        keep = drug1 != drug2
+        low = np.minimum(drug1[keep], drug2[keep])
+        high = np.maximum(drug1[keep], drug2[keep])
+        keys = np.unique(np.concatenate([keys, low * drugs + high]))
+    keys = rng.permutation(keys)[:edges]
+    swap = rng.random(len(keys)) < 0.5
+    pairs = np.stack([keys // drugs, keys % drugs], axis=1)
+    pairs[swap] = pairs[swap, ::-1]
+
+    condition_weights = 1 / np.arange(1, conditions + 1, dtype=np.float64)
+    condition_weights /= condition_weights.sum()
+    drug_names = [f"Drug{i}" for i in range(drugs)]
+    condition_names = [f"Condition {i}" for i in range(conditions)]
+
+    rows = 0
+    with open(filepath, "w", newline="", encoding="utf-8") as f:
+        f.write("drug1,drug2,condition\n")
+        for start in range(0, len(pairs), 1_000_000):
+            chunk = pairs[start : start + 1_000_000]
+            repeats = rng.geometric(1 / conditions_per_pair, len(chunk))
+            drug1 = np.repeat(chunk[:, 0], repeats).tolist()
+            drug2 = np.repeat(chunk[:, 1], repeats).tolist()
+            condition_ids = rng.choice(
+                conditions, len(drug1), p=condition_weights
+            ).tolist()
+            f.write(
+                "".join(
+                    f"{drug_names[a]},{drug_names[b]},{condition_names[c]}\n"
+                    for a, b, c in zip(drug1, drug2, condition_ids)
+                )
+            )
+            rows += len(drug1)
+    return {"drugs": drugs, "interactions": len(pairs), "rows": rows}
+
+
+def _max_rss_mb() -> Optional[float]:
+    """Return the peak resident set size of this process in MB (None if unknown)."""
+    # ru_maxrss survives fork+exec on Linux, so a spawned worker would report
+    # its parent's peak; VmHWM belongs to the current address space only
+    try:
+        with open("/proc/self/status", "r", encoding="ascii") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1e3
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / 1e6 if sys.platform == "darwin" else peak / 1e3
+
+
+def _latency(fn: Callable[..., object], calls: Sequence[tuple]) -> Dict[str, float]:
+    """Call fn once per argument tuple and return latency percentiles in microseconds."""
+    timings = []
+    for args in calls:
+        start_time = time.perf_counter()
+        fn(*args)
+        timings.append((time.perf_counter() - start_time) * 1e6)
+    return {
+        "p50_us": float(np.percentile(timings, 50)),
+        "p99_us": float(np.percentile(timings, 99)),
+        "max_us": max(timings),
+    }
+
+
+def _run_suite_size(filepath: str, queries: int, seed: int) -> Dict[str, Any]:
+    """
+    Measure one suite dataset; runs in a fresh process so peak RSS is its own.
+
+    Args:
+        filepath: Generated CSV file
+        queries: Number of timed calls per query method
+        seed: Random seed for the query sample
+
+    Returns:
+        Measurements of load, snapshot and query performance
+    """
+    rss_base = _max_rss_mb()
+    graph = DrugInteractionGraph()
+    start_time = time.perf_counter()
+    graph.load_from_csv(filepath)
+    load_seconds = time.perf_counter() - start_time
+    rss_peak = _max_rss_mb()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        snapshot_path = os.path.join(tmpdir, "graph.snapshot")
+        start_time = time.perf_counter()
+        snapshot_bytes = graph.save_snapshot(snapshot_path)
+        save_seconds = time.perf_counter() - start_time
+        start_time = time.perf_counter()
+        DrugInteractionGraph().load_snapshot(snapshot_path)
+        snapshot_load_seconds = time.perf_counter() - start_time
+
+    # Half existing interactions, half random (mostly absent) pairs
+    rng = random.Random(seed)
+    names = graph.graph.vs["name"]
+    edge_count = graph.graph.ecount()
+    pairs = [
+        tuple(names[v] for v in graph.graph.es[rng.randrange(edge_count)].tuple)
+        for _ in range(queries // 2)
+    ]
+    pairs += [
+        (rng.choice(names), rng.choice(names)) for _ in range(queries - len(pairs))
+    ]
+    drugs = [(rng.choice(names),) for _ in range(queries)]
+
+    # Warm up lazily built lookup structures before timing
+    graph.search_interaction(*pairs[0])
+    graph.get_all_interactions_for_drug(drugs[0][0])
+
+    return {
+        "drugs": graph.graph.vcount(),
+        "interactions": edge_count,
+        "max_degree": max(graph.graph.degree()),
+        "load_s": load_seconds,
+        "rss_base_mb": rss_base,
+        "rss_peak_mb": rss_peak,
+        "snapshot_bytes": snapshot_bytes,
+        "snapshot_save_s": save_seconds,
+        "snapshot_load_s": snapshot_load_seconds,
+        "search_interaction": _latency(graph.search_interaction, pairs),
+        "get_all_interactions_for_drug": _latency(
+            graph.get_all_interactions_for_drug, drugs
+        ),
+    }
+
+
+def bench_suite(
+    sizes: Sequence[int],
+    queries: int = 1000,
+    conditions_per_pair: float = 3.0,
+    seed: int = 42,
+) -> Dict[str, Any]:
+    """
+    Run the data-layer benchmark suite over synthetic datasets.
+
+    For each size a TWOSIDES-like CSV is generated (see
+    generate_twosides_csv) and measured by _run_suite_size in a new
+    interpreter, so peak RSS reflects that load alone.
+
+    Args:
+        sizes: Numbers of distinct interactions to test
+        queries: Number of timed calls per query method
+        conditions_per_pair: Mean CSV rows per interaction
+        seed: Random seed for data and queries
+
+    Returns:
+        Dictionary with 'environment' and per-size 'results'
+    """
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for size in sizes:
+            filepath = os.path.join(tmpdir, f"interactions_{size}.csv")
+            start_time = time.perf_counter()
+            dataset = generate_twosides_csv(
+                filepath, size, conditions_per_pair=conditions_per_pair, seed=seed
+            )
+            print(
+                f"Generated {dataset['rows']:,} rows for {size:,} interactions "
+                f"in {time.perf_counter() - start_time:.1f}s"
+            )
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+                measured = pool.submit(_run_suite_size, filepath, queries, seed)
+                result = measured.result()
+            result.update(
+                size=size,
+                rows=dataset["rows"],
+                csv_mb=os.path.getsize(filepath) / 1e6,
+                rows_per_s=dataset["rows"] / result["load_s"],
+            )
+            os.remove(filepath)
+            results.append(result)
+    return {
+        "environment": {
+            "python": platform.python_version(),
+            "igraph": ig.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "queries": queries,
+            "conditions_per_pair": conditions_per_pair,
+            "seed": seed,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": results,
+    }
+
+
+def _suite_table(report: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
+    """Flatten suite results into the rows printed by _print_results."""
+    table = {}
+    for result in report["results"]:
+        table[f"E={result['size']:,}"] = {
+            "load_s": result["load_s"],
+            "rss_mb": result["rss_peak_mb"] or 0.0,
+            "snapshot_mb": result["snapshot_bytes"] / 1e6,
+            "search_p50_us": result["search_interaction"]["p50_us"],
+            "search_p99_us": result["search_interaction"]["p99_us"],
+            "drug_p50_us": result["get_all_interactions_for_drug"]["p50_us"],
+            "drug_p99_us": result["get_all_interactions_for_drug"]["p99_us"],
+        }
+    return table
+
+
+def compare_suite(
+    report: Dict[str, Any], baseline: Dict[str, Any]
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compare suite results with an earlier run of the same sizes.
+
+    Args:
+        report: Current bench_suite output
+        baseline: Earlier bench_suite output (e.g. loaded from JSON)
+
+    Returns:
+        Ratios of current to baseline values (above 1 is slower or larger),
+        keyed by size; sizes missing from the baseline are skipped
+    """
+    current = _suite_table(report)
+    previous = _suite_table(baseline)
+    return {
+        size: {
+            key: value / previous[size][key] if previous[size][key] else 0.0
+            for key, value in metrics.items()
+        }
+        for size, metrics in current.items()
+        if size in previous
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    csv_memory = subparsers.add_parser(
+        "csv-memory", help="Peak memory of eager vs streaming CSV ingestion"
+    )
+    csv_memory.add_argument("--rows", type=int, default=200_000)
+    csv_memory.add_argument("--chunk-size", type=int, default=10_000)
+    csv_memory.add_argument("--csv", help="Existing CSV file to load instead")
+
+    search_all = subparsers.add_parser(
+        "search-all", help="Edge-scan vs indexed search_all_interactions"
+    )
+    search_all.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000]
+    )
+    search_all.add_argument("--repeat", type=int, default=20)
+
+    pair_lookup = subparsers.add_parser(
+        "pair-lookup", help="Per-pair search_interaction vs batch pair-key index"
+    )
+    pair_lookup.add_argument("--edges", type=int, default=1_000_000)
+    pair_lookup.add_argument("--pairs", type=int, default=1_000_000)
+
+    connection = subparsers.add_parser(
+        "connection", help="Latency of bounded indirect-interaction queries"
+    )
+    connection.add_argument("--edges", type=int, default=1_000_000)
+    connection.add_argument("--queries", type=int, default=200)
+
+    suite = subparsers.add_parser(
+        "suite", help="Load, memory, snapshot and query latency on synthetic data"
+    )
+    suite.add_argument("--sizes", type=int, nargs="+", default=SUITE_SIZES)
+    suite.add_argument("--queries", type=int, default=1000)
+    suite.add_argument("--conditions-per-pair", type=float, default=3.0)
+    suite.add_argument("--seed", type=int, default=42)
+    suite.add_argument("--output", default="benchmark_results.json")
+    suite.add_argument("--baseline", help="Earlier --output file to compare with")
+
+    args = parser.parse_args()
+
+    if args.command == "csv-memory":
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filepath = args.csv or generate_csv(
+                os.path.join(tmpdir, "interactions.csv"), args.rows
+            )
+            size_mb = os.path.getsize(filepath) / 1e6
+            results = bench_csv_memory(filepath, args.chunk_size)
+            _print_results(f"CSV ingestion ({size_mb:.1f} MB)", results)
+    elif args.command == "search-all":
+        results = bench_search_all(args.sizes, args.repeat)
+        _print_results("search_all_interactions (mean degree 20)", results)
+    elif args.command == "pair-lookup":
+        results = bench_pair_lookup(args.edges, args.pairs)
+        _print_results(f"Batch pair lookup ({args.pairs:,} pairs)", results)
+    elif args.command == "connection":
+        results = bench_connection(args.edges, args.queries)
+        _print_results("find_indirect_interactions (scale-free, depth 4)", results)
+    elif args.command == "suite":
+        report = bench_suite(
+            args.sizes, args.queries, args.conditions_per_pair, args.seed
+        )
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        _print_results("Data-layer suite (skewed synthetic data)", _suite_table(report))
+        print(f"Results written to {args.output}")
+        if args.baseline:
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+            _print_results(f"Ratio to {args.baseline}", compare_suite(report, baseline))
+
+
+if __name__ == "__main__":
+    main()
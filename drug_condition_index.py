@@ -0,0 +1,278 @@
+"""
+Inverted index from condition words to the interactions that report them.
+
+Answers "which drug pairs cause QT prolongation?" without scanning the
+conditions of every edge. Each distinct condition string is split into
+lowercase alphanumeric tokens once, and two sets of CSR arrays link tokens
+to conditions and conditions to edges:
+
+- tokens: sorted token vocabulary
+- token_condition_offsets: int64 (T + 1); the conditions of token t are
+  token_condition_ids[token_condition_offsets[t]:token_condition_offsets[t + 1]]
+- token_condition_ids: int64; condition IDs, sorted within each token
+- condition_offsets: int64 (C + 1); the edges reporting condition c are
+  condition_edges[condition_offsets[c]:condition_offsets[c + 1]]
+- condition_edges: int64; edge IDs, sorted within each condition
+
+Query syntax: words in a group must all occur in one condition (AND, by
+intersecting the groups' condition posting lists), so "lactic acidosis"
+does not match a pair reporting "lactic acid increased" and "metabolic
+acidosis"; groups separated by "OR" are combined by union. A trailing "*"
+matches every token with that prefix, e.g. "qt prolong*" or
+"lactic acidosis OR hepatic failure". Matching conditions are then mapped
+to their edges.
+"""
+
+import re
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_QUERY_TERM = re.compile(r"[a-z0-9]+\*?")
+_OR = re.compile(r"\s+or\s+|\|", re.IGNORECASE)
+
+
+def tokenize_condition(text: str) -> List[str]:
+    """
+    Split a condition into normalized tokens.
+
+    Args:
+        text: Condition string, e.g. "Electrocardiogram QT prolonged"
+
+    Returns:
+        Lowercase alphanumeric tokens in order of appearance
+    """
+    return _TOKEN.findall(text.lower())
+
+
+def parse_condition_query(query: str) -> List[List[str]]:
+    """
+    Parse a condition query into OR-groups of AND-terms.
+
+    Args:
+        query: e.g. "qt prolong* OR torsade*"
+
+    Returns:
+        List of groups, each a list of terms (tokens, optionally ending in
+        "*"); empty groups are dropped
+    """
+    groups = [_QUERY_TERM.findall(part.lower()) for part in _OR.split(query)]
+    return [group for group in groups if group]
+
+
+def intersect_sorted(small: np.ndarray, large: np.ndarray) -> np.ndarray:
+    """
+    Intersect two sorted, distinct arrays by binary search into the larger.
+
+    Args:
+        small: Sorted distinct values (the shorter array)
+        large: Sorted distinct values
+
+    Returns:
+        Values of small that occur in large
+    """
+    if not len(large):
+        return large
+    positions = np.searchsorted(large, small)
+    positions[positions == len(large)] = 0
+    return small[large[positions] == small]
+
+
+def sorted_unique(values: np.ndarray) -> np.ndarray:
+    """
+    Sort values and drop duplicates.
+
+    Equivalent to np.unique, but always a plain sort, which is several
+    times faster than NumPy 2's hash-based unique on large integer arrays.
+
+    Args:
+        values: Integer values
+
+    Returns:
+        Sorted distinct values
+    """
+    values = np.sort(values)
+    if len(values) < 2:
+        return values
+    keep = np.empty(len(values), dtype=bool)
+    keep[0] = True
+    np.not_equal(values[1:], values[:-1], out=keep[1:])
+    return values[keep]
+
+
+def _gather(offsets: np.ndarray, values: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """Concatenate the CSR slices values[offsets[r]:offsets[r + 1]] of rows."""
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    owners = np.repeat(np.arange(len(rows)), lengths)
+    positions = (
+        starts[owners] + np.arange(owners.size) - (np.cumsum(lengths) - lengths)[owners]
+    )
+    return values[positions]
+
+
+class ConditionIndex:
+    """Token to condition and condition to edge lists over a graph's conditions."""
+
+    def __init__(
+        self,
+        conditions: Sequence[str],
+        edge_condition_offsets: np.ndarray,
+        edge_condition_ids: np.ndarray,
+    ):
+        """
+        Build the posting lists.
+
+        Each distinct condition is tokenized once, and its edges are found
+        by grouping the per-edge condition IDs with one sort.
+
+        Args:
+            conditions: Condition vocabulary, indexed by condition ID
+            edge_condition_offsets: int64 (E + 1) offsets into
+                edge_condition_ids
+            edge_condition_ids: Condition IDs of all edges
+        """
+        token_ids: Dict[str, int] = {}
+        pair_tokens: List[int] = []
+        pair_conditions: List[int] = []
+        for condition_id, text in enumerate(conditions):
+            for token in set(tokenize_condition(text)):
+                pair_tokens.append(token_ids.setdefault(token, len(token_ids)))
+                pair_conditions.append(condition_id)
+
+        # Renumber tokens in sorted order so prefixes are contiguous ranges
+        self.tokens = sorted(token_ids)
+        rank = np.empty(len(token_ids), dtype=np.int64)
+        rank[[token_ids[token] for token in self.tokens]] = np.arange(len(rank))
+        pair_tokens = rank[np.array(pair_tokens, dtype=np.int64)]
+        pair_conditions = np.array(pair_conditions, dtype=np.int64)
+
+        # Token -> condition IDs; conditions were enumerated in ascending
+        # order, so a stable sort keeps each token's list sorted
+        order = np.argsort(pair_tokens, kind="stable")
+        self.token_condition_ids = pair_conditions[order]
+        self.token_condition_offsets = np.searchsorted(
+            pair_tokens[order], np.arange(len(self.tokens) + 1)
+        ).astype(np.int64)
+
+        # Condition ID -> its edges, ascending
+        edge_condition_offsets = np.asarray(edge_condition_offsets, dtype=np.int64)
+        edge_condition_ids = np.asarray(edge_condition_ids, dtype=np.int64)
+        entry_edges = np.repeat(
+            np.arange(len(edge_condition_offsets) - 1, dtype=np.int64),
+            np.diff(edge_condition_offsets),
+        )
+        order = np.argsort(edge_condition_ids, kind="stable")
+        self.condition_edges = entry_edges[order]
+        self.condition_offsets = np.zeros(len(conditions) + 1, dtype=np.int64)
+        np.cumsum(
+            np.bincount(edge_condition_ids, minlength=len(conditions)),
+            out=self.condition_offsets[1:],
+        )
+
+        self.condition_count = len(conditions)
+        self.edge_count = len(edge_condition_offsets) - 1
+
+    def _token_range(self, term: str) -> Tuple[int, int]:
+        """Return the range of token IDs a query term matches."""
+        if term.endswith("*"):
+            prefix = term[:-1]
+            return (
+                bisect_left(self.tokens, prefix),
+                bisect_left(self.tokens, prefix + "\uffff"),
+            )
+        start = bisect_left(self.tokens, term)
+        if start < len(self.tokens) and self.tokens[start] == term:
+            return start, start + 1
+        return start, start
+
+    def postings(self, term: str) -> np.ndarray:
+        """
+        Get the sorted IDs of the conditions containing one query term.
+
+        Args:
+            term: Token, or prefix ending in "*"
+
+        Returns:
+            Sorted, distinct int64 condition IDs
+        """
+        first, last = self._token_range(term)
+        start = self.token_condition_offsets.item(first)
+        end = self.token_condition_offsets.item(last)
+        condition_ids = self.token_condition_ids[start:end]
+        if last - first <= 1:
+            return condition_ids
+        return self._union(condition_ids, self.condition_count)
+
+    @staticmethod
+    def _union(ids: np.ndarray, size: int) -> np.ndarray:
+        """Sort and deduplicate IDs below size, with a bitmap when they are many."""
+        if len(ids) * 16 < size:
+            return sorted_unique(ids)
+        mask = np.zeros(size, dtype=bool)
+        mask[ids] = True
+        return np.flatnonzero(mask)
+
+    def matching_condition_ids(self, query: str) -> np.ndarray:
+        """
+        Find the conditions that contain every term of some group of a query.
+
+        Within a group, the shortest posting list is probed against the
+        others by binary search, so the cost is O(r log n) for a rarest term
+        in r conditions rather than proportional to the common terms.
+
+        Args:
+            query: Condition query (see module docstring)
+
+        Returns:
+            Sorted, distinct int64 condition IDs
+        """
+        matches = []
+        for group in parse_condition_query(query):
+            lists = sorted((self.postings(term) for term in group), key=len)
+            result = lists[0]
+            for postings in lists[1:]:
+                if not len(result):
+                    break
+                result = intersect_sorted(result, postings)
+            matches.append(result)
+        if not matches:
+            return np.zeros(0, dtype=np.int64)
+        if len(matches) == 1:
+            return matches[0]
+        return self._union(np.concatenate(matches), self.condition_count)
+
+    def edges_of_conditions(self, condition_ids: np.ndarray) -> np.ndarray:
+        """
+        Get the edges reporting any of some conditions.
+
+        Args:
+            condition_ids: Condition IDs
+
+        Returns:
+            Sorted, distinct int32 edge IDs
+        """
+        condition_ids = np.asarray(condition_ids, dtype=np.int64)
+        edge_ids = _gather(self.condition_offsets, self.condition_edges, condition_ids)
+        if len(condition_ids) > 1:
+            # Each condition's edges are sorted; several overlap
+            edge_ids = self._union(edge_ids, self.edge_count)
+        return edge_ids.astype(np.int32)
+
+    def search(self, query: str) -> np.ndarray:
+        """
+        Find the edges with a condition matching a condition query.
+
+        Args:
+            query: Condition query (see module docstring)
+
+        Returns:
+            Sorted, distinct int32 edge IDs
+        """
+        return self.edges_of_conditions(self.matching_condition_ids(query))
+
+    def __len__(self) -> int:
+        """Return the number of distinct tokens."""
+        return len(self.tokens)
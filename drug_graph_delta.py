@@ -0,0 +1,240 @@
+"""
+Append-only delta log for incremental DrugInteractionGraph updates.
+
+Each line of the log is one JSON record:
+
+    {"op": "add", "drug1": "Warfarin", "drug2": "Aspirin", "conditions": ["bleeding"]}
+
+Operations:
+
+- add: add the conditions to the pair, creating the interaction if needed
+- update: replace the pair's conditions with the given list
+- remove: remove the given conditions from the pair, or the whole
+  interaction when no conditions are given
+
+All three operations are idempotent, so replaying a log on a graph that
+already contains some of its records gives the same result. That makes
+compaction (save a snapshot, then drop the applied records) safe to
+interrupt at any point.
+
+Usage:
+    python drug_graph_delta.py compact --snapshot drug_interactions.snap \
+        --log drug_interactions.delta.ndjson
+"""
+
+import argparse
+import json
+import os
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+DELTA_OPS = ("add", "update", "remove")
+
+
+class DeltaLogError(ValueError):
+    """Raised when a delta record or log line is malformed."""
+
+
+class DeltaRecord:
+    """A single add/update/remove operation on one drug pair."""
+
+    __slots__ = ("op", "drug1", "drug2", "conditions")
+
+    def __init__(
+        self,
+        op: str,
+        drug1: str,
+        drug2: str,
+        conditions: Optional[Sequence[str]] = None,
+    ):
+        """
+        Initialize a delta record.
+
+        Args:
+            op: One of 'add', 'update' or 'remove'
+            drug1: First drug name
+            drug2: Second drug name
+            conditions: Conditions the operation applies to
+
+        Raises:
+            DeltaLogError: If the operation or drug names are invalid
+        """
+        if op not in DELTA_OPS:
+            raise DeltaLogError(f"Unknown delta operation '{op}'")
+        if not drug1 or not drug2:
+            raise DeltaLogError("Delta records need both drug1 and drug2")
+        self.op = op
+        self.drug1 = drug1
+        self.drug2 = drug2
+        self.conditions = [c for c in (conditions or []) if c]
+
+    def to_json(self) -> str:
+        """Serialize the record as one log line (without the newline)."""
+        record = {"op": self.op, "drug1": self.drug1, "drug2": self.drug2}
+        if self.conditions:
+            record["conditions"] = self.conditions
+        return json.dumps(record, ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, line: str) -> "DeltaRecord":
+        """
+        Parse a log line.
+
+        A single 'condition' string is accepted as well as a 'conditions' list.
+
+        Args:
+            line: JSON object text
+
+        Returns:
+            Parsed DeltaRecord
+
+        Raises:
+            DeltaLogError: If the line is not a valid record
+        """
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            raise DeltaLogError(f"Invalid JSON in delta record: {e}")
+        if not isinstance(data, dict):
+            raise DeltaLogError("Delta records must be JSON objects")
+
+        conditions = data.get("conditions")
+        if conditions is None and data.get("condition"):
+            conditions = [data["condition"]]
+        return cls(data.get("op"), data.get("drug1"), data.get("drug2"), conditions)
+
+    def __eq__(self, other) -> bool:
+        """Compare records field by field."""
+        return isinstance(other, DeltaRecord) and self.to_json() == other.to_json()
+
+    def __repr__(self) -> str:
+        """Debug representation of the record."""
+        return f"DeltaRecord({self.to_json()})"
+
+
+class DeltaLog:
+    """
+    Newline-delimited JSON log of DeltaRecords.
+
+    Records are only ever appended. Readers stop at a trailing line without
+    a newline, so a record that is still being written (or was cut off by a
+    crash) is never applied half-way.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Initialize the log.
+
+        Args:
+            filepath: Path to the log file (created on first append)
+        """
+        self.filepath = filepath
+
+    def append(self, records: Sequence[DeltaRecord]) -> int:
+        """
+        Append records and flush them to disk.
+
+        Args:
+            records: Records to append, in order
+
+        Returns:
+            Byte offset of the end of the log after the append
+        """
+        data = "".join(record.to_json() + "\n" for record in records)
+        with open(self.filepath, "ab") as f:
+            f.write(data.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+            return f.tell()
+
+    def iter_records(self, offset: int = 0) -> Iterator[Tuple[DeltaRecord, int]]:
+        """
+        Iterate over complete records starting at a byte offset.
+
+        Args:
+            offset: Byte offset to start reading from
+
+        Yields:
+            Tuples of (record, byte offset just past the record)
+
+        Raises:
+            DeltaLogError: If a complete line is not a valid record
+        """
+        if not os.path.exists(self.filepath):
+            return
+        with open(self.filepath, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Incomplete trailing record
+                start, offset = offset, offset + len(line)
+                text = line.decode("utf-8").strip()
+                if not text:
+                    continue
+                try:
+                    record = DeltaRecord.from_json(text)
+                except DeltaLogError as e:
+                    raise DeltaLogError(f"{self.filepath} at byte {start}: {e}")
+                yield record, offset
+
+    def read(self, offset: int = 0) -> Tuple[List[DeltaRecord], int]:
+        """
+        Read all complete records starting at a byte offset.
+
+        Args:
+            offset: Byte offset to start reading from
+
+        Returns:
+            Tuple of (records, byte offset just past the last complete record)
+        """
+        records = []
+        for record, end in self.iter_records(offset):
+            records.append(record)
+            offset = end
+        return records, offset
+
+    def discard_before(self, offset: int) -> None:
+        """
+        Drop the records before a byte offset, keeping anything appended later.
+
+        The remaining tail is written to a new file that replaces the log
+        atomically. Writers must not append while this runs.
+
+        Args:
+            offset: Byte offset returned by read()
+        """
+        if not os.path.exists(self.filepath):
+            return
+        tmp_path = f"{self.filepath}.tmp"
+        with open(self.filepath, "rb") as src, open(tmp_path, "wb") as dst:
+            src.seek(offset)
+            dst.write(src.read())
+            dst.flush()
+            os.fsync(dst.fileno())
+        os.replace(tmp_path, self.filepath)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Fold a delta log into a new graph snapshot"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    compact = subparsers.add_parser(
+        "compact", help="Apply the log and rewrite the snapshot"
+    )
+    compact.add_argument("--snapshot", required=True, help="Base snapshot")
+    compact.add_argument("--log", required=True, help="Delta log to fold in")
+    compact.add_argument(
+        "--output", help="Snapshot to write (defaults to replacing --snapshot)"
+    )
+    args = parser.parse_args()
+
+    # Imported here because drug_interaction_graph imports this module
+    from drug_interaction_graph import DrugInteractionGraph
+
+    graph = DrugInteractionGraph(args.snapshot)
+    count = graph.compact_delta_log(args.log, args.output or args.snapshot)
+    print(f"Compacted {count} record(s): {graph}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,695 @@
+"""
+Read-only query engine for drug interaction data.
+
+FrozenDrugGraph keeps the interaction graph as compressed sparse row (CSR)
+adjacency arrays plus an interned condition table, and answers the same
+read queries as DrugInteractionGraph without touching igraph objects.
+"""
+
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from drug_condition_index import ConditionIndex
+from drug_graph_snapshot import GraphSnapshot, pack_condition_ids, read_snapshot
+from drug_graph_stats import DEFAULT_TOP_K, GraphStatistics
+from drug_graph_traversal import (
+    DEFAULT_MAX_FANOUT,
+    DEFAULT_PATH_DEPTH,
+    DEFAULT_TIME_BUDGET,
+    find_connection,
+    name_connection,
+)
+
+# Joins the conditions of one interaction into a single display string
+CONDITION_SEPARATOR = "; "
+
+
+def ragged_gather(
+    offsets: np.ndarray, values: np.ndarray, rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gather several rows of a ragged (offsets + values) array at once.
+
+    Args:
+        offsets: Row offsets into values, shape (R + 1,)
+        values: Flat row contents
+        rows: Row indexes to gather
+
+    Returns:
+        Tuple of (concatenated row values, position in rows of each value)
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    starts = offsets[rows]
+    lengths = offsets[rows + 1] - starts
+    owners = np.repeat(np.arange(len(rows)), lengths)
+    # Position of each value = its row start + its rank within the row
+    row_begin = np.cumsum(lengths) - lengths
+    positions = starts[owners] + np.arange(owners.size) - row_begin[owners]
+    return values[positions], owners
+
+
+def pack_pair_keys(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+    """
+    Pack unordered vertex pairs into uint64 keys: min(v1, v2) << 32 | max(v1, v2).
+
+    Args:
+        v1: First vertex IDs
+        v2: Second vertex IDs
+
+    Returns:
+        uint64 array of pair keys
+    """
+    v1 = np.asarray(v1, dtype=np.int64)
+    v2 = np.asarray(v2, dtype=np.int64)
+    low = np.minimum(v1, v2).astype(np.uint64)
+    high = np.maximum(v1, v2).astype(np.uint64)
+    return (low << np.uint64(32)) | high
+
+
+class PairKeyIndex:
+    """
+    Sorted uint64 pair keys aligned with edge IDs, for batch pair lookups.
+
+    A lookup packs each query pair into the same key and finds it with
+    np.searchsorted, so millions of pairs are tested in one vectorized call
+    instead of one Python-level edge query per pair.
+    """
+
+    def __init__(self, keys: np.ndarray, edge_ids: np.ndarray):
+        """
+        Initialize the index from keys that are already sorted.
+
+        Args:
+            keys: Sorted uint64 pair keys (see pack_pair_keys)
+            edge_ids: Edge ID for each key
+        """
+        self.keys = np.ascontiguousarray(keys, dtype=np.uint64)
+        self.edge_ids = np.ascontiguousarray(edge_ids, dtype=np.int64)
+        self.keys.setflags(write=False)
+        self.edge_ids.setflags(write=False)
+
+    @classmethod
+    def from_edges(cls, edges: np.ndarray) -> "PairKeyIndex":
+        """
+        Build the index from an edge list.
+
+        Args:
+            edges: Edge endpoints, shape (E, 2); row i is edge ID i
+
+        Returns:
+            PairKeyIndex over the edges
+        """
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        keys = pack_pair_keys(edges[:, 0], edges[:, 1])
+        order = np.argsort(keys, kind="stable")
+        return cls(keys[order], order)
+
+    def lookup(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+        """
+        Find the edges between many vertex pairs at once.
+
+        Args:
+            v1: First vertex IDs (negative IDs never match)
+            v2: Second vertex IDs, same length as v1
+
+        Returns:
+            int64 array with the edge ID of each pair, or -1 if not connected
+        """
+        v1 = np.asarray(v1, dtype=np.int64)
+        v2 = np.asarray(v2, dtype=np.int64)
+        if len(self.keys) == 0:
+            return np.full(v1.shape, -1, dtype=np.int64)
+
+        keys = pack_pair_keys(v1, v2)
+        positions = np.searchsorted(self.keys, keys)
+        np.minimum(positions, len(self.keys) - 1, out=positions)
+        found = (self.keys[positions] == keys) & (np.minimum(v1, v2) >= 0)
+        return np.where(found, self.edge_ids[positions], -1)
+
+    def __len__(self) -> int:
+        """Return the number of indexed edges."""
+        return len(self.keys)
+
+
+class FrozenDrugGraph:
+    """
+    Immutable, array-backed view of a drug interaction graph.
+
+    Layout:
+    - offsets: int32 (V + 1); the neighbors of vertex v are
+      neighbors[offsets[v]:offsets[v + 1]], sorted by vertex ID
+    - neighbors: int32 (2E); neighbor vertex IDs
+    - edge_ids: int32 (2E); edge ID for each neighbor entry
+    - edge_condition_offsets: int64 (E + 1); the conditions of edge e are
+      edge_condition_ids[edge_condition_offsets[e]:edge_condition_offsets[e + 1]]
+    - edge_condition_ids: int32; indexes into the condition table
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        edges: np.ndarray,
+        conditions: Sequence[str],
+        edge_condition_offsets: np.ndarray,
+        edge_condition_ids: np.ndarray,
+    ):
+        """
+        Build the CSR arrays from an edge list.
+
+        Args:
+            names: Vertex display names, indexed by vertex ID
+            edges: Edge endpoints, shape (E, 2)
+            conditions: Interned condition strings
+            edge_condition_offsets: Offsets into edge_condition_ids, (E + 1,)
+            edge_condition_ids: Condition indexes of all edges
+        """
+        vertex_count = len(names)
+        edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+        edge_count = edges.shape[0]
+
+        # Each edge appears in the rows of both endpoints; self-loops once
+        edge_range = np.arange(edge_count, dtype=np.int32)
+        not_loop = edges[:, 0] != edges[:, 1]
+        sources = np.concatenate([edges[:, 0], edges[not_loop, 1]])
+        targets = np.concatenate([edges[:, 1], edges[not_loop, 0]])
+        edge_ids = np.concatenate([edge_range, edge_range[not_loop]])
+
+        order = np.lexsort((targets, sources))
+        offsets = np.zeros(vertex_count + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=vertex_count), out=offsets[1:])
+
+        self._attach(
+            names=list(names),
+            offsets=offsets,
+            neighbors=targets[order].astype(np.int32),
+            edge_ids=edge_ids[order].astype(np.int32),
+            conditions=list(conditions),
+            edge_condition_offsets=np.ascontiguousarray(
+                edge_condition_offsets, dtype=np.int64
+            ),
+            edge_condition_ids=np.ascontiguousarray(edge_condition_ids, dtype=np.int32),
+            name_to_vertex={name.strip().lower(): i for i, name in enumerate(names)},
+        )
+
+    def _attach(
+        self,
+        names: Sequence[str],
+        offsets: np.ndarray,
+        neighbors: np.ndarray,
+        edge_ids: np.ndarray,
+        conditions: Sequence[str],
+        edge_condition_offsets: np.ndarray,
+        edge_condition_ids: np.ndarray,
+        name_to_vertex,
+        pair_index: Optional[PairKeyIndex] = None,
+    ) -> None:
+        """
+        Adopt fully built CSR arrays and lookup tables.
+
+        Args:
+            names: Vertex display names (list or mapped string table)
+            offsets: CSR row offsets, int32 (V + 1)
+            neighbors: CSR neighbor vertex IDs, int32 (2E)
+            edge_ids: Edge ID for each neighbor entry, int32 (2E)
+            conditions: Interned condition strings (list or mapped table)
+            edge_condition_offsets: int64 (E + 1)
+            edge_condition_ids: int32 condition indexes of all edges
+            name_to_vertex: Normalized name lookup with a dict-style get()
+            pair_index: Prebuilt pair-key index (built lazily if None)
+        """
+        self.names = names
+        self.offsets = offsets
+        self.neighbors = neighbors
+        self.edge_ids = edge_ids
+        self.conditions = conditions
+        self.edge_condition_offsets = edge_condition_offsets
+        self.edge_condition_ids = edge_condition_ids
+        self._name_to_vertex = name_to_vertex
+
+        for array in (
+            self.offsets,
+            self.neighbors,
+            self.edge_ids,
+            self.edge_condition_offsets,
+            self.edge_condition_ids,
+        ):
+            array.setflags(write=False)
+        self._offsets_view = memoryview(self.offsets)
+        self._neighbors_view = memoryview(self.neighbors)
+        self._edge_ids_view = memoryview(self.edge_ids)
+        self._pair_index = pair_index
+        self._condition_index: Optional[ConditionIndex] = None
+        self._edge_keys: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_graph(cls, graph) -> "FrozenDrugGraph":
+        """
+        Build an engine from a loaded DrugInteractionGraph.
+
+        Args:
+            graph: DrugInteractionGraph instance
+
+        Returns:
+            FrozenDrugGraph with the same drugs and interactions
+        """
+        g = graph.graph
+        edges = np.array(g.get_edgelist(), dtype=np.int32).reshape(-1, 2)
+        offsets, condition_ids = pack_condition_ids(
+            g.es["condition_ids"] if g.ecount() else []
+        )
+        names = g.vs["name"] if g.vcount() else []
+        return cls(names, edges, graph._conditions, offsets, condition_ids)
+
+    @classmethod
+    def from_snapshot(cls, snapshot) -> "FrozenDrugGraph":
+        """
+        Build an engine directly from a snapshot, without creating an igraph.
+
+        Args:
+            snapshot: GraphSnapshot or path to a snapshot file
+
+        Returns:
+            FrozenDrugGraph with the snapshot's drugs and interactions
+        """
+        if not isinstance(snapshot, GraphSnapshot):
+            snapshot = read_snapshot(snapshot)
+        return cls(
+            snapshot.names,
+            snapshot.edges,
+            snapshot.conditions,
+            snapshot.edge_condition_offsets,
+            snapshot.edge_condition_ids,
+        )
+
+    def _vertex(self, drug_name: str) -> Optional[int]:
+        """Look up the vertex ID for a drug name (case-insensitive)."""
+        return self._name_to_vertex.get(drug_name.strip().lower())
+
+    @property
+    def pair_index(self) -> PairKeyIndex:
+        """
+        Pair-key index for batch lookups, built on first use.
+
+        CSR rows are sorted by (vertex, neighbor), so the entries with
+        vertex <= neighbor already yield the keys in sorted order.
+        """
+        if self._pair_index is None:
+            sources = np.repeat(
+                np.arange(len(self.names), dtype=np.int64), np.diff(self.offsets)
+            )
+            upper = sources <= self.neighbors
+            keys = pack_pair_keys(sources[upper], self.neighbors[upper])
+            self._pair_index = PairKeyIndex(keys, self.edge_ids[upper])
+        return self._pair_index
+
+    def vertex_ids(self, drug_names: Sequence[str]) -> np.ndarray:
+        """
+        Resolve many drug names to vertex IDs.
+
+        Args:
+            drug_names: Drug names (case-insensitive)
+
+        Returns:
+            int64 array of vertex IDs, -1 for unknown drugs
+        """
+        lookup = self._name_to_vertex.get
+        return np.fromiter(
+            (lookup(name.strip().lower(), -1) for name in drug_names),
+            dtype=np.int64,
+            count=len(drug_names),
+        )
+
+    def find_edges(self, v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+        """
+        Find the edges between many vertex pairs at once.
+
+        Args:
+            v1: First vertex IDs
+            v2: Second vertex IDs
+
+        Returns:
+            int64 array of edge IDs, -1 where the vertices are not connected
+        """
+        return self.pair_index.lookup(v1, v2)
+
+    def find_edge(self, v1: int, v2: int) -> int:
+        """
+        Find the edge between two vertices.
+
+        Args:
+            v1: First vertex ID
+            v2: Second vertex ID
+
+        Returns:
+            Edge ID, or -1 if the vertices are not connected
+        """
+        # Search the shorter adjacency row; memoryviews index as plain ints
+        offsets = self._offsets_view
+        if offsets[v1 + 1] - offsets[v1] > offsets[v2 + 1] - offsets[v2]:
+            v1, v2 = v2, v1
+        start, end = offsets[v1], offsets[v1 + 1]
+        neighbors = self._neighbors_view
+        position = bisect_left(neighbors, v2, start, end)
+        if position < end and neighbors[position] == v2:
+            return self._edge_ids_view[position]
+        return -1
+
+    def search_interaction(self, drug1: str, drug2: str) -> Optional[str]:
+        """
+        Search for an interaction between two specific drugs.
+
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+
+        Returns:
+            All conditions of the interaction joined with CONDITION_SEPARATOR,
+            or None if there is no interaction (or it has no condition)
+        """
+        conditions = self.get_interaction_conditions(drug1, drug2)
+        return CONDITION_SEPARATOR.join(conditions) if conditions else None
+
+    def get_interaction_conditions(self, drug1: str, drug2: str) -> List[str]:
+        """
+        Get every condition recorded for the interaction between two drugs.
+
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+
+        Returns:
+            Condition strings in the order they were first recorded
+        """
+        v1 = self._vertex(drug1)
+        v2 = self._vertex(drug2)
+        if v1 is None or v2 is None:
+            return []
+
+        edge_id = self.find_edge(v1, v2)
+        if edge_id == -1:
+            return []
+        return self._edge_conditions(edge_id)
+
+    def _edge_conditions(self, edge_id: int) -> List[str]:
+        """Decode the condition strings of one edge."""
+        start = self.edge_condition_offsets.item(edge_id)
+        end = self.edge_condition_offsets.item(edge_id + 1)
+        conditions = self.conditions
+        return [conditions[c] for c in self.edge_condition_ids[start:end].tolist()]
+
+    def search_regimen_interactions(
+        self, drug_names: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Find every interacting pair among a list of drugs in one pass.
+
+        Adjacency rows are sorted, so the regimen's vertex IDs are located in
+        each drug's row with one vectorized binary search.
+
+        Args:
+            drug_names: Drugs in the regimen (unknown names are ignored)
+
+        Returns:
+            List of dictionaries with keys: 'drug1', 'drug2', 'condition'
+            (all conditions joined) and 'conditions' (list of conditions),
+            ordered by the position of the drugs in drug_names
+        """
+        vertex_ids: List[int] = []
+        for drug_name in drug_names:
+            vertex_id = self._vertex(drug_name)
+            if vertex_id is not None and vertex_id not in vertex_ids:
+                vertex_ids.append(vertex_id)
+
+        members = np.array(vertex_ids, dtype=np.int32)
+        interactions = []
+        for i, vertex_id in enumerate(vertex_ids):
+            # Only look for partners listed later, so each pair appears once
+            later = members[i + 1 :]
+            start, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+            row = self.neighbors[start:end]
+            positions = np.searchsorted(row, later)
+            found = positions < len(row)
+            found[found] = row[positions[found]] == later[found]
+            for j, position in zip(
+                np.flatnonzero(found).tolist(), positions[found].tolist()
+            ):
+                conditions = self._edge_conditions(self.edge_ids.item(start + position))
+                interactions.append(
+                    {
+                        "drug1": self.names[vertex_id],
+                        "drug2": self.names[vertex_ids[i + 1 + j]],
+                        "condition": CONDITION_SEPARATOR.join(conditions) or None,
+                        "conditions": conditions,
+                    }
+                )
+        return interactions
+
+    def get_all_interactions_for_drug(
+        self,
+        drug_name: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        condition: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
+        """
+        Get all interactions for a specific drug.
+
+        Args:
+            drug_name: Name of the drug
+            limit: Maximum number of interactions to return (all if None)
+            offset: Number of interactions to skip
+            condition: Only include interactions with at least one condition
+                containing this text (case-insensitive)
+
+        Returns:
+            List of dictionaries with keys: 'drug', 'condition' (all
+            conditions joined) and 'conditions' (list of conditions)
+        """
+        vertex_id = self._vertex(drug_name)
+        if vertex_id is None:
+            return []
+
+        start, end = self.offsets[vertex_id], self.offsets[vertex_id + 1]
+        neighbors = self.neighbors[start:end]
+        edge_ids = self.edge_ids[start:end]
+
+        if condition is not None:
+            # Test each distinct condition once instead of once per edge
+            condition_ids, owners = ragged_gather(
+                self.edge_condition_offsets, self.edge_condition_ids, edge_ids
+            )
+            needle = condition.strip().lower()
+            matching = [
+                c
+                for c in np.unique(condition_ids).tolist()
+                if needle in self.conditions[c].lower()
+            ]
+            hits = owners[np.isin(condition_ids, matching)]
+            mask = np.bincount(hits, minlength=len(edge_ids)) > 0
+            neighbors = neighbors[mask]
+            edge_ids = edge_ids[mask]
+
+        stop = None if limit is None else offset + limit
+        names = self.names
+        interactions = []
+        for n, e in zip(
+            neighbors[offset:stop].tolist(), edge_ids[offset:stop].tolist()
+        ):
+            conditions = self._edge_conditions(e)
+            interactions.append(
+                {
+                    "drug": names[n],
+                    "condition": CONDITION_SEPARATOR.join(conditions) or None,
+                    "conditions": conditions,
+                }
+            )
+        return interactions
+
+    def _row(self, vertex_id: int) -> np.ndarray:
+        """Return the sorted neighbor vertex IDs of a vertex (a view)."""
+        return self.neighbors[
+            self.offsets.item(vertex_id) : self.offsets.item(vertex_id + 1)
+        ]
+
+    def find_indirect_interactions(
+        self,
+        drug1: str,
+        drug2: str,
+        limit: int = 20,
+        max_depth: int = DEFAULT_PATH_DEPTH,
+        max_fanout: int = DEFAULT_MAX_FANOUT,
+        time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Describe how two drugs are connected through shared partners.
+
+        Shared partners come from one intersection of the two CSR rows; a
+        longer path is searched with a depth-, fan-out- and time-limited
+        bidirectional BFS over the same rows.
+
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+            limit: Maximum number of shared partners to list
+            max_depth: Longest path to look for, in interactions
+            max_fanout: Maximum partners expanded per drug in the BFS
+            time_budget: Seconds the path search may spend (None for no limit)
+
+        Returns:
+            Dictionary described in drug_graph_traversal.name_connection, or
+            None if either drug is unknown
+        """
+        v1, v2 = self._vertex(drug1), self._vertex(drug2)
+        if v1 is None or v2 is None:
+            return None
+        connection = find_connection(
+            self._row,
+            len(self.names),
+            v1,
+            v2,
+            limit=limit,
+            max_depth=max_depth,
+            max_fanout=max_fanout,
+            time_budget=time_budget,
+        )
+        return name_connection(connection, self.names.__getitem__)
+
+    @property
+    def condition_index(self) -> ConditionIndex:
+        """Index from condition words to conditions and edges, built on first use."""
+        if self._condition_index is None:
+            self._condition_index = ConditionIndex(
+                self.conditions, self.edge_condition_offsets, self.edge_condition_ids
+            )
+        return self._condition_index
+
+    def search_by_condition(
+        self, query: str, limit: Optional[int] = 50, offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Find the interacting pairs whose conditions match a query.
+
+        Uses the condition index, so the cost depends on the posting lists
+        of the query terms rather than on the number of edges. Endpoints
+        of the requested page are read from the pair-key index.
+
+        Args:
+            query: Words that must all occur in one of an interaction's
+                conditions ("qt prolonged"); "OR" separates alternatives and a trailing
+                "*" matches a prefix ("lactic acidosis OR hepatic fail*")
+            limit: Maximum number of interactions to return (all if None)
+            offset: Number of interactions to skip
+
+        Returns:
+            Dictionary with 'total' (number of matching interactions) and
+            'interactions', a list of dictionaries with keys: 'drug1',
+            'drug2', 'condition' (all conditions joined), 'conditions' and
+            'matched_conditions' (the conditions that match the query on
+            their own)
+        """
+        index = self.condition_index
+        matched_ids = index.matching_condition_ids(query)
+        edge_ids = index.edges_of_conditions(matched_ids)
+        stop = None if limit is None else offset + limit
+        page = edge_ids[offset:stop]
+        matched = set(matched_ids.tolist())
+
+        if self._edge_keys is None:
+            # Pair key of each edge ID, the inverse of the pair-key index
+            pair_index = self.pair_index
+            edge_keys = np.empty(len(self), dtype=np.uint64)
+            edge_keys[pair_index.edge_ids] = pair_index.keys
+            self._edge_keys = edge_keys
+        keys = self._edge_keys[page]
+        lows = (keys >> np.uint64(32)).tolist()
+        highs = (keys & np.uint64(0xFFFFFFFF)).tolist()
+
+        names = self.names
+        conditions_table = self.conditions
+        interactions = []
+        for edge_id, low, high in zip(page.tolist(), lows, highs):
+            start = self.edge_condition_offsets.item(edge_id)
+            end = self.edge_condition_offsets.item(edge_id + 1)
+            ids = self.edge_condition_ids[start:end].tolist()
+            conditions = [conditions_table[c] for c in ids]
+            interactions.append(
+                {
+                    "drug1": names[low],
+                    "drug2": names[high],
+                    "condition": CONDITION_SEPARATOR.join(conditions) or None,
+                    "conditions": conditions,
+                    "matched_conditions": [
+                        text for c, text in zip(ids, conditions) if c in matched
+                    ],
+                }
+            )
+        return {"total": len(edge_ids), "interactions": interactions}
+
+    def degree(self, drug_name: str) -> int:
+        """
+        Get the number of drugs interacting with a drug.
+
+        Args:
+            drug_name: Name of the drug
+
+        Returns:
+            Number of interaction partners (0 if the drug is unknown)
+        """
+        vertex_id = self._vertex(drug_name)
+        if vertex_id is None:
+            return 0
+        return int(self.offsets[vertex_id + 1] - self.offsets[vertex_id])
+
+    def get_drug_degrees(self) -> Dict[str, int]:
+        """
+        Get every drug with its number of interaction partners.
+
+        Returns:
+            Dictionary mapping display names to degrees, in vertex order
+        """
+        return dict(zip(self.names, np.diff(self.offsets).tolist()))
+
+    def compute_statistics(self, top_k: int = DEFAULT_TOP_K) -> GraphStatistics:
+        """
+        Compute per-drug degree and condition counts from the CSR arrays.
+
+        Args:
+            top_k: Number of hub drugs to rank
+
+        Returns:
+            GraphStatistics for this graph
+        """
+        degrees = np.diff(self.offsets)
+        per_edge = np.diff(self.edge_condition_offsets)
+        owners = np.repeat(np.arange(len(degrees)), degrees)
+        condition_counts = np.bincount(
+            owners, weights=per_edge[self.edge_ids], minlength=len(degrees)
+        )
+        return GraphStatistics.compute(
+            self.names,
+            degrees,
+            condition_counts,
+            interactions=len(self),
+            conditions=len(self.conditions),
+            top_k=top_k,
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get graph statistics.
+
+        Returns:
+            Dictionary with 'drugs' (vertex count) and 'interactions' (edge count)
+        """
+        return {"drugs": len(self.names), "interactions": len(self)}
+
+    def __len__(self) -> int:
+        """Return the number of interactions (edges) in the graph."""
+        return len(self.edge_condition_offsets) - 1
+
+    def __str__(self) -> str:
+        """String representation of the engine."""
+        stats = self.get_stats()
+        return f"FrozenDrugGraph(drugs={stats['drugs']}, interactions={stats['interactions']})"
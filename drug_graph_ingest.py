@@ -0,0 +1,169 @@
+"""
+Parallel CSV parsing for bulk graph construction.
+
+The file body is split into byte ranges that end on line boundaries, and
+each range is parsed by a worker process into a local encoding:
+
+- names: display name of each distinct drug in the range (first spelling
+  seen), keyed by normalized name
+- drug1_codes, drug2_codes: int32 index into names per row
+- conditions: distinct condition strings of the range
+- condition_codes: int32 index into conditions per row (-1 for none), or
+  None if the file has no condition column
+
+The parent merges the ranges in file order with
+_InteractionGraphBuilder.add_encoded, so the resulting graph, including
+vertex and condition IDs, is the same as a serial load.
+
+Rows are split on newlines, so quoted fields must not contain line breaks.
+"""
+
+import csv
+import io
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Target bytes per parsed range (there are at least 4 ranges per worker)
+CSV_RANGE_BYTES = 16 << 20
+
+
+def split_csv_ranges(filepath: str, start: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Split a file into byte ranges that end on line boundaries.
+
+    Args:
+        filepath: Path to the file
+        start: Offset where the first range begins (after the header)
+        parts: Number of ranges to aim for
+
+    Returns:
+        Non-empty (start, end) ranges covering start to the end of the file
+    """
+    size = os.path.getsize(filepath)
+    step = max(1, -(-(size - start) // max(parts, 1)))
+    ranges = []
+    with open(filepath, "rb") as f:
+        while start < size:
+            f.seek(min(start + step, size))
+            f.readline()
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def parse_csv_range(
+    filepath: str, start: int, end: int, columns: Tuple[int, int, int]
+) -> Dict[str, Any]:
+    """
+    Parse one byte range of an interaction CSV into local codes.
+
+    Rows follow load_from_csv: short rows are padded, and rows without both
+    drug names are skipped.
+
+    Args:
+        filepath: Path to the CSV file
+        start: First byte of the range (at a line start)
+        end: Byte after the range (at a line start or end of file)
+        columns: drug1, drug2 and condition column positions (condition -1
+            if absent)
+
+    Returns:
+        Dictionary with 'names', 'drug1_codes', 'drug2_codes',
+        'conditions', 'condition_codes' (see module docstring) and 'bytes'
+        (range length)
+    """
+    drug1_col, drug2_col, condition_col = columns
+    width = max(columns)
+    with open(filepath, "rb") as f:
+        f.seek(start)
+        block = f.read(end - start)
+
+    names: List[str] = []
+    name_codes: Dict[str, int] = {}
+    conditions: List[str] = []
+    condition_codes_by_text: Dict[str, int] = {}
+    drug1_codes = array("i")
+    drug2_codes = array("i")
+    condition_codes = array("i")
+
+    def name_code(name: str) -> int:
+        """Return the local code of a drug name, keyed by normalized name."""
+        normalized = name.strip().lower()
+        code = name_codes.get(normalized)
+        if code is None:
+            code = name_codes[normalized] = len(names)
+            names.append(name)
+        return code
+
+    for row in csv.reader(line.decode("utf-8") for line in io.BytesIO(block)):
+        if len(row) <= width:
+            row = row + [""] * (width + 1 - len(row))
+        drug1 = row[drug1_col]
+        drug2 = row[drug2_col]
+        if not (drug1 and drug2):
+            continue
+        drug1_codes.append(name_code(drug1))
+        drug2_codes.append(name_code(drug2))
+        if condition_col >= 0:
+            condition = row[condition_col]
+            code = -1
+            if condition:
+                code = condition_codes_by_text.get(condition)
+                if code is None:
+                    code = condition_codes_by_text[condition] = len(conditions)
+                    conditions.append(condition)
+            condition_codes.append(code)
+
+    return {
+        "names": names,
+        "drug1_codes": np.frombuffer(drug1_codes, dtype=np.int32),
+        "drug2_codes": np.frombuffer(drug2_codes, dtype=np.int32),
+        "conditions": conditions,
+        "condition_codes": (
+            np.frombuffer(condition_codes, dtype=np.int32)
+            if condition_col >= 0
+            else None
+        ),
+        "bytes": end - start,
+    }
+
+
+def _parse_csv_range_task(task: Tuple[str, int, int, Tuple[int, int, int]]):
+    """Unpack a pool task for parse_csv_range."""
+    return parse_csv_range(*task)
+
+
+def parse_csv_parallel(
+    filepath: str,
+    start: int,
+    columns: Tuple[int, int, int],
+    workers: Optional[int] = None,
+    range_bytes: int = CSV_RANGE_BYTES,
+):
+    """
+    Parse the body of an interaction CSV in a process pool.
+
+    Args:
+        filepath: Path to the CSV file
+        start: Offset of the first data row
+        columns: drug1, drug2 and condition column positions
+        workers: Number of worker processes (all cores if None)
+        range_bytes: Target bytes per range
+
+    Yields:
+        parse_csv_range results, in file order
+    """
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(filepath)
+    parts = max(workers * 4, -(-(size - start) // range_bytes))
+    tasks = [
+        (filepath, range_start, range_end, columns)
+        for range_start, range_end in split_csv_ranges(filepath, start, parts)
+    ]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(_parse_csv_range_task, tasks)
@@ -0,0 +1,186 @@
+"""
+Streaming readers for JSON interaction exports.
+
+Two layouts are supported, both with one object per interaction
+({"drug1": ..., "drug2": ..., "condition": ...}):
+
+- array: a single JSON array of objects, parsed incrementally with
+  json.JSONDecoder.raw_decode over a sliding text buffer
+- ndjson: one object per line (JSON Lines); blank lines are skipped
+
+Either way only the current read buffer and the records not yet consumed
+are held in memory, never the whole parsed document.
+"""
+
+import codecs
+import json
+import re
+from typing import Any, BinaryIO, Dict, Iterator
+
+# Bytes read from the file per step of the incremental array parser
+JSON_READ_SIZE = 1 << 20
+
+JSON_FORMATS = ("auto", "array", "ndjson")
+
+_WHITESPACE = re.compile(r"[ \t\r\n]*")
+_SEPARATOR = re.compile(r"[ \t\r\n]*,[ \t\r\n]*")
+
+
+def detect_json_format(raw: BinaryIO) -> str:
+    """
+    Tell a JSON array from NDJSON by the first non-whitespace character.
+
+    Args:
+        raw: Binary file positioned at the start; the position is restored
+
+    Returns:
+        'array' if the content starts with '[', otherwise 'ndjson'
+    """
+    start = raw.tell()
+    head = raw.read(4096)
+    if head.startswith(codecs.BOM_UTF8):
+        head = head[len(codecs.BOM_UTF8) :]
+    while head and not head.lstrip():
+        head = raw.read(4096)
+    raw.seek(start)
+    return "array" if head.lstrip()[:1] == b"[" else "ndjson"
+
+
+def iter_ndjson(raw: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """
+    Parse one JSON object per line.
+
+    Args:
+        raw: Binary file object
+
+    Yields:
+        One parsed object per non-blank line
+
+    Raises:
+        ValueError: If a line is not valid JSON (the message gives the
+            line number)
+    """
+    for line_number, line in enumerate(raw, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+
+
+def iter_json_array(
+    raw: BinaryIO, read_size: int = JSON_READ_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse the elements of a top-level JSON array one at a time.
+
+    The file is decoded in read_size steps; each element is parsed with
+    raw_decode where it starts, and the buffer is topped up when an element
+    runs past its end. Consumed text is dropped as parsing advances.
+
+    Args:
+        raw: Binary file object
+        read_size: Bytes read per step
+
+    Yields:
+        Parsed array elements in order
+
+    Raises:
+        ValueError: If the content is not a JSON array
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    position = 0
+    exhausted = False
+
+    def fill() -> None:
+        """Append the next block of text, dropping the consumed prefix."""
+        nonlocal buffer, position, exhausted
+        block = raw.read(read_size)
+        exhausted = not block
+        buffer = buffer[position:] + text_decoder.decode(block, final=exhausted)
+        position = 0
+
+    def next_token() -> str:
+        """Skip whitespace and return the next character ('' at end)."""
+        nonlocal position
+        while True:
+            position = _WHITESPACE.match(buffer, position).end()
+            if position < len(buffer):
+                return buffer[position]
+            if exhausted:
+                return ""
+            fill()
+
+    def element() -> Any:
+        """Parse the value at position, reading more text while it is cut off."""
+        nonlocal position
+        while True:
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError as e:
+                if exhausted:
+                    raise ValueError(f"Invalid JSON array element: {e}") from e
+                fill()
+                continue
+            # A number could continue past the buffer end; objects cannot
+            if end == len(buffer) and not exhausted and buffer[end - 1] not in '}]"':
+                fill()
+                continue
+            position = end
+            return item
+
+    if next_token() != "[":
+        raise ValueError("Expected a JSON array of interactions")
+    position += 1
+    token = next_token()
+    while token != "]":
+        if token == "":
+            raise ValueError("Unterminated JSON array")
+        yield element()
+
+        # Fast path: a separator and the next element already in the buffer
+        match = _SEPARATOR.match(buffer, position)
+        if match and match.end() < len(buffer) and buffer[match.end()] != "]":
+            position = match.end()
+            token = buffer[position]
+            continue
+
+        token = next_token()
+        if token == ",":
+            position += 1
+            token = next_token()
+            if token == "]":
+                raise ValueError("Trailing comma in JSON array")
+        elif token not in ("]", ""):
+            raise ValueError(f"Expected ',' or ']' in JSON array, got {token!r}")
+
+
+def iter_json_records(
+    raw: BinaryIO, format: str = "auto", read_size: int = JSON_READ_SIZE
+) -> Iterator[Dict[str, Any]]:
+    """
+    Stream interaction records from a JSON array or NDJSON file.
+
+    Args:
+        raw: Binary file object
+        format: 'auto' (detect), 'array' or 'ndjson'
+        read_size: Bytes read per step in array mode
+
+    Returns:
+        Iterator over the parsed interaction objects
+
+    Raises:
+        ValueError: If the format is unknown or the content is malformed
+    """
+    if format not in JSON_FORMATS:
+        raise ValueError(
+            f"Unknown JSON format '{format}' (expected one of {', '.join(JSON_FORMATS)})"
+        )
+    if format == "auto":
+        format = detect_json_format(raw)
+    if format == "array":
+        return iter_json_array(raw, read_size)
+    return iter_ndjson(raw)
@@ -0,0 +1,262 @@
+"""
+Reduction and native layout of interaction graphs for rendering.
+
+A figure of the full production graph is neither computable nor readable,
+so rendering works on a reduced vertex set:
+
+- ego: the highlighted drug and its partners (the busiest partners when
+  there are more than fit)
+- top_k: the drugs with the most interaction partners
+- k_core: the innermost k-cores, i.e. the most densely interconnected
+  drugs, filled up by degree from the next shell
+
+Layouts are computed by igraph's C implementations on the induced
+subgraph, with seeded starting positions and random number generator so
+repeated renders match. They are cached on disk as .npy coordinate arrays
+keyed by a hash of the subgraph's content (drug names and edges), the
+layout algorithm and its parameters, so re-rendering the same view, or
+highlighting another drug in it, skips the layout.
+"""
+
+import hashlib
+import json
+import os
+import random
+import tempfile
+from typing import Optional
+
+import igraph as ig
+import numpy as np
+
+# Largest number of drugs drawn in one figure
+DEFAULT_MAX_NODES = 500
+
+# Above this many drugs, "auto" uses DrL instead of Fruchterman-Reingold
+FORCE_LAYOUT_MAX_NODES = 1000
+
+REDUCTIONS = ("auto", "ego", "top_k", "k_core", "none")
+LAYOUTS = ("auto", "spring", "kamada_kawai", "circle", "random", "drl")
+
+# Directory of cached layouts, relative to the working directory
+LAYOUT_CACHE_DIR = ".layout_cache"
+LAYOUT_CACHE_VERSION = 1
+
+# From this many edges, interactive figures are drawn with WebGL
+WEBGL_MIN_EDGES = 10_000
+
+
+def _rank_vertices(degrees: np.ndarray, candidates: np.ndarray, count: int):
+    """Return the count candidates of highest degree, ties by vertex ID."""
+    if len(candidates) <= count:
+        return candidates
+    order = np.lexsort((candidates, -degrees[candidates]))
+    return candidates[order[:count]]
+
+
+def select_vertices(
+    graph: ig.Graph,
+    degrees: np.ndarray,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    reduction: str = "auto",
+    focus: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Choose the vertices to render.
+
+    Args:
+        graph: Interaction graph
+        degrees: Number of interaction partners per vertex
+        max_nodes: Maximum number of vertices to keep
+        reduction: 'auto' (every vertex when the graph fits, else the ego
+            network with a focus or top_k without), 'ego', 'top_k', 'k_core'
+            or 'none'
+        focus: Vertex ID of the highlighted drug, if any
+
+    Returns:
+        Sorted vertex IDs
+
+    Raises:
+        ValueError: If the reduction is unknown, or 'ego' has no focus
+    """
+    if reduction not in REDUCTIONS:
+        raise ValueError(
+            f"Unknown reduction '{reduction}' (expected one of {', '.join(REDUCTIONS)})"
+        )
+    vertex_count = graph.vcount()
+    max_nodes = max(1, max_nodes)
+
+    if reduction == "auto":
+        if vertex_count <= max_nodes:
+            reduction = "none"
+        elif focus is not None:
+            reduction = "ego"
+        else:
+            reduction = "top_k"
+
+    if reduction == "none":
+        return np.arange(vertex_count, dtype=np.int64)
+
+    if reduction == "ego":
+        if focus is None:
+            raise ValueError("The 'ego' reduction needs a highlighted drug")
+        partners = np.array(graph.neighbors(focus), dtype=np.int64)
+        partners = _rank_vertices(degrees, partners[partners != focus], max_nodes - 1)
+        return np.sort(np.append(partners, focus))
+
+    if reduction == "k_core":
+        # Whole cores from the innermost outwards, the last one by degree
+        coreness = np.array(graph.coreness(), dtype=np.int64)
+        order = np.lexsort((np.arange(vertex_count), -degrees, -coreness))
+        selected = order[:max_nodes]
+    else:
+        selected = _rank_vertices(
+            degrees, np.arange(vertex_count, dtype=np.int64), max_nodes
+        )
+    if focus is not None and focus not in selected:
+        selected = np.append(selected[: max_nodes - 1], focus)
+    return np.sort(selected)
+
+
+def _resolve_layout(layout: str, vertex_count: int) -> str:
+    """Return the algorithm 'auto' stands for at this size."""
+    if layout == "auto":
+        return "spring" if vertex_count <= FORCE_LAYOUT_MAX_NODES else "drl"
+    return layout
+
+
+def compute_layout(subgraph: ig.Graph, layout: str = "auto", seed: int = 42):
+    """
+    Compute 2D vertex positions with igraph's native layouts.
+
+    Args:
+        subgraph: Graph to lay out (normally already reduced)
+        layout: 'auto' (spring up to FORCE_LAYOUT_MAX_NODES vertices, DrL
+            above), 'spring' (Fruchterman-Reingold), 'kamada_kawai',
+            'circle', 'random' or 'drl'
+        seed: Seed for the starting positions and the force layouts
+
+    Returns:
+        float64 array (V, 2) of positions scaled to [-1, 1]
+
+    Raises:
+        ValueError: If the layout is unknown
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(
+            f"Unknown layout '{layout}' (expected one of {', '.join(LAYOUTS)})"
+        )
+    vertex_count = subgraph.vcount()
+    if vertex_count == 0:
+        return np.zeros((0, 2))
+    layout = _resolve_layout(layout, vertex_count)
+
+    start = np.random.default_rng(seed).uniform(-1, 1, size=(vertex_count, 2))
+    if layout == "random":
+        coords = start
+    elif layout == "circle":
+        coords = np.array(subgraph.layout_circle().coords)
+    else:
+        # The force layouts draw from igraph's global generator
+        ig.set_random_number_generator(random.Random(seed))
+        try:
+            if layout == "kamada_kawai":
+                result = subgraph.layout_kamada_kawai(seed=start.tolist())
+            elif layout == "drl":
+                result = subgraph.layout_drl(seed=start.tolist())
+            else:
+                result = subgraph.layout_fruchterman_reingold(seed=start.tolist())
+        finally:
+            ig.set_random_number_generator(random)
+        coords = np.array(result.coords)
+
+    coords = coords - (coords.max(axis=0) + coords.min(axis=0)) / 2
+    extent = np.abs(coords).max()
+    return coords / extent if extent > 0 else coords
+
+
+def edge_coordinates(pos: np.ndarray, edges: np.ndarray):
+    """
+    Build the coordinates of a line trace drawing all edges.
+
+    Each edge contributes its two endpoints followed by a NaN, which
+    breaks the line between consecutive edges.
+
+    Args:
+        pos: float array (V, 2) of vertex positions
+        edges: int array (M, 2) of vertex index pairs
+
+    Returns:
+        Tuple of (x, y) float64 arrays of length 3 * M
+    """
+    coords = np.full((len(edges), 3, 2), np.nan)
+    coords[:, :2] = pos[edges]
+    coords = coords.reshape(-1, 2)
+    return coords[:, 0], coords[:, 1]
+
+
+def layout_key(subgraph: ig.Graph, layout: str = "auto", seed: int = 42) -> str:
+    """
+    Hash a layout request by graph content, algorithm and parameters.
+
+    Args:
+        subgraph: Graph to lay out
+        layout: Layout name (see compute_layout)
+        seed: Layout seed
+
+    Returns:
+        Hex digest identifying the layout
+    """
+    names = subgraph.vs["name"] if "name" in subgraph.vs.attributes() else []
+    params = {
+        "version": LAYOUT_CACHE_VERSION,
+        "igraph": ig.__version__,
+        "layout": _resolve_layout(layout, subgraph.vcount()),
+        "seed": seed,
+        "vertices": subgraph.vcount(),
+    }
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps(params, sort_keys=True).encode("utf-8"))
+    digest.update("\0".join(names).encode("utf-8"))
+    digest.update(np.array(subgraph.get_edgelist(), dtype=np.int64).tobytes())
+    return digest.hexdigest()
+
+
+def cached_layout(
+    subgraph: ig.Graph,
+    layout: str = "auto",
+    seed: int = 42,
+    cache_dir: Optional[str] = LAYOUT_CACHE_DIR,
+) -> np.ndarray:
+    """
+    Get a layout from the on-disk cache, computing and storing it on a miss.
+
+    Args:
+        subgraph: Graph to lay out
+        layout: Layout name (see compute_layout)
+        seed: Layout seed
+        cache_dir: Cache directory (None to always compute)
+
+    Returns:
+        float64 array (V, 2) of positions scaled to [-1, 1]
+    """
+    if cache_dir is None or subgraph.vcount() == 0:
+        return compute_layout(subgraph, layout, seed)
+
+    filepath = os.path.join(cache_dir, layout_key(subgraph, layout, seed) + ".npy")
+    try:
+        coords = np.load(filepath, allow_pickle=False)
+        if coords.shape == (subgraph.vcount(), 2):
+            return coords
+    except (OSError, ValueError):
+        pass
+
+    coords = compute_layout(subgraph, layout, seed)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, coords, allow_pickle=False)
+        os.replace(tmp_path, filepath)
+    except OSError as e:
+        print(f"⚠️ Could not cache layout in '{cache_dir}': {e}")
+    return coords
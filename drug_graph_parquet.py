@@ -0,0 +1,166 @@
+"""
+Columnar Parquet import and export for interaction graphs.
+
+Files hold one row per (interaction, condition) pair, like the CSV input,
+in three dictionary-encoded string columns:
+
+- drug1, drug2: drug names (drug_1/drug_2 are accepted on import)
+- condition: condition text; null for an interaction without conditions
+
+Dictionary encoding stores each distinct name once per row group and every
+row as an integer code, so files are small and batches are read as
+(dictionary, codes) pairs that the graph builder consumes without creating
+a Python object per row.
+
+Requires pyarrow (pip install pyarrow).
+"""
+
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Rows per record batch read from a Parquet file
+PARQUET_BATCH_SIZE = 262_144
+
+# (dictionary, codes) of one column; codes are -1 for nulls
+EncodedColumn = Tuple[List[Optional[str]], np.ndarray]
+
+
+def _import_pyarrow():
+    """Import pyarrow and pyarrow.parquet, with an install hint if missing."""
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError(
+            "pyarrow is required for Parquet import/export. "
+            "Install with: pip install pyarrow"
+        )
+    return pa, pq
+
+
+def _resolve_columns(names: Sequence[str]) -> Tuple[str, str, Optional[str]]:
+    """Find the drug1, drug2 and (optional) condition column names."""
+    columns = {name.strip(): name for name in names}
+    drug1 = columns.get("drug1", columns.get("drug_1"))
+    drug2 = columns.get("drug2", columns.get("drug_2"))
+    if drug1 is None or drug2 is None:
+        raise ValueError(
+            f"Parquet schema must contain drug1/drug2 columns, got: {list(names)}"
+        )
+    return drug1, drug2, columns.get("condition")
+
+
+class _ColumnDecoder:
+    """Split Arrow columns into (dictionary, codes), reusing unchanged dictionaries."""
+
+    def __init__(self, pa):
+        """
+        Initialize the decoder.
+
+        Args:
+            pa: The pyarrow module
+        """
+        self._pa = pa
+        self._dictionary = None
+        self._values: List[Optional[str]] = []
+
+    def __call__(self, column) -> EncodedColumn:
+        """Return the dictionary values and per-row codes of a column."""
+        if not self._pa.types.is_dictionary(column.type):
+            column = column.dictionary_encode()
+        # Batches of one row group share its dictionary
+        if self._dictionary is None or not column.dictionary.equals(self._dictionary):
+            self._dictionary = column.dictionary
+            self._values = column.dictionary.to_pylist()
+        codes = column.indices.fill_null(-1).to_numpy(zero_copy_only=False)
+        return self._values, codes
+
+
+def read_parquet_batches(
+    filepath: str, batch_size: int = PARQUET_BATCH_SIZE
+) -> Iterator[Tuple[EncodedColumn, EncodedColumn, Optional[EncodedColumn]]]:
+    """
+    Stream the interaction columns of a Parquet file as encoded batches.
+
+    String columns are read as dictionary arrays, so only batch_size rows
+    of integer codes are held in memory at once.
+
+    Args:
+        filepath: Path to the Parquet file
+        batch_size: Maximum rows per batch
+
+    Yields:
+        Tuples of (drug1, drug2, condition) encoded columns; condition is
+        None if the file has no condition column
+
+    Raises:
+        ValueError: If the file has no drug1/drug2 columns
+    """
+    pa, pq = _import_pyarrow()
+    schema = pq.read_schema(filepath)
+    drug1, drug2, condition = _resolve_columns(schema.names)
+    columns = [drug1, drug2] + ([condition] if condition else [])
+
+    parquet_file = pq.ParquetFile(filepath, read_dictionary=columns)
+    decoders = [_ColumnDecoder(pa) for _ in columns]
+    for batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+        encoded = [decode(batch.column(i)) for i, decode in enumerate(decoders)]
+        yield encoded[0], encoded[1], encoded[2] if condition else None
+
+
+def write_parquet(
+    filepath: str,
+    names: Sequence[str],
+    edges: np.ndarray,
+    conditions: Sequence[str],
+    edge_condition_offsets: np.ndarray,
+    edge_condition_ids: np.ndarray,
+    compression: str = "zstd",
+) -> int:
+    """
+    Write interactions as dictionary-encoded Parquet columns.
+
+    The columns are built directly from the graph's integer IDs: vertex IDs
+    index the name dictionary and condition IDs the condition dictionary.
+
+    Args:
+        filepath: Output path
+        names: Drug names, indexed by vertex ID
+        edges: int array (E, 2) of vertex IDs
+        conditions: Condition vocabulary, indexed by condition ID
+        edge_condition_offsets: int64 (E + 1) offsets into
+            edge_condition_ids
+        edge_condition_ids: Condition IDs of all edges
+        compression: Parquet compression codec
+
+    Returns:
+        Number of rows written
+    """
+    pa, pq = _import_pyarrow()
+    edges = np.asarray(edges, dtype=np.int32).reshape(-1, 2)
+    counts = np.diff(np.asarray(edge_condition_offsets, dtype=np.int64))
+
+    # One row per condition, and one null-condition row per bare edge
+    rows_per_edge = np.maximum(counts, 1)
+    row_edges = np.repeat(np.arange(len(edges)), rows_per_edge)
+    row_conditions = np.full(len(row_edges), -1, dtype=np.int32)
+    row_conditions[np.repeat(counts > 0, rows_per_edge)] = edge_condition_ids
+
+    name_dictionary = pa.array(list(names), type=pa.string())
+    table = pa.table(
+        {
+            "drug1": pa.DictionaryArray.from_arrays(
+                edges[row_edges, 0], name_dictionary
+            ),
+            "drug2": pa.DictionaryArray.from_arrays(
+                edges[row_edges, 1], name_dictionary
+            ),
+            "condition": pa.DictionaryArray.from_arrays(
+                pa.array(row_conditions, mask=row_conditions < 0),
+                pa.array(list(conditions), type=pa.string()),
+            ),
+        }
+    )
+    pq.write_table(table, filepath, compression=compression, use_dictionary=True)
+    return len(row_edges)
@@ -0,0 +1,281 @@
+"""
+Memory-mapped serving image of a FrozenDrugGraph, shared by API workers.
+
+A FrozenDrugGraph built in-process keeps its names, conditions and name
+lookup as Python objects, and builds its CSR arrays and pair-key index in
+private memory, so every uvicorn/gunicorn worker pays for its own copy.
+
+A serving image stores everything the engine needs as aligned arrays:
+
+- offsets / neighbors / edge_ids: CSR adjacency
+- pair_keys / pair_edge_ids: sorted pair-key index
+- name_offsets / name_data, condition_offsets / condition_data: UTF-8
+  string tables
+- name_key_offsets / name_key_data / name_key_vertices: normalized names
+  in sorted order with their vertex IDs, searched with bisect
+- edge_condition_offsets / edge_condition_ids: conditions per edge
+
+Workers map the file read-only, so the OS page cache holds one copy for
+all of them and strings are only decoded when a query touches them. The
+image records the inode, size and modification time of the files it was
+built from and is rebuilt when they change.
+
+Usage:
+    python drug_graph_shared.py build --snapshot drug_interactions.snap \
+        --output drug_interactions.shared
+"""
+
+import argparse
+import operator
+import os
+from bisect import bisect_left
+from collections.abc import Sequence as SequenceABC
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from drug_graph_engine import FrozenDrugGraph, PairKeyIndex
+from drug_graph_snapshot import (
+    SnapshotError,
+    encode_strings,
+    read_array_file,
+    source_stamp,
+    write_array_file,
+)
+
+SHARED_MAGIC = b"DDIGSHRD"
+SHARED_VERSION = 1
+
+
+class StringTable(SequenceABC):
+    """Read-only sequence of strings decoded on access from a UTF-8 table."""
+
+    def __init__(self, offsets: np.ndarray, data: np.ndarray):
+        """
+        Initialize the table.
+
+        Args:
+            offsets: int64 array of shape (N + 1,); string i is
+                data[offsets[i]:offsets[i + 1]]
+            data: uint8 array with the UTF-8 bytes of all strings
+        """
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self) -> int:
+        """Return the number of strings."""
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        """Decode one string."""
+        index = operator.index(index)
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("string table index out of range")
+        start = self.offsets.item(index)
+        end = self.offsets.item(index + 1)
+        return self.data[start:end].tobytes().decode("utf-8")
+
+
+class SortedNameIndex:
+    """
+    Normalized drug name to vertex ID lookup over a sorted string table.
+
+    Offers the dict.get() interface FrozenDrugGraph uses for its in-memory
+    name lookup, at O(log V) string decodes per lookup.
+    """
+
+    def __init__(self, keys: StringTable, vertices: np.ndarray):
+        """
+        Initialize the index.
+
+        Args:
+            keys: Normalized names in sorted order
+            vertices: Vertex ID of each key
+        """
+        self.keys = keys
+        self.vertices = vertices
+
+    def get(self, key: str, default: Optional[int] = None) -> Optional[int]:
+        """
+        Look up the vertex ID of a normalized drug name.
+
+        Args:
+            key: Normalized (stripped, lowercase) drug name
+            default: Value returned when the name is unknown
+
+        Returns:
+            Vertex ID, or default if the name is unknown
+        """
+        position = bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            return self.vertices.item(position)
+        return default
+
+    def __contains__(self, key: str) -> bool:
+        """Check whether a normalized drug name is known."""
+        return self.get(key) is not None
+
+    def __len__(self) -> int:
+        """Return the number of names."""
+        return len(self.keys)
+
+
+def write_shared_graph(
+    filepath: str, engine: FrozenDrugGraph, metadata: Optional[Dict[str, Any]] = None
+) -> int:
+    """
+    Write a serving image of an engine.
+
+    Args:
+        filepath: Output path
+        engine: FrozenDrugGraph to store
+        metadata: Optional JSON-serializable metadata
+
+    Returns:
+        Size of the written file in bytes
+    """
+    names = list(engine.names)
+    name_lookup = {name.strip().lower(): i for i, name in enumerate(names)}
+    sorted_keys = sorted(name_lookup)
+    name_table = encode_strings(names)
+    key_table = encode_strings(sorted_keys)
+    condition_table = encode_strings(list(engine.conditions))
+    pair_index = engine.pair_index
+
+    arrays = {
+        "offsets": np.ascontiguousarray(engine.offsets, dtype=np.int32),
+        "neighbors": np.ascontiguousarray(engine.neighbors, dtype=np.int32),
+        "edge_ids": np.ascontiguousarray(engine.edge_ids, dtype=np.int32),
+        "pair_keys": pair_index.keys,
+        "pair_edge_ids": pair_index.edge_ids,
+        "name_offsets": name_table["offsets"],
+        "name_data": name_table["data"],
+        "name_key_offsets": key_table["offsets"],
+        "name_key_data": key_table["data"],
+        "name_key_vertices": np.array(
+            [name_lookup[key] for key in sorted_keys], dtype=np.int32
+        ),
+        "condition_offsets": condition_table["offsets"],
+        "condition_data": condition_table["data"],
+        "edge_condition_offsets": engine.edge_condition_offsets,
+        "edge_condition_ids": engine.edge_condition_ids,
+    }
+    header = {
+        "version": SHARED_VERSION,
+        "vertices": len(names),
+        "edges": len(engine),
+        "metadata": metadata or {},
+    }
+    return write_array_file(filepath, SHARED_MAGIC, header, arrays)
+
+
+def open_shared_graph(filepath: str, verify: bool = True) -> FrozenDrugGraph:
+    """
+    Attach to a serving image read-only.
+
+    Args:
+        filepath: Path to the image
+        verify: Check the stored CRC32 checksum
+
+    Returns:
+        FrozenDrugGraph whose arrays and string tables are views over the
+        mapped file
+
+    Raises:
+        SnapshotError: If the file is not a valid serving image
+    """
+    header, arrays, mapping = read_array_file(filepath, SHARED_MAGIC, verify=verify)
+    if header.get("version") != SHARED_VERSION:
+        raise SnapshotError(
+            f"Unsupported serving image version {header.get('version')} "
+            f"(expected {SHARED_VERSION})"
+        )
+
+    engine = FrozenDrugGraph.__new__(FrozenDrugGraph)
+    engine._attach(
+        names=StringTable(arrays["name_offsets"], arrays["name_data"]),
+        offsets=arrays["offsets"],
+        neighbors=arrays["neighbors"],
+        edge_ids=arrays["edge_ids"],
+        conditions=StringTable(arrays["condition_offsets"], arrays["condition_data"]),
+        edge_condition_offsets=arrays["edge_condition_offsets"],
+        edge_condition_ids=arrays["edge_condition_ids"],
+        name_to_vertex=SortedNameIndex(
+            StringTable(arrays["name_key_offsets"], arrays["name_key_data"]),
+            arrays["name_key_vertices"],
+        ),
+        pair_index=PairKeyIndex(arrays["pair_keys"], arrays["pair_edge_ids"]),
+    )
+    engine._mapping = mapping
+    return engine
+
+
+def shared_graph_sources(filepath: str) -> Optional[List[List[Any]]]:
+    """
+    Read the source stamp recorded in a serving image.
+
+    Args:
+        filepath: Path to the image
+
+    Returns:
+        The stamp stored by open_or_build_shared_graph, or None if the file
+        is missing or not a readable image
+    """
+    if not os.path.exists(filepath):
+        return None
+    try:
+        header, _, _ = read_array_file(filepath, SHARED_MAGIC, verify=False)
+    except SnapshotError:
+        return None
+    if header.get("version") != SHARED_VERSION:
+        return None
+    return header.get("metadata", {}).get("sources")
+
+
+def open_or_build_shared_graph(
+    filepath: str,
+    sources: Sequence[str],
+    build: Callable[[], FrozenDrugGraph],
+) -> FrozenDrugGraph:
+    """
+    Attach to a serving image, rebuilding it first if its sources changed.
+
+    Workers starting at the same time may each rebuild a stale image; every
+    write is atomic, so they all end up attached to a complete image.
+
+    Args:
+        filepath: Path to the image
+        sources: Files the graph is built from (snapshot, delta log)
+        build: Function that loads the graph from the sources
+
+    Returns:
+        FrozenDrugGraph backed by the mapped image
+    """
+    stamp = source_stamp(sources)
+    if shared_graph_sources(filepath) != stamp:
+        print(f"📦 Building shared graph image '{filepath}'...")
+        write_shared_graph(filepath, build(), metadata={"sources": stamp})
+    return open_shared_graph(filepath)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Build a memory-mapped graph image shared by API workers"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    build = subparsers.add_parser("build", help="Write a serving image")
+    build.add_argument("--snapshot", required=True, help="Graph snapshot")
+    build.add_argument("--output", required=True, help="Serving image to write")
+    args = parser.parse_args()
+
+    engine = FrozenDrugGraph.from_snapshot(args.snapshot)
+    size = write_shared_graph(
+        args.output, engine, metadata={"sources": source_stamp([args.snapshot])}
+    )
+    print(f"Wrote {size} bytes: {engine}")
+
+
+if __name__ == "__main__":
+    main()
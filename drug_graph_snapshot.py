@@ -0,0 +1,390 @@
+"""
+Binary snapshot format for DrugInteractionGraph.
+
+A snapshot stores the graph as flat arrays so it can be memory-mapped and
+turned back into a graph without parsing text:
+
+    magic (8 bytes) | header length (uint32) | JSON header | aligned sections
+
+The JSON header records the format version, the array sections (offset,
+dtype, shape) and a CRC32 checksum over all section bytes. Sections:
+
+- edges: int32 array of shape (E, 2) with vertex IDs
+- name_offsets / name_data: UTF-8 vertex name table
+- condition_offsets / condition_data: UTF-8 interned condition table
+- edge_condition_offsets: int64 array of shape (E + 1,); the conditions of
+  edge e are edge_condition_ids[offsets[e]:offsets[e + 1]]
+- edge_condition_ids: int32 indexes into the condition table
+"""
+
+import json
+import mmap
+import os
+import struct
+import zlib
+from array import array
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SNAPSHOT_MAGIC = b"DDIGSNAP"
+SNAPSHOT_VERSION = 2
+
+# Sections start on cache-line boundaries so mapped arrays are aligned
+_ALIGNMENT = 64
+_PREFIX = struct.Struct("<8sI")
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is malformed, corrupt or unsupported."""
+
+
+class GraphSnapshot:
+    """
+    Arrays and string tables read from a snapshot file.
+
+    When the snapshot was memory-mapped, the arrays are read-only views over
+    the mapping and stay valid for as long as this object is alive.
+    """
+
+    def __init__(
+        self,
+        names: List[str],
+        edges: np.ndarray,
+        conditions: List[str],
+        edge_condition_offsets: np.ndarray,
+        edge_condition_ids: np.ndarray,
+        metadata: Dict[str, Any],
+        mapping: Optional[mmap.mmap] = None,
+    ):
+        """
+        Initialize a snapshot.
+
+        Args:
+            names: Vertex display names, indexed by vertex ID
+            edges: int32 array of shape (E, 2)
+            conditions: Interned condition strings
+            edge_condition_offsets: int64 array of shape (E + 1,)
+            edge_condition_ids: int32 condition indexes of all edges
+            metadata: Free-form metadata stored in the header
+            mapping: Memory mapping backing the arrays, if any
+        """
+        self.names = names
+        self.edges = edges
+        self.conditions = conditions
+        self.edge_condition_offsets = edge_condition_offsets
+        self.edge_condition_ids = edge_condition_ids
+        self.metadata = metadata
+        self._mapping = mapping
+
+    @property
+    def vertex_count(self) -> int:
+        """Number of vertices in the snapshot."""
+        return len(self.names)
+
+    @property
+    def edge_count(self) -> int:
+        """Number of edges in the snapshot."""
+        return int(self.edges.shape[0])
+
+
+def is_snapshot(filepath: str) -> bool:
+    """
+    Check whether a file starts with the snapshot magic bytes.
+
+    Args:
+        filepath: Path to the file
+
+    Returns:
+        True if the file looks like a snapshot
+    """
+    try:
+        with open(filepath, "rb") as f:
+            return f.read(len(SNAPSHOT_MAGIC)) == SNAPSHOT_MAGIC
+    except OSError:
+        return False
+
+
+def encode_strings(strings: Sequence[str]) -> Dict[str, np.ndarray]:
+    """Encode strings as an offsets array plus one UTF-8 byte blob."""
+    encoded = [s.encode("utf-8") for s in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+    return {"offsets": offsets, "data": data}
+
+
+def decode_strings(offsets: np.ndarray, data: np.ndarray) -> List[str]:
+    """Decode a string table written by encode_strings."""
+    blob = data.tobytes()
+    bounds = offsets.tolist()
+    return [blob[a:b].decode("utf-8") for a, b in zip(bounds, bounds[1:])]
+
+
+def pack_condition_ids(
+    condition_ids: Sequence[Optional[array]],
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Pack per-edge condition ID arrays into offsets and one flat ID array.
+
+    Args:
+        condition_ids: array('I') of condition IDs per edge (None = empty)
+
+    Returns:
+        Tuple of (int64 offsets of shape (E + 1,), int32 condition IDs)
+    """
+    offsets = np.zeros(len(condition_ids) + 1, dtype=np.int64)
+    if condition_ids:
+        np.cumsum([len(ids) if ids else 0 for ids in condition_ids], out=offsets[1:])
+    blob = b"".join(ids.tobytes() for ids in condition_ids if ids)
+    return offsets, np.frombuffer(blob, dtype=np.uint32).astype(np.int32)
+
+
+def unpack_condition_ids(offsets: np.ndarray, ids: np.ndarray) -> List[array]:
+    """
+    Split a flat condition ID array into one array('I') per edge.
+
+    Args:
+        offsets: int64 offsets of shape (E + 1,)
+        ids: Condition IDs of all edges
+
+    Returns:
+        List of array('I'), one per edge
+    """
+    blob = np.ascontiguousarray(ids, dtype=np.uint32).tobytes()
+    bounds = (np.asarray(offsets, dtype=np.int64) * 4).tolist()
+    result = []
+    for start, end in zip(bounds, bounds[1:]):
+        edge_ids = array("I")
+        edge_ids.frombytes(blob[start:end])
+        result.append(edge_ids)
+    return result
+
+
+def write_array_file(
+    filepath: str,
+    magic: bytes,
+    header: Dict[str, Any],
+    arrays: Dict[str, np.ndarray],
+) -> int:
+    """
+    Write named arrays as aligned sections behind a JSON header, atomically.
+
+    The file is written next to the target and renamed into place, so
+    readers never observe a partially written file. The temporary name
+    includes the process ID, so several processes may write the same
+    target concurrently; the last rename wins.
+
+    Args:
+        filepath: Output path
+        magic: 8-byte file type marker
+        header: JSON-serializable header fields (sections and checksum
+            are added)
+        arrays: Contiguous arrays to store, by section name
+
+    Returns:
+        Size of the written file in bytes
+    """
+    sections = {}
+    checksum = 0
+    position = 0
+    for key, array in arrays.items():
+        position = -(-position // _ALIGNMENT) * _ALIGNMENT
+        sections[key] = {
+            "offset": position,
+            "dtype": array.dtype.str,
+            "shape": list(array.shape),
+        }
+        checksum = zlib.crc32(array.tobytes(), checksum)
+        position += array.nbytes
+
+    header = dict(header, checksum=checksum, sections=sections)
+    header_bytes = json.dumps(header).encode("utf-8")
+    data_start = _PREFIX.size + len(header_bytes)
+    data_start = -(-data_start // _ALIGNMENT) * _ALIGNMENT
+
+    tmp_path = f"{filepath}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(_PREFIX.pack(magic, len(header_bytes)))
+        f.write(header_bytes)
+        for key, array in arrays.items():
+            f.seek(data_start + sections[key]["offset"])
+            f.write(array.tobytes())
+        # Trailing empty sections still need their offsets inside the file
+        f.truncate(data_start + position)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, filepath)
+    return os.path.getsize(filepath)
+
+
+def read_array_file(
+    filepath: str, magic: bytes, use_mmap: bool = True, verify: bool = True
+) -> Tuple[Dict[str, Any], Dict[str, np.ndarray], Optional[mmap.mmap]]:
+    """
+    Read a file written by write_array_file.
+
+    Args:
+        filepath: Path to the file
+        magic: Expected 8-byte file type marker
+        use_mmap: Memory-map the file instead of reading it into memory
+        verify: Check the stored CRC32 checksum
+
+    Returns:
+        Tuple of (header, arrays by section name, mapping or None). Mapped
+        arrays are read-only views that stay valid while the mapping is alive.
+
+    Raises:
+        SnapshotError: If the file is malformed or corrupt
+    """
+    with open(filepath, "rb") as f:
+        if use_mmap:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            buffer = f.read()
+
+    if len(buffer) < _PREFIX.size:
+        raise SnapshotError(f"'{filepath}' is too small to be a snapshot")
+    file_magic, header_length = _PREFIX.unpack_from(buffer, 0)
+    if file_magic != magic:
+        raise SnapshotError(f"'{filepath}' is not a drug interaction snapshot")
+
+    try:
+        header = json.loads(bytes(buffer[_PREFIX.size : _PREFIX.size + header_length]))
+    except ValueError as e:
+        raise SnapshotError(f"Corrupt snapshot header in '{filepath}': {e}")
+
+    data_start = _PREFIX.size + header_length
+    data_start = -(-data_start // _ALIGNMENT) * _ALIGNMENT
+    arrays = {}
+    checksum = 0
+    for key, section in header.get("sections", {}).items():
+        dtype = np.dtype(section["dtype"])
+        shape = tuple(section["shape"])
+        count = int(np.prod(shape)) if shape else 1
+        offset = data_start + section["offset"]
+        if offset + count * dtype.itemsize > len(buffer):
+            raise SnapshotError(f"Snapshot '{filepath}' is truncated")
+        array = np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+        arrays[key] = array.reshape(shape)
+        if verify:
+            checksum = zlib.crc32(array, checksum)
+
+    if verify and checksum != header.get("checksum"):
+        raise SnapshotError(f"Checksum mismatch in snapshot '{filepath}'")
+
+    return header, arrays, buffer if use_mmap else None
+
+
+def source_stamp(filepaths: Sequence[str]) -> List[List[Any]]:
+    """
+    Identify the current contents of the files an image is built from.
+
+    Args:
+        filepaths: Source files (missing files are recorded as such)
+
+    Returns:
+        List of [absolute path, inode, size, modification time in ns] per file
+    """
+    stamp = []
+    for filepath in filepaths:
+        try:
+            stat = os.stat(filepath)
+            stamp.append(
+                [
+                    os.path.abspath(filepath),
+                    stat.st_ino,
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                ]
+            )
+        except OSError:
+            stamp.append([os.path.abspath(filepath), None, None, None])
+    return stamp
+
+
+def write_snapshot(
+    filepath: str,
+    names: Sequence[str],
+    edges: np.ndarray,
+    conditions: Sequence[str],
+    edge_condition_offsets: np.ndarray,
+    edge_condition_ids: np.ndarray,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> int:
+    """
+    Write a graph snapshot atomically.
+
+    Args:
+        filepath: Output path
+        names: Vertex display names
+        edges: Edge endpoints, shape (E, 2)
+        conditions: Interned condition strings
+        edge_condition_offsets: Offsets into edge_condition_ids, shape (E + 1,)
+        edge_condition_ids: Condition indexes of all edges
+        metadata: Optional JSON-serializable metadata
+
+    Returns:
+        Size of the written file in bytes
+    """
+    name_table = encode_strings(names)
+    condition_table = encode_strings(conditions)
+    arrays = {
+        "edges": np.ascontiguousarray(edges, dtype=np.int32).reshape(-1, 2),
+        "name_offsets": name_table["offsets"],
+        "name_data": name_table["data"],
+        "condition_offsets": condition_table["offsets"],
+        "condition_data": condition_table["data"],
+        "edge_condition_offsets": np.ascontiguousarray(
+            edge_condition_offsets, dtype=np.int64
+        ),
+        "edge_condition_ids": np.ascontiguousarray(edge_condition_ids, dtype=np.int32),
+    }
+    header = {
+        "version": SNAPSHOT_VERSION,
+        "vertices": len(names),
+        "edges": int(arrays["edges"].shape[0]),
+        "conditions": len(conditions),
+        "metadata": metadata or {},
+    }
+    return write_array_file(filepath, SNAPSHOT_MAGIC, header, arrays)
+
+
+def read_snapshot(
+    filepath: str, use_mmap: bool = True, verify: bool = True
+) -> GraphSnapshot:
+    """
+    Read a graph snapshot.
+
+    Args:
+        filepath: Path to the snapshot file
+        use_mmap: Memory-map the file instead of reading it into memory
+        verify: Check the stored CRC32 checksum
+
+    Returns:
+        GraphSnapshot with arrays backed by the file contents
+
+    Raises:
+        SnapshotError: If the file is not a valid snapshot
+    """
+    header, arrays, mapping = read_array_file(
+        filepath, SNAPSHOT_MAGIC, use_mmap=use_mmap, verify=verify
+    )
+    if header.get("version") != SNAPSHOT_VERSION:
+        raise SnapshotError(
+            f"Unsupported snapshot version {header.get('version')} "
+            f"(expected {SNAPSHOT_VERSION})"
+        )
+
+    return GraphSnapshot(
+        names=decode_strings(arrays["name_offsets"], arrays["name_data"]),
+        edges=arrays["edges"],
+        conditions=decode_strings(
+            arrays["condition_offsets"], arrays["condition_data"]
+        ),
+        edge_condition_offsets=arrays["edge_condition_offsets"],
+        edge_condition_ids=arrays["edge_condition_ids"],
+        metadata=header.get("metadata", {}),
+        mapping=mapping,
+    )
@@ -0,0 +1,282 @@
+"""
+Precomputed per-drug statistics of an interaction graph, cached on disk.
+
+Counting degrees, condition reports, hub rankings and the degree histogram
+touches every edge, so it is done once per graph version and stored in an
+aligned array file next to the snapshot:
+
+- degrees: int32 (V); number of interaction partners per drug
+- condition_counts: int64 (V); condition reports over all of a drug's
+  interactions
+- top_vertices: int32 (K); the K drugs with the most partners, descending
+- degree_histogram: int64; drugs per power-of-two degree bucket
+
+The file records the inode, size and modification time of the files the
+graph was built from (drug_graph_snapshot.source_stamp, taken when the
+graph was loaded), and is recomputed when they change.
+"""
+
+import os
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from drug_graph_snapshot import SnapshotError, read_array_file, write_array_file
+
+STATS_MAGIC = b"DDIGSTAT"
+STATS_VERSION = 1
+
+# Number of hub drugs ranked and stored
+DEFAULT_TOP_K = 100
+
+
+def degree_buckets(degrees: np.ndarray) -> np.ndarray:
+    """
+    Assign degrees to power-of-two buckets.
+
+    Bucket 0 holds degree 0 and bucket b > 0 holds degrees
+    2^(b - 1) to 2^b - 1.
+
+    Args:
+        degrees: Non-negative integer degrees
+
+    Returns:
+        Bucket index of each degree
+    """
+    return np.frexp(np.asarray(degrees, dtype=np.float64))[1]
+
+
+class GraphStatistics:
+    """Per-drug degree and condition counts with hub ranking and histogram."""
+
+    def __init__(
+        self,
+        degrees: np.ndarray,
+        condition_counts: np.ndarray,
+        top_vertices: np.ndarray,
+        top_names: List[str],
+        degree_histogram: np.ndarray,
+        totals: Dict[str, int],
+    ):
+        """
+        Initialize statistics from precomputed arrays.
+
+        Args:
+            degrees: Number of interaction partners per vertex
+            condition_counts: Condition reports per vertex
+            top_vertices: Vertex IDs of the top hubs, most partners first
+            top_names: Display names of top_vertices
+            degree_histogram: Drugs per power-of-two degree bucket
+            totals: 'drugs', 'interactions' and 'conditions' counts
+        """
+        self.degrees = degrees
+        self.condition_counts = condition_counts
+        self.top_vertices = top_vertices
+        self.top_names = top_names
+        self.degree_histogram = degree_histogram
+        self.totals = totals
+        self.metadata: Dict[str, Any] = {}
+
+    @classmethod
+    def compute(
+        cls,
+        names: Sequence[str],
+        degrees: np.ndarray,
+        condition_counts: np.ndarray,
+        interactions: int,
+        conditions: int,
+        top_k: int = DEFAULT_TOP_K,
+    ) -> "GraphStatistics":
+        """
+        Rank hubs and bin degrees from per-vertex counts.
+
+        Args:
+            names: Vertex display names, indexed by vertex ID
+            degrees: Number of interaction partners per vertex
+            condition_counts: Condition reports per vertex
+            interactions: Number of edges
+            conditions: Number of distinct conditions
+            top_k: Number of hubs to rank
+
+        Returns:
+            GraphStatistics for the graph
+        """
+        degrees = np.asarray(degrees, dtype=np.int32)
+        condition_counts = np.asarray(condition_counts, dtype=np.int64)
+        top_k = min(top_k, len(degrees))
+        if top_k:
+            # Degree descending, then vertex ID, so ties rank stably
+            candidates = np.argpartition(-degrees, top_k - 1)[:top_k]
+            threshold = degrees[candidates].min()
+            candidates = np.flatnonzero(degrees >= threshold)
+            order = np.lexsort((candidates, -degrees[candidates]))
+            top_vertices = candidates[order][:top_k].astype(np.int32)
+        else:
+            top_vertices = np.zeros(0, dtype=np.int32)
+
+        return cls(
+            degrees=degrees,
+            condition_counts=condition_counts,
+            top_vertices=top_vertices,
+            top_names=[names[v] for v in top_vertices.tolist()],
+            degree_histogram=np.bincount(degree_buckets(degrees)).astype(np.int64),
+            totals={
+                "drugs": len(degrees),
+                "interactions": int(interactions),
+                "conditions": int(conditions),
+            },
+        )
+
+    def top_drugs(self, k: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the drugs with the most interaction partners.
+
+        Args:
+            k: Number of drugs (at most the number stored)
+
+        Returns:
+            List of dictionaries with keys: 'drug', 'interactions' and
+            'conditions', most partners first
+        """
+        vertices = self.top_vertices[:k].tolist()
+        return [
+            {
+                "drug": name,
+                "interactions": self.degrees.item(v),
+                "conditions": self.condition_counts.item(v),
+            }
+            for name, v in zip(self.top_names, vertices)
+        ]
+
+    def histogram(self) -> List[Dict[str, int]]:
+        """
+        Get the degree histogram.
+
+        Returns:
+            List of dictionaries with keys: 'min_degree', 'max_degree' and
+            'drugs', one per power-of-two bucket
+        """
+        buckets = []
+        for bucket, drugs in enumerate(self.degree_histogram.tolist()):
+            low = 0 if bucket == 0 else 1 << (bucket - 1)
+            high = 0 if bucket == 0 else (1 << bucket) - 1
+            buckets.append({"min_degree": low, "max_degree": high, "drugs": drugs})
+        return buckets
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """
+        Summarize the graph for display.
+
+        Args:
+            top: Number of hub drugs to include
+
+        Returns:
+            Dictionary with 'drugs', 'interactions', 'conditions',
+            'mean_degree', 'max_degree', 'isolated_drugs', 'top_drugs'
+            and 'degree_histogram'
+        """
+        drugs = self.totals["drugs"]
+        return {
+            **self.totals,
+            "mean_degree": float(self.degrees.mean()) if drugs else 0.0,
+            "max_degree": int(self.degrees.max()) if drugs else 0,
+            "isolated_drugs": int(self.degree_histogram[0]) if drugs else 0,
+            "top_drugs": self.top_drugs(top),
+            "degree_histogram": self.histogram(),
+        }
+
+    def save(self, filepath: str, metadata: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Write the statistics to an array file.
+
+        Args:
+            filepath: Output path
+            metadata: Optional JSON-serializable metadata
+
+        Returns:
+            Size of the written file in bytes
+        """
+        header = {
+            "version": STATS_VERSION,
+            "totals": self.totals,
+            "top_names": self.top_names,
+            "metadata": metadata or {},
+        }
+        arrays = {
+            "degrees": self.degrees,
+            "condition_counts": self.condition_counts,
+            "top_vertices": self.top_vertices,
+            "degree_histogram": self.degree_histogram,
+        }
+        return write_array_file(filepath, STATS_MAGIC, header, arrays)
+
+    @classmethod
+    def load(cls, filepath: str) -> "GraphStatistics":
+        """
+        Read statistics written by save().
+
+        Args:
+            filepath: Path to the statistics file
+
+        Returns:
+            GraphStatistics backed by the file's arrays
+
+        Raises:
+            SnapshotError: If the file is not a valid statistics file
+        """
+        header, arrays, _ = read_array_file(filepath, STATS_MAGIC, use_mmap=False)
+        if header.get("version") != STATS_VERSION:
+            raise SnapshotError(
+                f"Unsupported statistics version {header.get('version')} "
+                f"(expected {STATS_VERSION})"
+            )
+        statistics = cls(
+            degrees=arrays["degrees"],
+            condition_counts=arrays["condition_counts"],
+            top_vertices=arrays["top_vertices"],
+            top_names=header["top_names"],
+            degree_histogram=arrays["degree_histogram"],
+            totals=header["totals"],
+        )
+        statistics.metadata = header.get("metadata", {})
+        return statistics
+
+
+def load_or_compute_statistics(
+    filepath: str, stamp: List[List[Any]], graph, top_k: int = DEFAULT_TOP_K
+) -> GraphStatistics:
+    """
+    Read cached statistics, recomputing them if the graph's sources changed.
+
+    Args:
+        filepath: Path to the statistics file
+        stamp: source_stamp() of the files the graph was built from
+            (snapshot, delta log), taken before the graph was loaded so
+            statistics are never filed under a newer version of them
+        graph: Loaded DrugInteractionGraph or FrozenDrugGraph
+        top_k: Number of hubs to rank when recomputing
+
+    Returns:
+        GraphStatistics for the graph
+    """
+    if os.path.exists(filepath):
+        try:
+            cached = GraphStatistics.load(filepath)
+        except SnapshotError:
+            cached = None
+        # The counts guard against sources that changed after the graph loaded
+        if (
+            cached is not None
+            and cached.metadata.get("sources") == stamp
+            and cached.totals["drugs"] == graph.get_stats()["drugs"]
+            and cached.totals["interactions"] == len(graph)
+            and len(cached.top_vertices) >= min(top_k, cached.totals["drugs"])
+        ):
+            return cached
+
+    statistics = graph.compute_statistics(top_k)
+    try:
+        statistics.save(filepath, metadata={"sources": stamp})
+    except OSError as e:
+        print(f"⚠️ Could not cache graph statistics in '{filepath}': {e}")
+    return statistics
@@ -0,0 +1,269 @@
+"""
+Bounded indirect-interaction queries over adjacency rows.
+
+Answers "how are these two drugs connected?" without an LLM tool loop:
+
+- shared partners: drugs that interact with both, from one intersection of
+  the two sorted adjacency rows (exact, O(deg(a) + deg(b)))
+- shortest path: a bidirectional BFS limited in depth, in the number of
+  neighbors expanded per drug (fan-out) and in wall-clock time
+
+Hub drugs have thousands of partners, so the BFS never expands a full hub
+row: rows longer than the fan-out are sampled at an even stride. Results
+obtained under a limit are flagged as truncated, so "no path found" is
+only reported as definitive when nothing was cut.
+
+The functions work on vertex IDs and a row accessor, so they serve both
+the igraph-backed DrugInteractionGraph and the CSR-backed FrozenDrugGraph.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Longest path (in interactions) a query may ask for
+MAX_PATH_DEPTH = 4
+
+# Default query limits
+DEFAULT_PATH_DEPTH = 3
+DEFAULT_MAX_FANOUT = 200
+DEFAULT_TIME_BUDGET = 0.05
+
+# Marks vertices not yet reached in the BFS depth arrays
+_UNSEEN = -1
+
+
+def sample_row(row: np.ndarray, max_fanout: int) -> np.ndarray:
+    """
+    Limit an adjacency row to at most max_fanout entries.
+
+    Long rows are sampled at an even stride rather than cut at the front,
+    so the sample is not biased towards low vertex IDs.
+
+    Args:
+        row: Neighbor vertex IDs
+        max_fanout: Maximum number of neighbors to keep
+
+    Returns:
+        The row itself, or an evenly spaced sample of it
+    """
+    if len(row) <= max_fanout:
+        return row
+    return row[:: -(-len(row) // max_fanout)]
+
+
+def shared_partners(row1: np.ndarray, row2: np.ndarray, exclude=()) -> np.ndarray:
+    """
+    Find the vertices adjacent to both of two vertices.
+
+    Args:
+        row1: Neighbor vertex IDs of the first vertex
+        row2: Neighbor vertex IDs of the second vertex
+        exclude: Vertex IDs to leave out (the two query vertices)
+
+    Returns:
+        Sorted vertex IDs present in both rows
+    """
+    common = np.intersect1d(row1, row2, assume_unique=True)
+    if len(exclude):
+        common = common[~np.isin(common, exclude)]
+    return common
+
+
+def bounded_shortest_path(
+    row: Callable[[int], np.ndarray],
+    vertex_count: int,
+    source: int,
+    target: int,
+    max_depth: int = DEFAULT_PATH_DEPTH,
+    max_fanout: int = DEFAULT_MAX_FANOUT,
+    deadline: Optional[float] = None,
+) -> Dict[str, object]:
+    """
+    Find a shortest path between two vertices with a bidirectional BFS.
+
+    The side with the smaller frontier is expanded one level at a time, so
+    both searches meet in the middle and each explores about half the
+    depth. The shortest meeting point found while expanding a level ends
+    the search.
+
+    Args:
+        row: Returns the neighbor vertex IDs of a vertex
+        vertex_count: Number of vertices in the graph
+        source: Start vertex ID
+        target: End vertex ID
+        max_depth: Longest path to look for, in edges
+        max_fanout: Maximum neighbors expanded per vertex
+        deadline: time.perf_counter() value after which the search stops
+
+    Returns:
+        Dictionary with 'path' (vertex IDs from source to target, or None)
+        and 'truncated' (True if a fan-out or time limit cut the search)
+    """
+    if source == target:
+        return {"path": [source], "truncated": False}
+
+    depths = [
+        np.full(vertex_count, _UNSEEN, dtype=np.int32),
+        np.full(vertex_count, _UNSEEN, dtype=np.int32),
+    ]
+    parents = [
+        np.full(vertex_count, _UNSEEN, dtype=np.int32),
+        np.full(vertex_count, _UNSEEN, dtype=np.int32),
+    ]
+    depths[0][source] = 0
+    depths[1][target] = 0
+    frontiers: List[List[int]] = [[source], [target]]
+    levels = [0, 0]
+    truncated = False
+
+    while levels[0] + levels[1] < max_depth and frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        own_depth, own_parent = depths[side], parents[side]
+        other_depth = depths[1 - side]
+        next_frontier: List[int] = []
+        meeting = None
+        meeting_length = None
+
+        for vertex in frontiers[side]:
+            if deadline is not None and time.perf_counter() > deadline:
+                truncated = True
+                break
+            neighbors = row(vertex)
+            if len(neighbors) > max_fanout:
+                neighbors = sample_row(neighbors, max_fanout)
+                truncated = True
+            fresh = neighbors[own_depth[neighbors] == _UNSEEN]
+            if not len(fresh):
+                continue
+            own_depth[fresh] = levels[side] + 1
+            own_parent[fresh] = vertex
+            next_frontier.extend(fresh.tolist())
+
+            reached = fresh[other_depth[fresh] != _UNSEEN]
+            if len(reached):
+                best = reached[np.argmin(other_depth[reached])]
+                length = levels[side] + 1 + int(other_depth[best])
+                if meeting_length is None or length < meeting_length:
+                    meeting, meeting_length = int(best), length
+
+        levels[side] += 1
+        frontiers[side] = next_frontier
+        if meeting is not None:
+            return {
+                "path": _join_path(parents, meeting, source, target),
+                "truncated": truncated,
+            }
+        if truncated and deadline is not None and time.perf_counter() > deadline:
+            break
+
+    return {"path": None, "truncated": truncated}
+
+
+def _join_path(parents: List[np.ndarray], meeting: int, source: int, target: int):
+    """Join the two BFS trees' parent chains at the meeting vertex."""
+    forward = [meeting]
+    while forward[-1] != source:
+        forward.append(int(parents[0][forward[-1]]))
+    backward = []
+    vertex = meeting
+    while vertex != target:
+        vertex = int(parents[1][vertex])
+        backward.append(vertex)
+    return forward[::-1] + backward
+
+
+def find_connection(
+    row: Callable[[int], np.ndarray],
+    vertex_count: int,
+    source: int,
+    target: int,
+    limit: int = 20,
+    max_depth: int = DEFAULT_PATH_DEPTH,
+    max_fanout: int = DEFAULT_MAX_FANOUT,
+    time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+) -> Dict[str, object]:
+    """
+    Describe how two vertices are connected within a bounded search.
+
+    Direct interactions and shared partners are found exactly from the two
+    adjacency rows; only paths longer than two edges need the BFS.
+
+    Args:
+        row: Returns the sorted neighbor vertex IDs of a vertex
+        vertex_count: Number of vertices in the graph
+        source: First vertex ID
+        target: Second vertex ID
+        limit: Maximum number of shared partner IDs to return
+        max_depth: Longest path to look for, in edges (capped at
+            MAX_PATH_DEPTH)
+        max_fanout: Maximum neighbors expanded per vertex in the BFS
+        time_budget: Seconds the query may spend (None for no limit)
+
+    Returns:
+        Dictionary with 'source', 'target', 'direct' (bool), 'shared_count'
+        (int), 'shared' (up to limit shared partner IDs, in vertex order),
+        'path' (vertex IDs or None), 'truncated' (bool) and 'elapsed_ms'
+        (float)
+    """
+    started = time.perf_counter()
+    deadline = None if time_budget is None else started + time_budget
+    max_depth = max(1, min(max_depth, MAX_PATH_DEPTH))
+
+    row1, row2 = row(source), row(target)
+    index = np.searchsorted(row1, target)
+    direct = bool(index < len(row1) and row1[index] == target)
+    common = shared_partners(row1, row2, exclude=(source, target))
+
+    path = None
+    truncated = False
+    if direct:
+        path = [source, target]
+    elif len(common) and max_depth >= 2:
+        path = [source, int(common[0]), target]
+    elif max_depth >= 3 and len(row1) and len(row2):
+        found = bounded_shortest_path(
+            row, vertex_count, source, target, max_depth, max_fanout, deadline
+        )
+        path, truncated = found["path"], found["truncated"]
+
+    return {
+        "source": source,
+        "target": target,
+        "direct": direct,
+        "shared_count": len(common),
+        "shared": common[:limit].tolist(),
+        "path": path,
+        "truncated": truncated,
+        "elapsed_ms": (time.perf_counter() - started) * 1000,
+    }
+
+
+def name_connection(
+    connection: Dict[str, object], name: Callable[[int], str]
+) -> Dict[str, object]:
+    """
+    Replace the vertex IDs in a find_connection result with drug names.
+
+    Args:
+        connection: Result of find_connection
+        name: Returns the display name of a vertex ID
+
+    Returns:
+        Dictionary with 'drug1', 'drug2', 'direct', 'shared_partner_count',
+        'shared_partners', 'path', 'distance' (edges on the path, or None),
+        'truncated' and 'elapsed_ms'
+    """
+    path = connection["path"]
+    return {
+        "drug1": name(connection["source"]),
+        "drug2": name(connection["target"]),
+        "direct": connection["direct"],
+        "shared_partner_count": connection["shared_count"],
+        "shared_partners": [name(v) for v in connection["shared"]],
+        "path": [name(v) for v in path] if path else None,
+        "distance": len(path) - 1 if path else None,
+        "truncated": connection["truncated"],
+        "elapsed_ms": round(connection["elapsed_ms"], 3),
+    }
@@ -6,9 +6,325 @@ using the igraph library.
 """
 
 import igraph as ig
+import numpy as np
 import csv
+import itertools
 import json
-from typing import Optional, List, Dict, Tuple, Any
+import os
+import sys
+import time
+from array import array
+from typing import Optional, List, Dict, Tuple, Any, Sequence, Iterable
+
+from drug_condition_index import ConditionIndex
+from drug_graph_delta import DeltaLog, DeltaRecord
+from drug_graph_engine import CONDITION_SEPARATOR, FrozenDrugGraph, PairKeyIndex
+from drug_graph_ingest import parse_csv_parallel
+from drug_graph_json import iter_json_records
+from drug_graph_layout import (
+    DEFAULT_MAX_NODES,
+    LAYOUT_CACHE_DIR,
+    WEBGL_MIN_EDGES,
+    cached_layout,
+    edge_coordinates,
+    select_vertices,
+)
+from drug_graph_parquet import PARQUET_BATCH_SIZE, read_parquet_batches, write_parquet
+from drug_graph_snapshot import (
+    is_snapshot,
+    pack_condition_ids,
+    read_snapshot,
+    unpack_condition_ids,
+    write_snapshot,
+)
+from drug_graph_stats import DEFAULT_TOP_K, GraphStatistics
+from drug_graph_traversal import (
+    DEFAULT_MAX_FANOUT,
+    DEFAULT_PATH_DEPTH,
+    DEFAULT_TIME_BUDGET,
+    find_connection,
+    name_connection,
+)
+
+# Number of parsed CSV rows held in memory at once during streaming ingestion
+CSV_CHUNK_SIZE = 50_000
+
+# Number of parsed JSON records held in memory at once during streaming ingestion
+JSON_CHUNK_SIZE = 50_000
+
+
+class _InteractionGraphBuilder:
+    """
+    Accumulates drugs and interactions for a single bulk igraph construction.
+
+    Vertices are keyed by normalized name and edges by a packed vertex pair,
+    so repeated rows cost a dict lookup instead of an igraph edge query.
+    Conditions are interned into a vocabulary and every row is recorded as
+    an (edge, condition ID) pair in two packed arrays; duplicates are
+    removed once, in build().
+    """
+
+    def __init__(self, base: Optional["DrugInteractionGraph"] = None):
+        """
+        Initialize the builder, optionally seeded with an existing graph.
+
+        Args:
+            base: Graph whose drugs and interactions should be kept
+        """
+        self.names: List[str] = []
+        self.normalized_names: List[str] = []
+        self.name_to_vertex: Dict[str, int] = {}
+        self.conditions: List[str] = []
+        self.condition_to_id: Dict[str, int] = {}
+        self.pair_to_edge: Dict[int, int] = {}
+        # Sorted copy of pair_to_edge, built on first use by add_encoded
+        self._pair_keys = np.zeros(0, dtype=np.int64)
+        self._pair_positions = np.zeros(0, dtype=np.int64)
+        self.sources: List[int] = []
+        self.targets: List[int] = []
+        self.row_edges = array("I")
+        self.row_conditions = array("I")
+
+        if base is not None:
+            self.conditions = list(base._conditions)
+            self.condition_to_id = dict(base._condition_to_id)
+        if base is not None and base.graph.vcount() > 0:
+            self.names = list(base.graph.vs["name"])
+            self.normalized_names = list(base.graph.vs["name_normalized"])
+            self.name_to_vertex = dict(base._name_to_vertex)
+            for v1, v2 in base.graph.get_edgelist():
+                self._add_edge(v1, v2, None)
+            if base.graph.ecount() > 0:
+                offsets, condition_ids = pack_condition_ids(
+                    base.graph.es["condition_ids"]
+                )
+                edges = np.repeat(
+                    np.arange(base.graph.ecount(), dtype=np.uint32), np.diff(offsets)
+                )
+                self.row_edges.frombytes(edges.tobytes())
+                self.row_conditions.frombytes(condition_ids.astype(np.uint32).tobytes())
+
+    def vertex(self, drug_name: str) -> int:
+        """Return the vertex ID for a drug name, registering it if new."""
+        normalized = drug_name.strip().lower()
+        vertex_id = self.name_to_vertex.get(normalized)
+        if vertex_id is None:
+            vertex_id = len(self.names)
+            self.name_to_vertex[normalized] = vertex_id
+            self.names.append(drug_name.strip())
+            self.normalized_names.append(normalized)
+        return vertex_id
+
+    def _add_edge(self, v1: int, v2: int, condition: Optional[str]) -> None:
+        """Record an edge and, if given, one more condition for it."""
+        key = (v1 << 32) | v2 if v1 <= v2 else (v2 << 32) | v1
+        position = self.pair_to_edge.get(key)
+        if position is None:
+            position = self.pair_to_edge[key] = len(self.sources)
+            self.sources.append(v1)
+            self.targets.append(v2)
+
+        if condition:
+            self.row_edges.append(position)
+            self.row_conditions.append(self._condition_id(condition))
+
+    def add(self, drug1: str, drug2: str, condition: Optional[str]) -> None:
+        """
+        Add one interaction row.
+
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+            condition: Interaction condition/effect
+        """
+        self._add_edge(self.vertex(drug1), self.vertex(drug2), condition)
+
+    @staticmethod
+    def _encoded_ids(columns, rows: np.ndarray, intern) -> List[np.ndarray]:
+        """
+        Map dictionary-encoded columns to IDs, interning in order of first use.
+
+        Entries are passed to intern() in the order a row-by-row load would
+        see them (by row, then column), so IDs and display names match.
+
+        Args:
+            columns: (dictionary, codes) pairs; codes are -1 for nulls
+            rows: Boolean mask of the rows to map
+            intern: Returns the ID of a dictionary value, registering it
+
+        Returns:
+            ID per selected row for each column (-1 for null or empty values)
+        """
+        first_uses = []
+        for column, (dictionary, codes) in enumerate(columns):
+            selected = codes[rows]
+            # Scatter row numbers in reverse so each code keeps its first row
+            first_rows = np.full(len(dictionary) + 1, len(selected), dtype=np.int64)
+            first_rows[selected[::-1]] = np.arange(len(selected) - 1, -1, -1)
+            used = np.flatnonzero(first_rows[:-1] < len(selected))
+            first_rows = first_rows[used]
+            first_uses.extend(
+                (row, column, code)
+                for code, row in zip(used.tolist(), first_rows.tolist())
+                if dictionary[code]
+            )
+
+        # One extra -1 slot, selected by null codes
+        tables = [
+            np.full(len(dictionary) + 1, -1, dtype=np.int64)
+            for dictionary, _ in columns
+        ]
+        for _, column, code in sorted(first_uses):
+            tables[column][code] = intern(columns[column][0][code])
+        return [table[codes[rows]] for table, (_, codes) in zip(tables, columns)]
+
+    def _condition_id(self, condition: str) -> int:
+        """Return the vocabulary ID of a condition, adding it if new."""
+        condition_id = self.condition_to_id.get(condition)
+        if condition_id is None:
+            condition_id = len(self.conditions)
+            self.condition_to_id[condition] = condition_id
+            self.conditions.append(condition)
+        return condition_id
+
+    def _sorted_pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the recorded pair keys in sorted order with their edge positions.
+
+        The arrays mirror pair_to_edge for vectorized lookups in
+        add_encoded, and are rebuilt when add() has recorded pairs since.
+        """
+        if len(self._pair_keys) != len(self.pair_to_edge):
+            keys = np.fromiter(self.pair_to_edge.keys(), dtype=np.int64)
+            positions = np.fromiter(self.pair_to_edge.values(), dtype=np.int64)
+            order = np.argsort(keys)
+            self._pair_keys, self._pair_positions = keys[order], positions[order]
+        return self._pair_keys, self._pair_positions
+
+    def add_encoded(
+        self,
+        drug1_dictionary: Sequence[Optional[str]],
+        drug1_codes: np.ndarray,
+        drug2_dictionary: Sequence[Optional[str]],
+        drug2_codes: np.ndarray,
+        condition_dictionary: Sequence[Optional[str]] = (),
+        condition_codes: Optional[np.ndarray] = None,
+    ) -> int:
+        """
+        Add a batch of dictionary-encoded interaction rows.
+
+        Each column is a dictionary of distinct values plus one integer code
+        per row (-1 for null). Names and conditions are resolved once per
+        dictionary entry and edges once per distinct pair in the batch; the
+        rows themselves are only handled as arrays. The result matches
+        calling add() once per row.
+
+        Args:
+            drug1_dictionary: Distinct first drug names
+            drug1_codes: Index into drug1_dictionary per row
+            drug2_dictionary: Distinct second drug names
+            drug2_codes: Index into drug2_dictionary per row
+            condition_dictionary: Distinct conditions
+            condition_codes: Index into condition_dictionary per row, or
+                None if there is no condition column
+
+        Returns:
+            Number of rows added (rows missing a drug name are skipped)
+        """
+        drug1_codes = np.asarray(drug1_codes, dtype=np.int64)
+        drug2_codes = np.asarray(drug2_codes, dtype=np.int64)
+        present1 = np.array([bool(name) for name in drug1_dictionary] + [False])
+        present2 = np.array([bool(name) for name in drug2_dictionary] + [False])
+        valid = present1[drug1_codes] & present2[drug2_codes]
+        if not valid.any():
+            return 0
+        v1, v2 = self._encoded_ids(
+            [(drug1_dictionary, drug1_codes), (drug2_dictionary, drug2_codes)],
+            valid,
+            self.vertex,
+        )
+
+        # Distinct pairs in order of first appearance, like row-by-row adds
+        keys = (np.minimum(v1, v2) << 32) | np.maximum(v1, v2)
+        unique_keys, first_rows, inverse = np.unique(
+            keys, return_index=True, return_inverse=True
+        )
+        known_keys, known_positions = self._sorted_pairs()
+        slots = np.searchsorted(known_keys, unique_keys)
+        found = np.full(len(unique_keys), -1, dtype=np.int64)
+        if len(known_keys):
+            hits = slots < len(known_keys)
+            hits[hits] = known_keys[slots[hits]] == unique_keys[hits]
+            found[hits] = known_positions[slots[hits]]
+
+        # New edges are numbered in order of first appearance
+        new = np.flatnonzero(found < 0)
+        new = new[np.argsort(first_rows[new], kind="stable")]
+        found[new] = np.arange(len(self.sources), len(self.sources) + len(new))
+        new_rows = first_rows[new]
+        self.sources.extend(v1[new_rows].tolist())
+        self.targets.extend(v2[new_rows].tolist())
+        self.pair_to_edge.update(zip(unique_keys[new].tolist(), found[new].tolist()))
+        # unique_keys is sorted, so the slots of new keys are ascending
+        inserted = np.sort(new)
+        self._pair_keys = np.insert(known_keys, slots[inserted], unique_keys[inserted])
+        self._pair_positions = np.insert(
+            known_positions, slots[inserted], found[inserted]
+        )
+
+        if condition_codes is not None:
+            (row_conditions,) = self._encoded_ids(
+                [(condition_dictionary, np.asarray(condition_codes, dtype=np.int64))],
+                valid,
+                self._condition_id,
+            )
+            has_condition = row_conditions >= 0
+            self.row_edges.frombytes(
+                found[inverse.reshape(-1)][has_condition].astype(np.uint32).tobytes()
+            )
+            self.row_conditions.frombytes(
+                row_conditions[has_condition].astype(np.uint32).tobytes()
+            )
+        return len(v1)
+
+    def _edge_condition_ids(self) -> List[array]:
+        """
+        Deduplicate the recorded rows into one condition ID array per edge.
+
+        Conditions keep the order in which they were first seen for an edge.
+        """
+        edges = np.frombuffer(self.row_edges, dtype=np.uint32).astype(np.uint64)
+        condition_ids = np.frombuffer(self.row_conditions, dtype=np.uint32)
+        keys = (edges << np.uint64(32)) | condition_ids
+        _, first_rows = np.unique(keys, return_index=True)
+        first_rows.sort()
+        order = np.argsort(edges[first_rows], kind="stable")
+        unique_rows = first_rows[order]
+
+        offsets = np.zeros(len(self.sources) + 1, dtype=np.int64)
+        counts = np.bincount(
+            edges[unique_rows].astype(np.int64), minlength=len(self.sources)
+        )
+        np.cumsum(counts, out=offsets[1:])
+        return unpack_condition_ids(offsets, condition_ids[unique_rows])
+
+    def build(self) -> ig.Graph:
+        """
+        Create the igraph in one call with all attributes assigned in bulk.
+
+        Returns:
+            Undirected igraph.Graph with name, name_normalized and
+            condition_ids (array('I') per edge, indexing self.conditions)
+        """
+        graph = ig.Graph(
+            n=len(self.names),
+            edges=list(zip(self.sources, self.targets)),
+            directed=False,
+        )
+        graph.vs["name"] = self.names
+        graph.vs["name_normalized"] = self.normalized_names
+        graph.es["condition_ids"] = self._edge_condition_ids()
+        return graph
 
 
 class DrugInteractionGraph:
@@ -17,15 +333,33 @@ class DrugInteractionGraph:
 
     Uses igraph.Graph for efficient graph operations with:
     - Vertices: Drug nodes with name attributes
-    - Edges: Undirected edges with condition attributes
+    - Edges: Undirected edges whose condition_ids attribute is a packed
+      array('I') of indexes into a shared condition vocabulary, so each
+      distinct condition string is stored once however many pairs report it
     - Auxiliary index for O(1) drug name lookups
     """
 
     def __init__(self, filepath: Optional[str] = None):
-        """Initialize an empty drug interaction graph."""
-        if filepath:
+        """
+        Initialize a drug interaction graph.
+
+        Args:
+            filepath: Optional binary snapshot or igraph-readable file
+                (e.g. GraphML) to load. An empty graph is created if omitted.
+        """
+        # Condition vocabulary: condition ID -> text and text -> condition ID
+        self._conditions: List[str] = []
+        self._condition_to_id: Dict[str, int] = {}
+        # Derived structures built on first use and cleared by every change
+        self._statistics: Optional[GraphStatistics] = None
+        self._condition_index: Optional[ConditionIndex] = None
+
+        if filepath and is_snapshot(filepath):
+            self.load_snapshot(filepath)
+        elif filepath:
             self.graph = ig.read(filepath)
             self._load_name_to_vertex()
+            self._load_condition_ids()
         else:
             self.graph = ig.Graph(directed=False)
             self.graph.vs["name"] = []
@@ -35,9 +369,46 @@ class DrugInteractionGraph:
 
     def _load_name_to_vertex(self) -> None:
         """Load the name_to_vertex dictionary from the graph."""
-        self._name_to_vertex = {}
-        for v in self.graph.vs:
-            self._name_to_vertex[v["name_normalized"]] = v.index
+        normalized = self.graph.vs["name_normalized"] if self.graph.vcount() else []
+        self._name_to_vertex = dict(zip(normalized, range(len(normalized))))
+
+    def _load_condition_ids(self) -> None:
+        """
+        Convert imported text condition attributes to the condition vocabulary.
+
+        Reads the JSON 'conditions' list written by export_to_graphml, or a
+        single 'condition' string per edge from older files.
+        """
+        attributes = self.graph.es.attributes()
+        if "conditions" in attributes:
+            per_edge = [
+                json.loads(text) if text else [] for text in self.graph.es["conditions"]
+            ]
+        elif "condition" in attributes:
+            per_edge = [[text] if text else [] for text in self.graph.es["condition"]]
+        else:
+            per_edge = [[] for _ in range(self.graph.ecount())]
+
+        self.graph.es["condition_ids"] = [
+            array("I", [self._intern_condition(text) for text in conditions])
+            for conditions in per_edge
+        ]
+        for name in ("condition", "conditions"):
+            if name in attributes:
+                del self.graph.es[name]
+
+    def _intern_condition(self, condition: str) -> int:
+        """Return the vocabulary ID of a condition, adding it if new."""
+        condition_id = self._condition_to_id.get(condition)
+        if condition_id is None:
+            condition_id = self._condition_to_id[condition] = len(self._conditions)
+            self._conditions.append(condition)
+        return condition_id
+
+    def _decode_conditions(self, condition_ids: Optional[Sequence[int]]) -> List[str]:
+        """Map an edge's condition IDs back to condition strings."""
+        conditions = self._conditions
+        return [conditions[c] for c in condition_ids] if condition_ids else []
 
     def _normalize_name(self, name: str) -> str:
         """Normalize drug name for case-insensitive searching."""
@@ -67,87 +438,491 @@ class DrugInteractionGraph:
 
         return vertex_id
 
-    def add_interaction(self, drug1: str, drug2: str, condition: str) -> None:
+    def _invalidate_caches(self) -> None:
+        """Drop the statistics and condition index derived from the graph."""
+        self._statistics = None
+        self._condition_index = None
+
+    def _adopt(self, builder: _InteractionGraphBuilder) -> None:
+        """Replace the graph and name index with the output of a bulk build."""
+        self._invalidate_caches()
+        self.graph = builder.build()
+        self._name_to_vertex = builder.name_to_vertex
+        self._conditions = builder.conditions
+        self._condition_to_id = builder.condition_to_id
+
+    def add_interaction(self, drug1: str, drug2: str, condition: Optional[str]) -> None:
         """
         Add a drug-drug interaction to the graph.
 
-        If the interaction already exists, updates the condition.
+        If the interaction already exists, the condition is added to its
+        condition set (conditions already recorded for the pair are kept).
 
         Args:
             drug1: First drug name
             drug2: Second drug name
             condition: Interaction condition/effect
         """
+        self._invalidate_caches()
         v1 = self._get_or_create_vertex(drug1)
         v2 = self._get_or_create_vertex(drug2)
+        condition_ids = array("I")
+        if condition:
+            condition_ids.append(self._intern_condition(condition))
 
         # Check if edge already exists
         edge_id = self.graph.get_eid(v1, v2, error=False)
 
         if edge_id == -1:
             # Create new edge
-            self.graph.add_edge(v1, v2, condition=condition)
-        else:
-            # Update existing edge condition
-            self.graph.es[edge_id]["condition"] = condition
+            self.graph.add_edge(v1, v2, condition_ids=condition_ids)
+            return
+
+        existing = self.graph.es[edge_id]["condition_ids"]
+        if existing is None:
+            self.graph.es[edge_id]["condition_ids"] = condition_ids
+        elif condition_ids and condition_ids[0] not in existing:
+            existing.append(condition_ids[0])
+
+    def update_interaction(
+        self, drug1: str, drug2: str, conditions: Sequence[str]
+    ) -> None:
+        """
+        Replace the conditions of an interaction, creating it if needed.
 
-    def load_from_csv(self, filepath: str) -> int:
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+            conditions: New interaction conditions
+        """
+        self.apply_deltas([DeltaRecord("update", drug1, drug2, conditions)])
+
+    def remove_interaction(
+        self, drug1: str, drug2: str, condition: Optional[str] = None
+    ) -> bool:
+        """
+        Remove an interaction, or a single condition from it.
+
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+            condition: Only remove this condition (the whole interaction if None)
+
+        Returns:
+            True if the drugs interacted before the call
+        """
+        v1 = self._name_to_vertex.get(self._normalize_name(drug1))
+        v2 = self._name_to_vertex.get(self._normalize_name(drug2))
+        if v1 is None or v2 is None or self.graph.get_eid(v1, v2, error=False) == -1:
+            return False
+        conditions = [condition] if condition else None
+        self.apply_deltas([DeltaRecord("remove", drug1, drug2, conditions)])
+        return True
+
+    def apply_deltas(self, records: Iterable[DeltaRecord]) -> int:
+        """
+        Apply add/update/remove records to the graph in one batch.
+
+        Records are first folded into the final condition set of every pair
+        they touch; the graph is then changed with one add_vertices, one
+        add_edges and one delete_edges call, so the cost grows with the
+        number of records rather than records x graph size. Drugs whose
+        interactions are all removed stay in the graph. New drugs enter the
+        name lookup only once the graph calls have succeeded, so a failure
+        part way never leaves names pointing at missing vertices.
+
+        Args:
+            records: Delta records, applied in order
+
+        Returns:
+            Number of records applied
+        """
+        self._invalidate_caches()
+        vertex_count = self.graph.vcount()
+        new_names: List[str] = []
+        new_vertices: Dict[str, int] = {}
+        # Pair key -> (existing edge ID or -1, final condition IDs or None)
+        pending: Dict[int, Tuple[int, Optional[List[int]]]] = {}
+        count = 0
+
+        for record in records:
+            count += 1
+            vertex_ids = []
+            for drug_name in (record.drug1, record.drug2):
+                normalized = self._normalize_name(drug_name)
+                vertex_id = self._name_to_vertex.get(normalized)
+                if vertex_id is None:
+                    vertex_id = new_vertices.get(normalized)
+                if vertex_id is None and record.op != "remove":
+                    vertex_id = vertex_count + len(new_names)
+                    new_vertices[normalized] = vertex_id
+                    new_names.append(drug_name.strip())
+                vertex_ids.append(vertex_id)
+            v1, v2 = vertex_ids
+            if v1 is None or v2 is None:
+                continue
+
+            key = (v1 << 32) | v2 if v1 <= v2 else (v2 << 32) | v1
+            if key in pending:
+                edge_id, current = pending[key]
+            else:
+                edge_id = -1
+                if v1 < vertex_count and v2 < vertex_count:
+                    edge_id = self.graph.get_eid(v1, v2, error=False)
+                current = None
+                if edge_id != -1:
+                    current = list(self.graph.es[edge_id]["condition_ids"] or [])
+
+            if record.op == "remove":
+                # Conditions outside the vocabulary are on no edge
+                lookup = self._condition_to_id
+                condition_ids = [lookup[c] for c in record.conditions if c in lookup]
+            else:
+                condition_ids = [self._intern_condition(c) for c in record.conditions]
+            if record.op == "add":
+                current = list(current or [])
+                current += [c for c in condition_ids if c not in current]
+            elif record.op == "update":
+                current = list(dict.fromkeys(condition_ids))
+            elif record.conditions and current is not None:
+                current = [c for c in current if c not in condition_ids]
+            else:
+                current = None
+            pending[key] = (edge_id, current)
+
+        if new_names:
+            self.graph.add_vertices(
+                len(new_names),
+                attributes={
+                    "name": new_names,
+                    "name_normalized": [name.lower() for name in new_names],
+                },
+            )
+
+        updated = [
+            (e, ids) for e, ids in pending.values() if e != -1 and ids is not None
+        ]
+        if updated:
+            self.graph.es[[e for e, _ in updated]]["condition_ids"] = [
+                array("I", ids) for _, ids in updated
+            ]
+
+        added = [
+            (key >> 32, key & 0xFFFFFFFF, ids)
+            for key, (e, ids) in pending.items()
+            if e == -1 and ids is not None
+        ]
+        if added:
+            self.graph.add_edges(
+                [(v1, v2) for v1, v2, _ in added],
+                attributes={"condition_ids": [array("I", ids) for _, _, ids in added]},
+            )
+
+        removed = [e for e, ids in pending.values() if e != -1 and ids is None]
+        if removed:
+            # Deleting renumbers later edges, so this must come last
+            self.graph.delete_edges(removed)
+
+        self._name_to_vertex.update(new_vertices)
+        return count
+
+    def apply_delta_log(self, filepath: str, offset: int = 0) -> int:
+        """
+        Apply the records of a delta log on top of the current graph.
+
+        Typically called right after loading the base snapshot.
+
+        Args:
+            filepath: Path to the delta log (a missing file means no changes)
+            offset: Byte offset of the first record to apply
+
+        Returns:
+            Number of records applied
+        """
+        start_time = time.perf_counter()
+        count = self.apply_deltas(
+            record for record, _ in DeltaLog(filepath).iter_records(offset)
+        )
+        if count:
+            self._report_load_rate(count, time.perf_counter() - start_time)
+        return count
+
+    def compact_delta_log(self, filepath: str, snapshot_path: str) -> int:
+        """
+        Fold a delta log into a new snapshot and drop the applied records.
+
+        The log is applied to this graph (replaying records that were already
+        applied is harmless), the snapshot is written atomically, and only
+        then are the applied records removed from the log. A crash at any
+        point leaves a base snapshot and log that load to the same graph.
+
+        Args:
+            filepath: Path to the delta log
+            snapshot_path: Path of the snapshot to write
+
+        Returns:
+            Number of records compacted
+        """
+        log = DeltaLog(filepath)
+        records, end = log.read()
+        self.apply_deltas(records)
+        self.save_snapshot(snapshot_path)
+        log.discard_before(end)
+        return len(records)
+
+    def load_from_csv(
+        self,
+        filepath: str,
+        bulk: bool = True,
+        chunk_size: int = CSV_CHUNK_SIZE,
+        workers: Optional[int] = 1,
+    ) -> int:
         """
         Load drug interactions from a CSV file.
 
         Expected CSV format: drug1,drug2,condition
         First row is treated as header and skipped.
 
+        The file is streamed in chunks of at most chunk_size parsed rows, so
+        peak memory does not grow with the file size. Progress is reported
+        from the byte offset into the file.
+
+        In bulk mode (the default) rows are collected into a vertex dictionary
+        and a deduplicated edge list, and the igraph is created with a single
+        add_vertices/add_edges step. Existing drugs and interactions are kept.
+        The result matches calling add_interaction once per row: every
+        distinct condition seen for a pair is kept.
+
+        With workers other than 1, the file is parsed by a process pool
+        instead (see drug_graph_ingest) and the workers' encoded rows are
+        merged into the bulk build; the resulting graph is the same.
+
         Args:
             filepath: Path to CSV file
+            bulk: Build the graph in one step instead of row by row
+            chunk_size: Maximum number of parsed rows held in memory
+            workers: Number of parsing processes (all cores if None)
 
         Returns:
             Number of interactions loaded
+
+        Raises:
+            ValueError: If workers is not 1 and bulk is False
         """
-        import sys
+        if workers != 1:
+            if not bulk:
+                raise ValueError("Parallel CSV loading requires bulk mode")
+            return self._load_csv_parallel(filepath, workers)
 
         count = 0
-        with open(filepath, "r", encoding="utf-8") as f:
-            reader = csv.DictReader(f)
-            rows = list(reader)
-            total = len(rows)
-            for i, row in enumerate(rows, 1):
-                # Accept both 'drug1' or 'drug_1' as column names for robustness
-                drug1 = row.get("drug1", row.get("drug_1"))
-                drug2 = row.get("drug2", row.get("drug_2"))
-                condition = row.get("condition")
-                self.add_interaction(drug1, drug2, condition)
-                count += 1
-                # Simple progress indicator (prints every 10 or last row)
-                if total > 20:
-                    if i % (total // 20) == 0 or i == total:
-                        progress = int(50 * i / total)
-                        bar = "#" * progress + "-" * (50 - progress)
-                        print(f"\rLoading CSV: [{bar}] {i}/{total}", end="")
-                        sys.stdout.flush()
-            if total > 20:
-                print()  # Move to next line after progress bar
+        start_time = time.perf_counter()
+        builder = _InteractionGraphBuilder(self) if bulk else None
+        add = builder.add if builder is not None else self.add_interaction
+        total_bytes = os.path.getsize(filepath)
+        progress_shown = False
+
+        with open(filepath, "rb") as raw:
+            reader = csv.reader(line.decode("utf-8") for line in raw)
+            header = next(reader, None)
+            if header is None:
+                return 0
+            drug1_col, drug2_col, condition_col = self._csv_columns(header)
+            width = max(drug1_col, drug2_col, condition_col)
+
+            while True:
+                chunk = list(itertools.islice(reader, chunk_size))
+                if not chunk:
+                    break
+                for row in chunk:
+                    if len(row) <= width:
+                        row = row + [""] * (width + 1 - len(row))
+                    drug1 = row[drug1_col]
+                    drug2 = row[drug2_col]
+                    if drug1 and drug2:
+                        condition = row[condition_col] if condition_col >= 0 else None
+                        add(drug1, drug2, condition)
+                        count += 1
+                del chunk
+
+                offset = raw.tell()
+                if progress_shown or offset < total_bytes:
+                    self._print_progress("Loading CSV", offset, total_bytes)
+                    progress_shown = True
+
+        if progress_shown:
+            print()  # Move to next line after progress bar
+
+        if builder is not None:
+            self._adopt(builder)
+
+        self._report_load_rate(count, time.perf_counter() - start_time)
         return count
 
-    def load_from_json(self, filepath: str) -> int:
+    def _load_csv_parallel(self, filepath: str, workers: Optional[int]) -> int:
         """
-        Load drug interactions from a JSON file.
+        Load a CSV file parsed by a process pool into one bulk build.
 
-        Expected JSON format: [{"drug1": "...", "drug2": "...", "condition": "..."}, ...]
+        Args:
+            filepath: Path to CSV file
+            workers: Number of parsing processes (all cores if None)
+
+        Returns:
+            Number of interactions loaded
+        """
+        start_time = time.perf_counter()
+        with open(filepath, "rb") as raw:
+            header_line = raw.readline()
+        header = next(csv.reader([header_line.decode("utf-8")]), None)
+        if header is None:
+            return 0
+        columns = self._csv_columns(header)
+
+        count = 0
+        done = len(header_line)
+        total_bytes = os.path.getsize(filepath)
+        builder = _InteractionGraphBuilder(self)
+        for part in parse_csv_parallel(filepath, done, columns, workers):
+            count += builder.add_encoded(
+                part["names"],
+                part["drug1_codes"],
+                part["names"],
+                part["drug2_codes"],
+                part["conditions"],
+                part["condition_codes"],
+            )
+            done += part["bytes"]
+            self._print_progress("Loading CSV", done, total_bytes)
+        if done > len(header_line):
+            print()  # Move to next line after progress bar
+
+        self._adopt(builder)
+        self._report_load_rate(count, time.perf_counter() - start_time)
+        return count
+
+    @staticmethod
+    def _csv_columns(header: List[str]) -> Tuple[int, int, int]:
+        """
+        Resolve the column positions of drug1, drug2 and condition.
+
+        Accepts both 'drug1' or 'drug_1' as column names for robustness.
+        A missing condition column is reported as -1.
+        """
+        columns = {name.strip(): i for i, name in enumerate(header)}
+        drug1_col = columns.get("drug1", columns.get("drug_1"))
+        drug2_col = columns.get("drug2", columns.get("drug_2"))
+        if drug1_col is None or drug2_col is None:
+            raise ValueError(
+                f"CSV header must contain drug1/drug2 columns, got: {header}"
+            )
+        return drug1_col, drug2_col, columns.get("condition", -1)
+
+    @staticmethod
+    def _print_progress(label: str, done: int, total: int) -> None:
+        """Print a single-line progress bar for a byte offset."""
+        fraction = done / total if total else 1.0
+        progress = int(50 * fraction)
+        bar = "#" * progress + "-" * (50 - progress)
+        print(f"\r{label}: [{bar}] {done / 1e6:.1f}/{total / 1e6:.1f} MB", end="")
+        sys.stdout.flush()
+
+    def _report_load_rate(self, rows: int, elapsed: float) -> None:
+        """Print the ingest throughput of a completed load."""
+        rate = rows / elapsed if elapsed > 0 else float("inf")
+        print(f"Loaded {rows} rows in {elapsed:.2f}s ({rate:,.0f} rows/s)")
+
+    def load_from_parquet(
+        self, filepath: str, batch_size: int = PARQUET_BATCH_SIZE
+    ) -> int:
+        """
+        Load drug interactions from a Parquet file.
+
+        Expected columns: drug1, drug2 and optionally condition (see
+        drug_graph_parquet). The string columns are read as dictionary
+        arrays in batches of batch_size rows and added to a bulk build from
+        their integer codes, without a Python object per row. Existing drugs
+        and interactions are kept, and the result matches load_from_csv on
+        the same rows.
 
         Args:
-            filepath: Path to JSON file
+            filepath: Path to Parquet file
+            batch_size: Maximum number of rows decoded at once
 
         Returns:
             Number of interactions loaded
         """
-        with open(filepath, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        count = 0
+        start_time = time.perf_counter()
+        builder = _InteractionGraphBuilder(self)
+        for drug1, drug2, condition in read_parquet_batches(filepath, batch_size):
+            conditions, condition_codes = condition or ((), None)
+            count += builder.add_encoded(*drug1, *drug2, conditions, condition_codes)
+        self._adopt(builder)
+
+        self._report_load_rate(count, time.perf_counter() - start_time)
+        return count
+
+    def load_from_json(
+        self,
+        filepath: str,
+        bulk: bool = True,
+        chunk_size: int = JSON_CHUNK_SIZE,
+        format: str = "auto",
+    ) -> int:
+        """
+        Load drug interactions from a JSON or NDJSON file.
 
+        Expected JSON format: [{"drug1": "...", "drug2": "...", "condition": "..."}, ...]
+        or the same objects one per line (NDJSON); 'auto' tells them apart
+        by the first character.
+
+        Records are parsed incrementally (see drug_graph_json) and consumed
+        in chunks of at most chunk_size, so peak memory does not grow with
+        the file size. As in load_from_csv, bulk mode collects the chunks
+        into a single igraph construction and keeps existing interactions;
+        records without both drug names are skipped.
+
+        Args:
+            filepath: Path to JSON or NDJSON file
+            bulk: Build the graph in one step instead of record by record
+            chunk_size: Maximum number of parsed records held in memory
+            format: 'auto', 'array' or 'ndjson'
+
+        Returns:
+            Number of interactions loaded
+        """
         count = 0
-        for item in data:
-            self.add_interaction(item["drug1"], item["drug2"], item["condition"])
-            count += 1
+        start_time = time.perf_counter()
+        builder = _InteractionGraphBuilder(self) if bulk else None
+        add = builder.add if builder is not None else self.add_interaction
+        total_bytes = os.path.getsize(filepath)
+        progress_shown = False
+
+        with open(filepath, "rb") as raw:
+            records = iter_json_records(raw, format)
+            while True:
+                chunk = list(itertools.islice(records, chunk_size))
+                if not chunk:
+                    break
+                for item in chunk:
+                    drug1 = item.get("drug1")
+                    drug2 = item.get("drug2")
+                    if drug1 and drug2:
+                        add(drug1, drug2, item.get("condition"))
+                        count += 1
+                del chunk
+
+                offset = raw.tell()
+                if progress_shown or offset < total_bytes:
+                    self._print_progress("Loading JSON", offset, total_bytes)
+                    progress_shown = True
+
+        if progress_shown:
+            print()  # Move to next line after progress bar
+
+        if builder is not None:
+            self._adopt(builder)
+
+        self._report_load_rate(count, time.perf_counter() - start_time)
         return count
 
     def search_interaction(self, drug1: str, drug2: str) -> Optional[str]:
@@ -159,7 +934,23 @@ class DrugInteractionGraph:
             drug2: Second drug name
 
         Returns:
-            Condition string if interaction exists, None otherwise
+            All conditions of the interaction joined with CONDITION_SEPARATOR,
+            or None if there is no interaction (or it has no condition)
+        """
+        conditions = self.get_interaction_conditions(drug1, drug2)
+        return CONDITION_SEPARATOR.join(conditions) if conditions else None
+
+    def get_interaction_conditions(self, drug1: str, drug2: str) -> List[str]:
+        """
+        Get every condition recorded for the interaction between two drugs.
+
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+
+        Returns:
+            Condition strings in the order they were first recorded
+            (empty if the drugs do not interact)
         """
         normalized1 = self._normalize_name(drug1)
         normalized2 = self._normalize_name(drug2)
@@ -169,7 +960,7 @@ class DrugInteractionGraph:
             normalized1 not in self._name_to_vertex
             or normalized2 not in self._name_to_vertex
         ):
-            return None
+            return []
 
         v1 = self._name_to_vertex[normalized1]
         v2 = self._name_to_vertex[normalized2]
@@ -178,69 +969,188 @@ class DrugInteractionGraph:
         edge_id = self.graph.get_eid(v1, v2, error=False)
 
         if edge_id == -1:
-            return None
+            return []
 
-        return self.graph.es[edge_id]["condition"]
+        return self._decode_conditions(self.graph.es[edge_id]["condition_ids"])
 
-    def search_all_interactions(self, drug1: str, drug2: str) -> List[Dict[str, str]]:
+    def _incident(self, vertex_id: int) -> Tuple[List[int], List[int]]:
         """
-        Search for all interactions between two drugs.
+        Get the neighbors of a vertex and the edges connecting them.
+
+        Both lists come from igraph's incidence index and are aligned, so
+        the cost is O(degree) rather than O(edges).
+
+        Returns:
+            Tuple of (neighbor vertex IDs, edge IDs)
         """
-        normalized1 = self._normalize_name(drug1)
-        normalized2 = self._normalize_name(drug2)
+        return self.graph.neighbors(vertex_id), self.graph.incident(vertex_id)
 
-        if (
-            normalized1 not in self._name_to_vertex
-            or normalized2 not in self._name_to_vertex
-        ):
-            return []
+    def search_all_interactions(self, drug1: str, drug2: str) -> List[Dict[str, str]]:
+        """
+        Search all interactions involving either of two drugs.
 
-        v1 = self._name_to_vertex[normalized1]
-        v2 = self._name_to_vertex[normalized2]
+        Uses the incidence lists of both drugs, so the cost is
+        O(deg(drug1) + deg(drug2)) instead of a scan over every edge.
+        The interaction between the two drugs themselves, if any, is listed
+        first and only once. Unknown drugs contribute no results.
+
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+
+        Returns:
+            List of dictionaries with keys: 'drug' (the queried drug),
+            'partner' (the interacting drug), 'condition' (all conditions
+            joined) and 'conditions' (list of conditions)
+        """
+        vertex_ids = self._resolve_vertices((drug1, drug2))
 
+        direct = []
         interactions = []
-        for e in self.graph.es:
-            if e.source == v1 or e.target == v2:
-                interactions.append(
-                    e["condition"],
-                )
-            elif e.source == v2 or e.target == v1:
-                interactions.append(
-                    e["condition"],
-                )
+        seen_edges = set()
+        for vertex_id in vertex_ids:
+            neighbors, edge_ids = self._incident(vertex_id)
+            if not edge_ids:
+                continue
+            drug = self.graph.vs[vertex_id]["name"]
+            partners = self.graph.vs[neighbors]["name"]
+            condition_ids = self.graph.es[edge_ids]["condition_ids"]
+            for neighbor_id, edge_id, partner, ids in zip(
+                neighbors, edge_ids, partners, condition_ids
+            ):
+                if edge_id in seen_edges:
+                    continue
+                seen_edges.add(edge_id)
+                conditions = self._decode_conditions(ids)
+                interaction = {
+                    "drug": drug,
+                    "partner": partner,
+                    "condition": CONDITION_SEPARATOR.join(conditions) or None,
+                    "conditions": conditions,
+                }
+                if neighbor_id in vertex_ids and neighbor_id != vertex_id:
+                    direct.append(interaction)
+                else:
+                    interactions.append(interaction)
+
+        return direct + interactions
+
+    def _resolve_vertices(self, drug_names: Sequence[str]) -> List[int]:
+        """Map drug names to distinct vertex IDs in input order, skipping unknowns."""
+        vertex_ids = []
+        for drug_name in drug_names:
+            vertex_id = self._name_to_vertex.get(self._normalize_name(drug_name))
+            if vertex_id is not None and vertex_id not in vertex_ids:
+                vertex_ids.append(vertex_id)
+        return vertex_ids
+
+    def vertex_ids(self, drug_names: Sequence[str]) -> np.ndarray:
+        """
+        Resolve many drug names to vertex IDs.
+
+        Args:
+            drug_names: Drug names (case-insensitive)
+
+        Returns:
+            int64 array of vertex IDs, -1 for unknown drugs
+        """
+        lookup = self._name_to_vertex.get
+        return np.fromiter(
+            (lookup(self._normalize_name(name), -1) for name in drug_names),
+            dtype=np.int64,
+            count=len(drug_names),
+        )
+
+    def build_pair_index(self) -> PairKeyIndex:
+        """
+        Build a sorted pair-key index for vectorized batch pair lookups.
+
+        Use it for screening large numbers of pairs, e.g.
+        index.lookup(graph.vertex_ids(drugs1), graph.vertex_ids(drugs2)).
+        The index reflects the graph at the time of the call; edge IDs are
+        igraph edge IDs.
+
+        Returns:
+            PairKeyIndex over the current edges
+        """
+        return PairKeyIndex.from_edges(
+            np.array(self.graph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+        )
+
+    def search_regimen_interactions(
+        self, drug_names: Sequence[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Find every interacting pair among a list of drugs in one pass.
 
+        The names are resolved once and the edges of the induced subgraph
+        are read from the incidence lists of the resolved drugs, so the cost
+        is O(sum of degrees) instead of one get_eid call per pair.
+
+        Args:
+            drug_names: Drugs in the regimen (unknown names are ignored)
+
+        Returns:
+            List of dictionaries with keys: 'drug1', 'drug2', 'condition'
+            (all conditions joined) and 'conditions' (list of conditions),
+            ordered by the position of the drugs in drug_names
+        """
+        vertex_ids = self._resolve_vertices(drug_names)
+        rank = {vertex_id: i for i, vertex_id in enumerate(vertex_ids)}
+
+        pairs = []
+        for vertex_id in vertex_ids:
+            neighbors, edge_ids = self._incident(vertex_id)
+            own_rank = rank[vertex_id]
+            for neighbor_id, edge_id in zip(neighbors, edge_ids):
+                # Report each pair once, from the drug listed first
+                if rank.get(neighbor_id, -1) > own_rank:
+                    pairs.append((own_rank, rank[neighbor_id], edge_id))
+        pairs.sort()
+
+        names = self.graph.vs[vertex_ids]["name"] if vertex_ids else []
+        condition_ids = (
+            self.graph.es[[edge_id for _, _, edge_id in pairs]]["condition_ids"]
+            if pairs
+            else []
+        )
+        interactions = []
+        for (i, j, _), ids in zip(pairs, condition_ids):
+            conditions = self._decode_conditions(ids)
+            interactions.append(
+                {
+                    "drug1": names[i],
+                    "drug2": names[j],
+                    "condition": CONDITION_SEPARATOR.join(conditions) or None,
+                    "conditions": conditions,
+                }
+            )
         return interactions
 
-        # edge_ids = self.graph.get_eids(v1, v2, error=False)
-        # interactions = []
-        # for edge_id in edge_ids:
-        #     interactions.append(
-        #         {
-        #             "drug": self.graph.vs[edge_id]["name"],
-        #             "condition": self.graph.es[edge_id]["condition"],
-        #         }
-        #     )
-
-        # return interactions
-
-        # edges = self.graph.es.select(_source=v1, _target=v2)
-        # return [
-        #     {
-        #         "drug": self.graph.vs[edge.target]["name"],
-        #         "condition": edge["condition"],
-        #     }
-        #     for edge in edges
-        # ]
-
-    def get_all_interactions_for_drug(self, drug_name: str) -> List[Dict[str, str]]:
+    def get_all_interactions_for_drug(
+        self,
+        drug_name: str,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        condition: Optional[str] = None,
+    ) -> List[Dict[str, str]]:
         """
         Get all interactions for a specific drug.
 
+        Reads the drug's incident edge list once and fetches partner names
+        and conditions with bulk attribute slicing, only for the requested
+        page. Use limit/offset to page through hub drugs.
+
         Args:
             drug_name: Name of the drug
+            limit: Maximum number of interactions to return (all if None)
+            offset: Number of interactions to skip
+            condition: Only include interactions with at least one condition
+                containing this text (case-insensitive)
 
         Returns:
-            List of dictionaries with keys: 'drug', 'condition'
+            List of dictionaries with keys: 'drug', 'condition' (all
+            conditions joined) and 'conditions' (list of conditions)
         """
         normalized = self._normalize_name(drug_name)
 
@@ -248,21 +1158,227 @@ class DrugInteractionGraph:
             return []
 
         vertex_id = self._name_to_vertex[normalized]
+        neighbors, edge_ids = self._incident(vertex_id)
+        stop = None if limit is None else offset + limit
+
+        if condition is None:
+            neighbors = neighbors[offset:stop]
+            edge_ids = edge_ids[offset:stop]
+            if not edge_ids:
+                return []
+            condition_ids = self.graph.es[edge_ids]["condition_ids"]
+        else:
+            # Test each distinct condition once instead of once per edge
+            needle = condition.strip().lower()
+            texts = self._conditions
+            is_match: Dict[int, bool] = {}
+            all_condition_ids = (
+                self.graph.es[edge_ids]["condition_ids"] if edge_ids else []
+            )
+            matches = []
+            for i, ids in enumerate(all_condition_ids):
+                for c in ids or ():
+                    if c not in is_match:
+                        is_match[c] = needle in texts[c].lower()
+                    if is_match[c]:
+                        matches.append(i)
+                        break
+            matches = matches[offset:stop]
+            if not matches:
+                return []
+            neighbors = [neighbors[i] for i in matches]
+            condition_ids = [all_condition_ids[i] for i in matches]
+
+        partner_names = self.graph.vs[neighbors]["name"]
+        interactions = []
+        for name, ids in zip(partner_names, condition_ids):
+            conditions = self._decode_conditions(ids)
+            interactions.append(
+                {
+                    "drug": name,
+                    "condition": CONDITION_SEPARATOR.join(conditions) or None,
+                    "conditions": conditions,
+                }
+            )
+        return interactions
+
+    def _row(self, vertex_id: int) -> np.ndarray:
+        """Return the sorted neighbor vertex IDs of a vertex."""
+        return np.array(self.graph.neighbors(vertex_id), dtype=np.int64)
+
+    def find_indirect_interactions(
+        self,
+        drug1: str,
+        drug2: str,
+        limit: int = 20,
+        max_depth: int = DEFAULT_PATH_DEPTH,
+        max_fanout: int = DEFAULT_MAX_FANOUT,
+        time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Describe how two drugs are connected through shared partners.
 
-        # Get all neighbors (connected drugs)
-        neighbors = self.graph.neighbors(vertex_id)
+        Shared partners come from one intersection of the two adjacency
+        lists; a longer path is searched with a depth-, fan-out- and
+        time-limited bidirectional BFS.
+
+        Args:
+            drug1: First drug name
+            drug2: Second drug name
+            limit: Maximum number of shared partners to list
+            max_depth: Longest path to look for, in interactions
+            max_fanout: Maximum partners expanded per drug in the BFS
+            time_budget: Seconds the path search may spend (None for no limit)
+
+        Returns:
+            Dictionary described in drug_graph_traversal.name_connection, or
+            None if either drug is unknown
+        """
+        v1 = self._name_to_vertex.get(self._normalize_name(drug1))
+        v2 = self._name_to_vertex.get(self._normalize_name(drug2))
+        if v1 is None or v2 is None:
+            return None
+        connection = find_connection(
+            self._row,
+            self.graph.vcount(),
+            v1,
+            v2,
+            limit=limit,
+            max_depth=max_depth,
+            max_fanout=max_fanout,
+            time_budget=time_budget,
+        )
+        return name_connection(connection, lambda v: self.graph.vs[v]["name"])
+
+    @property
+    def condition_index(self) -> ConditionIndex:
+        """Index from condition words to conditions and edges, built on first use."""
+        if self._condition_index is None:
+            offsets, condition_ids = pack_condition_ids(
+                self.graph.es["condition_ids"] if self.graph.ecount() else []
+            )
+            self._condition_index = ConditionIndex(
+                self._conditions, offsets, condition_ids
+            )
+        return self._condition_index
+
+    def search_by_condition(
+        self, query: str, limit: Optional[int] = 50, offset: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Find the interacting pairs whose conditions match a query.
+
+        Uses the condition index, so the cost depends on the posting lists
+        of the query terms rather than on the number of edges. Only the
+        requested page is decoded.
+
+        Args:
+            query: Words that must all occur in one of an interaction's
+                conditions ("qt prolonged"); "OR" separates alternatives and a trailing
+                "*" matches a prefix ("lactic acidosis OR hepatic fail*")
+            limit: Maximum number of interactions to return (all if None)
+            offset: Number of interactions to skip
+
+        Returns:
+            Dictionary with 'total' (number of matching interactions) and
+            'interactions', a list of dictionaries with keys: 'drug1',
+            'drug2', 'condition' (all conditions joined), 'conditions' and
+            'matched_conditions' (the conditions that match the query on
+            their own)
+        """
+        index = self.condition_index
+        matched_ids = index.matching_condition_ids(query)
+        edge_ids = index.edges_of_conditions(matched_ids)
+        stop = None if limit is None else offset + limit
+        page = edge_ids[offset:stop].tolist()
+        matched = set(matched_ids.tolist())
 
         interactions = []
-        for neighbor_id in neighbors:
-            edge_id = self.graph.get_eid(vertex_id, neighbor_id)
+        for edge in self.graph.es[page] if page else []:
+            ids = edge["condition_ids"]
+            conditions = self._decode_conditions(ids)
             interactions.append(
                 {
-                    "drug": self.graph.vs[neighbor_id]["name"],
-                    "condition": self.graph.es[edge_id]["condition"],
+                    "drug1": self.graph.vs[edge.source]["name"],
+                    "drug2": self.graph.vs[edge.target]["name"],
+                    "condition": CONDITION_SEPARATOR.join(conditions) or None,
+                    "conditions": conditions,
+                    "matched_conditions": [
+                        self._conditions[c] for c in ids or () if c in matched
+                    ],
                 }
             )
+        return {"total": len(edge_ids), "interactions": interactions}
 
-        return interactions
+    def degree(self, drug_name: str) -> int:
+        """
+        Get the number of drugs interacting with a drug.
+
+        Args:
+            drug_name: Name of the drug
+
+        Returns:
+            Number of interaction partners (0 if the drug is unknown)
+        """
+        vertex_id = self._name_to_vertex.get(self._normalize_name(drug_name))
+        if vertex_id is None:
+            return 0
+        return self.graph.degree(vertex_id)
+
+    def get_drug_degrees(self) -> Dict[str, int]:
+        """
+        Get every drug with its number of interaction partners.
+
+        Returns:
+            Dictionary mapping display names to degrees, in vertex order
+        """
+        if self.graph.vcount() == 0:
+            return {}
+        return dict(zip(self.graph.vs["name"], self.graph.degree()))
+
+    def compute_statistics(self, top_k: int = DEFAULT_TOP_K) -> GraphStatistics:
+        """
+        Compute per-drug degree and condition counts in one pass over the edges.
+
+        Args:
+            top_k: Number of hub drugs to rank
+
+        Returns:
+            GraphStatistics for this graph
+        """
+        vertex_count = self.graph.vcount()
+        edges = np.array(self.graph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+        per_edge = (
+            np.fromiter(
+                (len(ids or ()) for ids in self.graph.es["condition_ids"]),
+                dtype=np.int64,
+                count=len(edges),
+            )
+            if len(edges)
+            else np.zeros(0, dtype=np.int64)
+        )
+        condition_counts = np.bincount(
+            edges[:, 0], weights=per_edge, minlength=vertex_count
+        ) + np.bincount(edges[:, 1], weights=per_edge, minlength=vertex_count)
+        return GraphStatistics.compute(
+            self.graph.vs["name"] if vertex_count else [],
+            np.array(self.graph.degree(), dtype=np.int32),
+            condition_counts,
+            interactions=len(edges),
+            conditions=len(self._conditions),
+            top_k=top_k,
+        )
+
+    def get_statistics(self) -> GraphStatistics:
+        """
+        Get per-drug statistics, computed on first use after each change.
+
+        Returns:
+            GraphStatistics for the current graph
+        """
+        if self._statistics is None:
+            self._statistics = self.compute_statistics()
+        return self._statistics
 
     def get_stats(self) -> Dict[str, int]:
         """
@@ -273,14 +1389,204 @@ class DrugInteractionGraph:
         """
         return {"drugs": self.graph.vcount(), "interactions": self.graph.ecount()}
 
+    def save_snapshot(self, filepath: str) -> int:
+        """
+        Save the graph as a binary snapshot for fast cold starts.
+
+        The condition vocabulary is written once as a string table and each
+        edge stores only condition IDs, so the file grows with the number of
+        distinct conditions rather than the number of rows.
+
+        Args:
+            filepath: Path to output snapshot file
+
+        Returns:
+            Size of the snapshot in bytes
+        """
+        edges = np.array(self.graph.get_edgelist(), dtype=np.int32).reshape(-1, 2)
+        offsets, condition_ids = pack_condition_ids(
+            self.graph.es["condition_ids"] if self.graph.ecount() else []
+        )
+        names = self.graph.vs["name"] if self.graph.vcount() else []
+        return write_snapshot(
+            filepath, names, edges, self._conditions, offsets, condition_ids
+        )
+
+    def load_snapshot(self, filepath: str, verify: bool = True) -> None:
+        """
+        Replace the graph with the contents of a binary snapshot.
+
+        The file is memory-mapped and the graph is created in one step from
+        its arrays, so load time is dominated by reading the file.
+
+        Args:
+            filepath: Path to a snapshot written by save_snapshot
+            verify: Check the snapshot checksum before loading
+        """
+        snapshot = read_snapshot(filepath, verify=verify)
+        names = snapshot.names
+        normalized = [name.lower() for name in names]
+
+        graph = ig.Graph(n=len(names), edges=snapshot.edges.tolist(), directed=False)
+        graph.vs["name"] = names
+        graph.vs["name_normalized"] = normalized
+        graph.es["condition_ids"] = unpack_condition_ids(
+            snapshot.edge_condition_offsets, snapshot.edge_condition_ids
+        )
+
+        self.graph = graph
+        self._invalidate_caches()
+        self._name_to_vertex = dict(zip(normalized, range(len(normalized))))
+        self._conditions = snapshot.conditions
+        self._condition_to_id = {text: i for i, text in enumerate(snapshot.conditions)}
+
+    def freeze(self) -> FrozenDrugGraph:
+        """
+        Build a read-only, array-backed query engine from the current graph.
+
+        The engine answers search_interaction, get_all_interactions_for_drug
+        and get_stats from CSR adjacency arrays without igraph attribute
+        access. Later changes to this graph are not reflected in it.
+
+        Returns:
+            FrozenDrugGraph snapshot of this graph
+        """
+        return FrozenDrugGraph.from_graph(self)
+
     def export_to_graphml(self, filepath: str) -> None:
         """
         Export graph to GraphML format for visualization.
 
+        GraphML has no list type, so each edge is written with a readable
+        'condition' string (all conditions joined) and a 'conditions' JSON
+        list that DrugInteractionGraph reads back without loss.
+
         Args:
             filepath: Path to output GraphML file
         """
-        self.graph.write_graphml(filepath)
+        graph = self.graph.copy()
+        per_edge = [
+            self._decode_conditions(ids)
+            for ids in (graph.es["condition_ids"] if graph.ecount() else [])
+        ]
+        graph.es["condition"] = [CONDITION_SEPARATOR.join(c) for c in per_edge]
+        graph.es["conditions"] = [json.dumps(c, ensure_ascii=False) for c in per_edge]
+        del graph.es["condition_ids"]
+        graph.write_graphml(filepath)
+
+    def export_to_parquet(self, filepath: str, compression: str = "zstd") -> int:
+        """
+        Export the interactions to a dictionary-encoded Parquet file.
+
+        Writes one row per (interaction, condition) pair, with a null
+        condition for interactions that have none, so load_from_parquet
+        restores the same graph.
+
+        Args:
+            filepath: Path to output Parquet file
+            compression: Parquet compression codec
+
+        Returns:
+            Number of rows written
+        """
+        edges = np.array(self.graph.get_edgelist(), dtype=np.int32).reshape(-1, 2)
+        offsets, condition_ids = pack_condition_ids(
+            self.graph.es["condition_ids"] if self.graph.ecount() else []
+        )
+        names = self.graph.vs["name"] if self.graph.vcount() else []
+        return write_parquet(
+            filepath,
+            names,
+            edges,
+            self._conditions,
+            offsets,
+            condition_ids,
+            compression=compression,
+        )
+
+    def _render_view(
+        self,
+        highlight_drug: Optional[str],
+        layout: str,
+        max_nodes: int,
+        reduction: str,
+        layout_cache: Optional[str] = LAYOUT_CACHE_DIR,
+    ) -> Dict[str, Any]:
+        """
+        Reduce the graph to a renderable size and lay it out natively.
+
+        Args:
+            highlight_drug: Optional drug name to center the view on
+            layout: Layout name (see drug_graph_layout.compute_layout)
+            max_nodes: Maximum number of drugs to render
+            reduction: Reduction name (see drug_graph_layout.select_vertices)
+            layout_cache: Directory of cached layouts (None to disable)
+
+        Returns:
+            Dictionary with 'vertices' (vertex IDs of the rendered drugs),
+            'edges' (int array (M, 2) of positions in 'vertices'), 'pos'
+            (array (V, 2)), 'degrees' (full-graph degrees of 'vertices'),
+            'names', 'highlight' (position of the highlighted drug or None)
+            and 'partners' (bool mask of its interaction partners)
+        """
+        highlight_vertex_id = None
+        if highlight_drug:
+            normalized = self._normalize_name(highlight_drug)
+            highlight_vertex_id = self._name_to_vertex.get(normalized)
+
+        all_degrees = self.get_statistics().degrees
+        vertices = select_vertices(
+            self.graph, all_degrees, max_nodes, reduction, highlight_vertex_id
+        )
+        subgraph = self.graph.induced_subgraph(vertices.tolist())
+        edges = np.array(subgraph.get_edgelist(), dtype=np.int64).reshape(-1, 2)
+
+        highlight = None
+        partners = np.zeros(len(vertices), dtype=bool)
+        if highlight_vertex_id is not None:
+            highlight = int(np.searchsorted(vertices, highlight_vertex_id))
+            partners = np.isin(vertices, self._row(highlight_vertex_id))
+
+        return {
+            "vertices": vertices,
+            "edges": edges,
+            "pos": cached_layout(subgraph, layout, cache_dir=layout_cache),
+            "degrees": all_degrees[vertices],
+            "names": subgraph.vs["name"],
+            "highlight": highlight,
+            "partners": partners,
+        }
+
+    def _hover_texts(self, view: Dict[str, Any], partners: int = 5) -> List[str]:
+        """
+        Build the hover text of each rendered drug.
+
+        The partners of all rendered drugs are read in one neighborhood
+        query instead of one interaction lookup per drug.
+
+        Args:
+            view: Result of _render_view
+            partners: Number of interaction partners to list per drug
+
+        Returns:
+            HTML hover text per rendered drug
+        """
+        names = self.graph.vs["name"]
+        neighborhoods = self.graph.neighborhood(
+            view["vertices"].tolist(), order=1, mindist=1
+        )
+        texts = []
+        for drug_name, degree, neighbors in zip(
+            view["names"], view["degrees"].tolist(), neighborhoods
+        ):
+            text = f"<b>{drug_name}</b><br>Connections: {degree}<br><br>"
+            if neighbors:
+                text += "<b>Interactions:</b><br>"
+                text += "".join(f"• {names[v]}<br>" for v in neighbors[:partners])
+                if degree > partners:
+                    text += f"... and {degree - partners} more"
+            texts.append(text)
+        return texts
 
     def visualize(
         self,
@@ -289,127 +1595,104 @@ class DrugInteractionGraph:
         save_path: Optional[str] = None,
         figsize: Tuple[int, int] = (12, 10),
         show_labels: bool = True,
+        max_nodes: int = DEFAULT_MAX_NODES,
+        reduction: str = "auto",
+        layout_cache: Optional[str] = LAYOUT_CACHE_DIR,
     ) -> Any:
         """
         Visualize the drug interaction graph using matplotlib.
 
+        Large graphs are reduced to at most max_nodes drugs first: the
+        highlighted drug's ego network, or the best-connected drugs.
+
         Args:
             highlight_drug: Optional drug name to highlight with its connections
-            layout: Layout algorithm ('auto', 'circle', 'kamada_kawai', 'spring', 'random')
+            layout: Layout algorithm ('auto', 'circle', 'kamada_kawai', 'spring', 'random', 'drl')
             save_path: Optional path to save the visualization
             figsize: Figure size as (width, height)
             show_labels: Whether to show drug names as labels
+            max_nodes: Maximum number of drugs to draw
+            reduction: Reduction to max_nodes ('auto', 'ego', 'top_k', 'k_core', 'none')
+            layout_cache: Directory of cached layouts (None to disable)
 
         Returns:
             matplotlib figure object
         """
         try:
             import matplotlib.pyplot as plt
-            import networkx as nx
+            from matplotlib.collections import LineCollection
         except ImportError:
             raise ImportError(
-                "matplotlib and networkx are required for visualization. "
-                "Install with: pip install matplotlib networkx"
+                "matplotlib is required for visualization. "
+                "Install with: pip install matplotlib"
             )
 
-        # Convert igraph to networkx for easier matplotlib plotting
-        nx_graph = nx.Graph()
-
-        # Add nodes
-        for v in self.graph.vs:
-            nx_graph.add_node(v.index, name=v["name"])
-
-        # Add edges
-        for e in self.graph.es:
-            source, target = e.tuple
-            nx_graph.add_edge(source, target, condition=e["condition"])
+        view = self._render_view(
+            highlight_drug, layout, max_nodes, reduction, layout_cache
+        )
+        pos, degrees, highlight = view["pos"], view["degrees"], view["highlight"]
 
         # Create figure
         fig, ax = plt.subplots(figsize=figsize)
 
-        # Choose layout
-        if layout == "circle":
-            pos = nx.circular_layout(nx_graph)
-        elif layout == "kamada_kawai":
-            pos = nx.kamada_kawai_layout(nx_graph)
-        elif layout == "spring":
-            pos = nx.spring_layout(nx_graph, k=2, iterations=50)
-        elif layout == "random":
-            pos = nx.random_layout(nx_graph)
-        else:  # auto
-            pos = nx.spring_layout(nx_graph, k=1.5, iterations=50, seed=42)
-
         # Determine node colors
-        node_colors = []
-        node_sizes = []
-        highlight_vertex_id = None
-
-        if highlight_drug:
-            normalized = self._normalize_name(highlight_drug)
-            highlight_vertex_id = self._name_to_vertex.get(normalized)
-
-        for node in nx_graph.nodes():
-            if highlight_vertex_id is not None:
-                if node == highlight_vertex_id:
-                    node_colors.append("#FF4444")  # Red for highlighted drug
-                    node_sizes.append(1200)
-                elif node in nx_graph.neighbors(highlight_vertex_id):
-                    node_colors.append("#FFA500")  # Orange for connected drugs
-                    node_sizes.append(800)
-                else:
-                    node_colors.append("#B0B0B0")  # Gray for others
-                    node_sizes.append(400)
-            else:
-                # Color by degree (number of connections)
-                degree = nx_graph.degree(node)
-                if degree > 5:
-                    node_colors.append("#FF6B6B")
-                elif degree > 3:
-                    node_colors.append("#FFA500")
-                elif degree > 1:
-                    node_colors.append("#4ECDC4")
-                else:
-                    node_colors.append("#95E1D3")
-                node_sizes.append(300 + degree * 100)
+        if highlight is not None:
+            # Red for the highlighted drug, orange for connected drugs, gray for others
+            node_colors = np.where(view["partners"], "#FFA500", "#B0B0B0")
+            node_sizes = np.where(view["partners"], 800, 400)
+            node_colors[highlight] = "#FF4444"
+            node_sizes[highlight] = 1200
+        else:
+            # Color by degree (number of connections)
+            node_colors = np.select(
+                [degrees > 5, degrees > 3, degrees > 1],
+                ["#FF6B6B", "#FFA500", "#4ECDC4"],
+                "#95E1D3",
+            )
+            node_sizes = 300 + degrees * 100
 
         # Draw edges
-        nx.draw_networkx_edges(
-            nx_graph, pos, alpha=0.3, width=2, edge_color="#888888", ax=ax
+        ax.add_collection(
+            LineCollection(
+                pos[view["edges"]], colors="#888888", linewidths=2, alpha=0.3
+            )
         )
 
         # Draw nodes
-        nx.draw_networkx_nodes(
-            nx_graph,
-            pos,
-            node_color=node_colors,
-            node_size=node_sizes,
-            alpha=0.9,
-            ax=ax,
+        ax.scatter(
+            pos[:, 0], pos[:, 1], s=node_sizes, c=node_colors, alpha=0.9, zorder=2
         )
 
         # Draw labels
         if show_labels:
-            labels = {node: self.graph.vs[node]["name"] for node in nx_graph.nodes()}
-            nx.draw_networkx_labels(
-                nx_graph, pos, labels, font_size=8, font_weight="bold", ax=ax
-            )
+            for (x, y), name in zip(pos.tolist(), view["names"]):
+                ax.text(
+                    x,
+                    y,
+                    name,
+                    fontsize=8,
+                    fontweight="bold",
+                    ha="center",
+                    va="center",
+                    zorder=3,
+                )
 
         # Title
-        if highlight_drug:
-            ax.set_title(
-                f"Drug Interaction Network\nHighlighting: {highlight_drug}",
-                fontsize=16,
-                fontweight="bold",
-            )
-        else:
-            stats = self.get_stats()
-            ax.set_title(
-                f"Drug Interaction Network\n{stats['drugs']} drugs, {stats['interactions']} interactions",
-                fontsize=16,
-                fontweight="bold",
-            )
+        stats = self.get_stats()
+        shown = len(view["vertices"])
+        subtitle = (
+            f"Highlighting: {highlight_drug}"
+            if highlight_drug
+            else f"{stats['drugs']} drugs, {stats['interactions']} interactions"
+        )
+        if shown < stats["drugs"]:
+            subtitle += f" (showing {shown} drugs)"
+        ax.set_title(
+            f"Drug Interaction Network\n{subtitle}", fontsize=16, fontweight="bold"
+        )
 
         ax.axis("off")
+        ax.autoscale_view()
         plt.tight_layout()
 
         if save_path:
@@ -419,7 +1702,14 @@ class DrugInteractionGraph:
         return fig
 
     def visualize_interactive(
-        self, highlight_drug: Optional[str] = None, save_path: Optional[str] = None
+        self,
+        highlight_drug: Optional[str] = None,
+        save_path: Optional[str] = None,
+        layout: str = "auto",
+        max_nodes: int = DEFAULT_MAX_NODES,
+        reduction: str = "auto",
+        webgl: Optional[bool] = None,
+        layout_cache: Optional[str] = LAYOUT_CACHE_DIR,
     ) -> Any:
         """
         Create an interactive visualization using Plotly.
@@ -427,103 +1717,63 @@ class DrugInteractionGraph:
         Args:
             highlight_drug: Optional drug name to highlight with its connections
             save_path: Optional path to save the HTML file
+            layout: Layout algorithm (see visualize)
+            max_nodes: Maximum number of drugs to draw
+            reduction: Reduction to max_nodes (see visualize)
+            webgl: Draw with WebGL (Scattergl); by default when there are
+                at least WEBGL_MIN_EDGES edges
+            layout_cache: Directory of cached layouts (None to disable)
 
         Returns:
             plotly figure object
         """
         try:
             import plotly.graph_objects as go
-            import networkx as nx
         except ImportError:
             raise ImportError(
-                "plotly and networkx are required for interactive visualization. "
-                "Install with: pip install plotly networkx"
+                "plotly is required for interactive visualization. "
+                "Install with: pip install plotly"
             )
 
-        # Convert to networkx
-        nx_graph = nx.Graph()
-        for v in self.graph.vs:
-            nx_graph.add_node(v.index, name=v["name"])
-        for e in self.graph.es:
-            source, target = e.tuple
-            nx_graph.add_edge(source, target, condition=e["condition"])
-
-        # Layout
-        pos = nx.spring_layout(nx_graph, k=1.5, iterations=50, seed=42)
+        view = self._render_view(
+            highlight_drug, layout, max_nodes, reduction, layout_cache
+        )
+        pos, degrees, highlight = view["pos"], view["degrees"], view["highlight"]
+        if webgl is None:
+            webgl = len(view["edges"]) >= WEBGL_MIN_EDGES
+        scatter = go.Scattergl if webgl else go.Scatter
 
         # Create edge traces
-        edge_trace = go.Scatter(
-            x=[],
-            y=[],
+        edge_x, edge_y = edge_coordinates(pos, view["edges"])
+        edge_trace = scatter(
+            x=edge_x,
+            y=edge_y,
             line=dict(width=1, color="#888"),
             hoverinfo="none",
             mode="lines",
         )
 
-        for edge in nx_graph.edges():
-            x0, y0 = pos[edge[0]]
-            x1, y1 = pos[edge[1]]
-            edge_trace["x"] += (x0, x1, None)
-            edge_trace["y"] += (y0, y1, None)
-
         # Create node traces
-        highlight_vertex_id = None
-        if highlight_drug:
-            normalized = self._normalize_name(highlight_drug)
-            highlight_vertex_id = self._name_to_vertex.get(normalized)
-
-        node_x = []
-        node_y = []
-        node_text = []
-        node_color = []
-        node_size = []
-
-        for node in nx_graph.nodes():
-            x, y = pos[node]
-            node_x.append(x)
-            node_y.append(y)
-
-            drug_name = self.graph.vs[node]["name"]
-            degree = nx_graph.degree(node)
-            interactions = self.get_all_interactions_for_drug(drug_name)
-
-            hover_text = f"<b>{drug_name}</b><br>"
-            hover_text += f"Connections: {degree}<br><br>"
-            if interactions:
-                hover_text += "<b>Interactions:</b><br>"
-                for i, interaction in enumerate(interactions[:5]):
-                    hover_text += f"• {interaction['drug']}<br>"
-                if len(interactions) > 5:
-                    hover_text += f"... and {len(interactions) - 5} more"
-
-            node_text.append(hover_text)
-
-            # Color and size logic
-            if highlight_vertex_id is not None:
-                if node == highlight_vertex_id:
-                    node_color.append("#FF4444")
-                    node_size.append(30)
-                elif node in nx_graph.neighbors(highlight_vertex_id):
-                    node_color.append("#FFA500")
-                    node_size.append(20)
-                else:
-                    node_color.append("#B0B0B0")
-                    node_size.append(10)
-            else:
-                node_color.append(degree)
-                node_size.append(10 + degree * 2)
+        if highlight is not None:
+            node_color = np.where(view["partners"], "#FFA500", "#B0B0B0")
+            node_size = np.where(view["partners"], 20, 10)
+            node_color[highlight] = "#FF4444"
+            node_size[highlight] = 30
+        else:
+            node_color = degrees
+            node_size = 10 + degrees * 2
 
-        node_trace = go.Scatter(
-            x=node_x,
-            y=node_y,
+        node_trace = scatter(
+            x=pos[:, 0],
+            y=pos[:, 1],
             mode="markers+text",
             hoverinfo="text",
-            text=[self.graph.vs[node]["name"] for node in nx_graph.nodes()],
-            hovertext=node_text,
+            text=view["names"],
+            hovertext=self._hover_texts(view),
             textposition="top center",
             textfont=dict(size=8),
             marker=dict(
-                showscale=highlight_vertex_id is None,
+                showscale=highlight is None,
                 colorscale="YlOrRd",
                 size=node_size,
                 color=node_color,
@@ -61,7 +61,6 @@ def test_imports():
         ("openai", "openai"),
         ("fastapi", "fastapi"),
         ("rich", "rich"),
-        ("networkx", "networkx"),
         ("matplotlib", "matplotlib"),
     ]
 
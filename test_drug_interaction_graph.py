@@ -0,0 +1,1003 @@
+"""
+Tests for the DrugInteractionGraph data layer.
+
+Run with: python -m pytest -q test_drug_interaction_graph.py
+"""
+
+import csv
+import io
+import json
+import os
+import threading
+
+import igraph as ig
+import numpy as np
+import pytest
+
+from app.core.drug_name_index import (
+    AliasIndex,
+    PrefixIndex,
+    TrigramIndex,
+    edit_distance,
+)
+from app.core.graph_holder import GraphHolder
+from drug_graph_delta import DeltaLog, DeltaRecord
+from drug_graph_engine import FrozenDrugGraph
+from drug_graph_ingest import split_csv_ranges
+from drug_graph_json import iter_json_records
+import drug_graph_layout
+from drug_graph_layout import (
+    cached_layout,
+    compute_layout,
+    edge_coordinates,
+    layout_key,
+    select_vertices,
+)
+from drug_graph_shared import open_or_build_shared_graph, open_shared_graph
+from drug_graph_snapshot import SnapshotError, source_stamp
+from drug_graph_stats import GraphStatistics, load_or_compute_statistics
+from drug_interaction_graph import DrugInteractionGraph, _InteractionGraphBuilder
+
+SAMPLE_CSV = "sample_data.csv"
+
+
+def _write_csv(path, rows):
+    """Write interaction rows to a CSV file with the standard header."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["drug1", "drug2", "condition"])
+        writer.writerows(rows)
+    return str(path)
+
+
+def _snapshot(graph: DrugInteractionGraph):
+    """Return a comparable view of a graph's drugs and interactions."""
+    names = graph.graph.vs["name"]
+    edges = sorted(
+        (
+            tuple(sorted((names[e.source], names[e.target]))),
+            tuple(graph._decode_conditions(e["condition_ids"])),
+        )
+        for e in graph.graph.es
+    )
+    return sorted(names), edges
+
+
+def test_bulk_load_matches_row_by_row():
+    bulk = DrugInteractionGraph()
+    bulk.load_from_csv(SAMPLE_CSV)
+    legacy = DrugInteractionGraph()
+    legacy.load_from_csv(SAMPLE_CSV, bulk=False)
+
+    assert _snapshot(bulk) == _snapshot(legacy)
+    assert bulk.search_interaction("warfarin", "ASPIRIN") == "Increased bleeding risk"
+
+
+def test_bulk_load_dedups_pairs_and_keeps_every_condition(tmp_path):
+    path = _write_csv(
+        tmp_path / "dupes.csv",
+        [
+            ["Warfarin", "Aspirin", "first"],
+            ["aspirin", " WARFARIN ", "second"],
+            ["Warfarin", "Ibuprofen", "first"],
+            ["Warfarin", "Aspirin", "first"],
+        ],
+    )
+    graph = DrugInteractionGraph()
+    assert graph.load_from_csv(path) == 4
+
+    assert graph.get_stats() == {"drugs": 3, "interactions": 2}
+    assert graph.get_interaction_conditions("Aspirin", "Warfarin") == [
+        "first",
+        "second",
+    ]
+    assert graph.search_interaction("Aspirin", "Warfarin") == "first; second"
+    assert graph.graph.vs["name"] == ["Warfarin", "Aspirin", "Ibuprofen"]
+    # Each distinct condition is stored once in the vocabulary
+    assert graph._conditions == ["first", "second"]
+
+
+def test_bulk_load_keeps_existing_interactions(tmp_path):
+    path = _write_csv(tmp_path / "extra.csv", [["Warfarin", "Aspirin", "updated"]])
+    graph = DrugInteractionGraph()
+    graph.add_interaction("Warfarin", "Aspirin", "original")
+    graph.add_interaction("Metformin", "Alcohol", "Lactic acidosis risk")
+
+    graph.load_from_csv(path)
+
+    assert graph.get_stats() == {"drugs": 4, "interactions": 2}
+    assert graph.search_interaction("warfarin", "aspirin") == "original; updated"
+    assert graph.search_interaction("metformin", "alcohol") == "Lactic acidosis risk"
+    graph.add_interaction("Metformin", "Aspirin", "new")
+    assert graph.search_interaction("aspirin", "metformin") == "new"
+
+
+def test_streaming_chunks_match_single_chunk(tmp_path):
+    rows = [[f"Drug{i % 7}", f"Drug{(i * 3) % 11}", f"c{i}"] for i in range(50)]
+    path = _write_csv(tmp_path / "chunks.csv", rows)
+
+    whole = DrugInteractionGraph()
+    whole.load_from_csv(path)
+    chunked = DrugInteractionGraph()
+    assert chunked.load_from_csv(path, chunk_size=3) == 50
+
+    assert _snapshot(chunked) == _snapshot(whole)
+
+
+def test_csv_alternate_columns_and_short_rows(tmp_path):
+    path = tmp_path / "alt.csv"
+    path.write_text("drug_1,drug_2,condition\nWarfarin,Aspirin\n\n,Aspirin,x\n")
+    graph = DrugInteractionGraph()
+
+    assert graph.load_from_csv(str(path)) == 1
+    assert graph.get_stats() == {"drugs": 2, "interactions": 1}
+
+
+def test_encoded_batches_match_row_by_row_rows():
+    rows = [
+        ("Warfarin", "Aspirin", "first"),
+        ("aspirin", " WARFARIN ", "second"),
+        ("Warfarin", "Ibuprofen", None),
+        ("", "Aspirin", "skipped"),
+        ("Warfarin", "Aspirin", "first"),
+        ("Ibuprofen", "Warfarin", ""),
+    ]
+    expected = _InteractionGraphBuilder()
+    for drug1, drug2, condition in rows:
+        if drug1 and drug2:
+            expected.add(drug1, drug2, condition)
+
+    def encode(values):
+        dictionary = sorted({v for v in values if v is not None})
+        codes = [dictionary.index(v) if v is not None else -1 for v in values]
+        return dictionary, np.array(codes)
+
+    builder = _InteractionGraphBuilder()
+    # Split into two batches with separate dictionaries
+    for batch in (rows[:3], rows[3:]):
+        columns = [encode([row[i] for row in batch]) for i in range(3)]
+        builder.add_encoded(*columns[0], *columns[1], *columns[2])
+
+    assert builder.names == expected.names
+    assert builder.sources == expected.sources
+    assert builder.targets == expected.targets
+    assert builder.conditions == expected.conditions
+    assert builder._edge_condition_ids() == expected._edge_condition_ids()
+
+    # Without a condition column only the pairs are recorded
+    bare = _InteractionGraphBuilder()
+    columns = [encode([row[i] for row in rows]) for i in range(2)]
+    assert bare.add_encoded(*columns[0], *columns[1]) == 5
+    assert bare.sources == expected.sources and not len(bare.row_edges)
+
+
+def test_parquet_round_trip_matches_csv(tmp_path):
+    pytest.importorskip("pyarrow")
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graph.add_interaction("Drug X", "Drug Y", None)
+    path = str(tmp_path / "interactions.parquet")
+
+    rows = graph.export_to_parquet(path)
+    assert rows == sum(max(len(ids), 1) for ids in graph.graph.es["condition_ids"])
+
+    for batch_size in (3, 1_000_000):
+        loaded = DrugInteractionGraph()
+        assert loaded.load_from_parquet(path, batch_size=batch_size) == rows
+        assert _snapshot(loaded) == _snapshot(graph)
+    assert loaded.get_interaction_conditions("Drug X", "Drug Y") == []
+
+    csv_graph = DrugInteractionGraph()
+    csv_graph.load_from_csv(SAMPLE_CSV)
+    csv_graph.load_from_parquet(path)
+    assert _snapshot(csv_graph) == _snapshot(graph)
+
+
+def test_json_array_and_ndjson_stream_like_csv(tmp_path):
+    with open(SAMPLE_CSV, newline="", encoding="utf-8") as f:
+        records = list(csv.DictReader(f))
+    expected = DrugInteractionGraph()
+    expected.load_from_csv(SAMPLE_CSV)
+
+    array_path = tmp_path / "interactions.json"
+    array_path.write_text(json.dumps(records, indent=2), encoding="utf-8")
+    ndjson_path = tmp_path / "interactions.ndjson"
+    ndjson_path.write_text(
+        "\n".join(json.dumps(r) for r in records) + "\n\n", encoding="utf-8"
+    )
+
+    for path in (array_path, ndjson_path):
+        for bulk, chunk_size in ((True, 3), (True, 50_000), (False, 50_000)):
+            graph = DrugInteractionGraph()
+            loaded = graph.load_from_json(str(path), bulk=bulk, chunk_size=chunk_size)
+            assert loaded == len(records)
+            assert _snapshot(graph) == _snapshot(expected)
+
+    # Elements split across reads, string escapes and a BOM
+    tricky = [{"drug1": "Ä], {", "drug2": 'B"}', "condition": None}, {"x": 1}]
+    data = b"\xef\xbb\xbf \n" + json.dumps(tricky).encode("utf-8")
+    assert list(iter_json_records(io.BytesIO(data), read_size=1)) == tricky
+    for bad in (b"[{}", b"[{} {}]", b"[{},]", b"{}"):
+        with pytest.raises(ValueError):
+            list(iter_json_records(io.BytesIO(bad), format="array"))
+    with pytest.raises(ValueError):
+        list(iter_json_records(io.BytesIO(b'{"drug1": "A"}\n{oops}\n')))
+
+
+def test_parallel_csv_load_matches_serial(tmp_path):
+    rows = [[f" drug{i % 13} ", f"Drug{(i * 5) % 17}", f"c{i % 9}"] for i in range(200)]
+    rows += [["DRUG3", "drug4", ""], ["", "Drug1", "skipped"], ["Drug2"]]
+    no_condition = tmp_path / "no_condition.csv"
+    no_condition.write_text("drug_2,drug_1\nA,B\nb,C\n\nA,b\n")
+    paths = [SAMPLE_CSV, _write_csv(tmp_path / "rows.csv", rows), str(no_condition)]
+
+    for path in paths:
+        serial = DrugInteractionGraph()
+        serial.add_interaction("Drug3", "Existing", "kept")
+        expected = serial.load_from_csv(path)
+        parallel = DrugInteractionGraph()
+        parallel.add_interaction("Drug3", "Existing", "kept")
+        assert parallel.load_from_csv(path, workers=2) == expected
+
+        assert parallel.graph.vs["name"] == serial.graph.vs["name"]
+        assert parallel.graph.get_edgelist() == serial.graph.get_edgelist()
+        assert parallel._conditions == serial._conditions
+        assert parallel.graph.es["condition_ids"] == serial.graph.es["condition_ids"]
+
+    ranges = split_csv_ranges(paths[1], 5, parts=7)
+    assert ranges[0][0] == 5 and ranges[-1][1] == os.path.getsize(paths[1])
+    assert all(
+        end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:])
+    )
+    with pytest.raises(ValueError):
+        DrugInteractionGraph().load_from_csv(SAMPLE_CSV, bulk=False, workers=2)
+
+
+def test_snapshot_round_trip(tmp_path):
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graph.add_interaction("Thuốc A", "Aspirin", None)
+    path = str(tmp_path / "graph.snap")
+
+    assert graph.save_snapshot(path) > 0
+    loaded = DrugInteractionGraph(path)
+
+    assert _snapshot(loaded) == _snapshot(graph)
+    assert loaded.search_interaction("thuốc a", "aspirin") is None
+    assert loaded.search_interaction("WARFARIN", "aspirin") == (
+        "Increased bleeding risk"
+    )
+
+
+def test_snapshot_matches_graphml_import(tmp_path):
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graphml = str(tmp_path / "graph.graphml")
+    snap = str(tmp_path / "graph.snap")
+    graph.export_to_graphml(graphml)
+
+    DrugInteractionGraph(graphml).save_snapshot(snap)
+
+    assert _snapshot(DrugInteractionGraph(snap)) == _snapshot(graph)
+
+
+def test_multi_condition_edges_survive_snapshot_graphml_and_engine(tmp_path):
+    graph = DrugInteractionGraph()
+    graph.add_interaction("Warfarin", "Aspirin", "bleeding")
+    graph.add_interaction("Aspirin", "Warfarin", "bruising")
+    graph.add_interaction("Warfarin", "Aspirin", "bleeding")
+    graph.add_interaction("Warfarin", "Ibuprofen", "bleeding")
+    graph.add_interaction("Metformin", "Alcohol", None)
+    snap = str(tmp_path / "graph.snap")
+    graphml = str(tmp_path / "graph.graphml")
+    graph.save_snapshot(snap)
+    graph.export_to_graphml(graphml)
+
+    for source in (
+        graph,
+        DrugInteractionGraph(snap),
+        DrugInteractionGraph(graphml),
+        graph.freeze(),
+        FrozenDrugGraph.from_snapshot(snap),
+    ):
+        assert source.get_interaction_conditions("aspirin", "warfarin") == [
+            "bleeding",
+            "bruising",
+        ]
+        assert source.search_interaction("warfarin", "aspirin") == (
+            "bleeding; bruising"
+        )
+        assert source.search_interaction("metformin", "alcohol") is None
+        assert source.get_interaction_conditions("metformin", "aspirin") == []
+        bruising = source.get_all_interactions_for_drug("warfarin", condition="bruis")
+        assert bruising == [
+            {
+                "drug": "Aspirin",
+                "condition": "bleeding; bruising",
+                "conditions": ["bleeding", "bruising"],
+            }
+        ]
+
+
+def test_delta_records_add_update_remove():
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    before = graph.get_stats()
+
+    applied = graph.apply_deltas(
+        [
+            DeltaRecord("add", "Warfarin", "Aspirin", ["bruising"]),
+            DeltaRecord("add", "NewDrug", "aspirin", ["rash"]),
+            DeltaRecord("update", "Ibuprofen", "Warfarin", ["bleeding"]),
+            DeltaRecord("remove", "Metformin", "Alcohol"),
+            DeltaRecord("remove", "Unknown", "Aspirin"),
+            DeltaRecord("add", "Temp", "Other", ["x"]),
+            DeltaRecord("remove", "temp", "other"),
+        ]
+    )
+
+    assert applied == 7
+    assert graph.get_interaction_conditions("aspirin", "warfarin") == [
+        "Increased bleeding risk",
+        "bruising",
+    ]
+    assert graph.search_interaction("newdrug", "aspirin") == "rash"
+    assert graph.search_interaction("warfarin", "ibuprofen") == "bleeding"
+    assert graph.search_interaction("metformin", "alcohol") is None
+    assert graph.search_interaction("temp", "other") is None
+    assert graph.get_stats() == {
+        "drugs": before["drugs"] + 3,
+        "interactions": before["interactions"],
+    }
+
+    vocabulary = len(graph._conditions)
+    assert graph.remove_interaction("Warfarin", "Aspirin", "never reported")
+    assert len(graph._conditions) == vocabulary
+    assert graph.get_interaction_conditions("aspirin", "warfarin") == [
+        "Increased bleeding risk",
+        "bruising",
+    ]
+    assert graph.remove_interaction("Warfarin", "Aspirin", "bruising")
+    assert graph.search_interaction("aspirin", "warfarin") == "Increased bleeding risk"
+    assert not graph.remove_interaction("Warfarin", "Unknown")
+    graph.update_interaction("Warfarin", "Aspirin", [])
+    assert graph.get_interaction_conditions("aspirin", "warfarin") == []
+    assert graph.degree("warfarin") > 0
+
+
+def test_failed_delta_batch_leaves_name_lookup_consistent(monkeypatch):
+    graph = DrugInteractionGraph()
+    graph.add_interaction("Warfarin", "Aspirin", "bleeding")
+
+    def fail(*args, **kwargs):
+        raise MemoryError("out of memory")
+
+    monkeypatch.setattr(graph.graph, "add_edges", fail)
+    with pytest.raises(MemoryError):
+        graph.apply_deltas([DeltaRecord("add", "Brand New", "Warfarin", ["rash"])])
+    monkeypatch.undo()
+
+    assert graph.vertex_ids(["Brand New"]).tolist() == [-1]
+    graph.apply_deltas([DeltaRecord("add", "Brand New", "Warfarin", ["rash"])])
+    assert graph.search_interaction("brand new", "warfarin") == "rash"
+
+
+def test_delta_log_compaction_and_replay(tmp_path):
+    base = DrugInteractionGraph()
+    base.load_from_csv(SAMPLE_CSV)
+    snap = str(tmp_path / "base.snap")
+    base.save_snapshot(snap)
+    log_path = tmp_path / "delta.ndjson"
+    log = DeltaLog(str(log_path))
+    log.append(
+        [
+            DeltaRecord("add", "Warfarin", "NewDrug", ["rash"]),
+            DeltaRecord("remove", "Warfarin", "Aspirin"),
+        ]
+    )
+    # A record cut off mid-write is not applied
+    with open(log_path, "ab") as f:
+        f.write(b'{"op": "add", "drug1": "A"')
+
+    graph = DrugInteractionGraph(snap)
+    assert graph.apply_delta_log(str(log_path)) == 2
+    expected = _snapshot(graph)
+    assert graph.search_interaction("warfarin", "aspirin") is None
+
+    # Replaying the log on an already-updated graph changes nothing
+    assert graph.compact_delta_log(str(log_path), snap) == 2
+    assert _snapshot(graph) == expected
+    assert _snapshot(DrugInteractionGraph(snap)) == expected
+    assert log_path.read_bytes() == b'{"op": "add", "drug1": "A"'
+    assert DeltaLog(str(log_path)).read() == ([], 0)
+
+
+def test_graph_holder_swaps_without_disturbing_pinned_readers():
+    graphs = iter(
+        [
+            DrugInteractionGraph(),
+            DrugInteractionGraph(),
+        ]
+    )
+    loads = []
+    holder = GraphHolder(lambda: next(graphs), lambda: loads.append(1) or len(loads))
+    assert holder.version is None
+    with pytest.raises(RuntimeError):
+        holder.pin()
+
+    holder.load()
+    holder.add_interaction("Warfarin", "Aspirin", "bleeding")
+    pinned = holder.pin()
+
+    new_version = holder.load()
+    assert new_version.version == holder.version == 2
+    assert new_version.source_stamp == 2
+    assert pinned.search_interaction("Warfarin", "Aspirin") == "bleeding"
+    assert holder.search_interaction("Warfarin", "Aspirin") is None
+    assert holder.status()["interactions"] == 0
+
+    def failing_loader():
+        raise OSError("snapshot missing")
+
+    holder._loader = failing_loader
+    with pytest.raises(OSError):
+        holder.load()
+    assert holder.version == 2
+    assert holder.status()["last_error"] == "snapshot missing"
+
+    # A second background reload is refused until the first one finishes
+    started, release = threading.Event(), threading.Event()
+
+    def slow_loader():
+        started.set()
+        release.wait(5)
+        return DrugInteractionGraph()
+
+    holder._loader = slow_loader
+    assert holder.reload_in_background()
+    assert started.wait(5) and holder.reloading
+    assert not holder.reload_in_background()
+    release.set()
+    with holder._reload_lock:
+        assert holder.version == 3
+    assert holder.reload_in_background()
+
+
+def test_snapshot_checksum_detects_corruption(tmp_path):
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    path = tmp_path / "graph.snap"
+    graph.save_snapshot(str(path))
+
+    data = bytearray(path.read_bytes())
+    data[-1] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with pytest.raises(SnapshotError):
+        DrugInteractionGraph(str(path))
+
+
+def test_empty_graph_snapshot(tmp_path):
+    path = str(tmp_path / "empty.snap")
+    DrugInteractionGraph().save_snapshot(path)
+
+    assert DrugInteractionGraph(path).get_stats() == {"drugs": 0, "interactions": 0}
+
+
+def test_frozen_engine_matches_graph(tmp_path):
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graph.add_interaction("Aspirin", "Aspirin", None)
+    path = str(tmp_path / "graph.snap")
+    graph.save_snapshot(path)
+    names = graph.graph.vs["name"] + ["UnknownDrug"]
+
+    for engine in (graph.freeze(), FrozenDrugGraph.from_snapshot(path)):
+        assert engine.get_stats() == graph.get_stats()
+        for drug1 in names:
+            expected = sorted(
+                (i["drug"], str(i["condition"]))
+                for i in graph.get_all_interactions_for_drug(drug1)
+            )
+            actual = sorted(
+                (i["drug"], str(i["condition"]))
+                for i in engine.get_all_interactions_for_drug(drug1.upper())
+            )
+            assert sorted(set(actual)) == sorted(set(expected))
+            for drug2 in names:
+                assert engine.search_interaction(drug1, drug2) == (
+                    graph.search_interaction(drug1, drug2)
+                )
+
+
+def test_shared_image_matches_engine_and_tracks_sources(tmp_path):
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graph.add_interaction("Warfarin", "Aspirin", "second condition")
+    snapshot_path = str(tmp_path / "graph.snap")
+    graph.save_snapshot(snapshot_path)
+    image_path = str(tmp_path / "graph.shared")
+    engine = graph.freeze()
+    names = graph.graph.vs["name"] + ["UnknownDrug"]
+
+    shared = open_or_build_shared_graph(
+        image_path,
+        [snapshot_path],
+        lambda: FrozenDrugGraph.from_snapshot(snapshot_path),
+    )
+    assert str(shared) == str(engine)
+    assert list(shared.names) == list(engine.names)
+    assert shared.search_regimen_interactions(names) == (
+        engine.search_regimen_interactions(names)
+    )
+    for drug1 in names:
+        assert shared.degree(drug1.upper()) == engine.degree(drug1)
+        assert shared.get_all_interactions_for_drug(drug1, condition="a") == (
+            engine.get_all_interactions_for_drug(drug1, condition="a")
+        )
+        for drug2 in names:
+            assert shared.get_interaction_conditions(drug1, drug2) == (
+                engine.get_interaction_conditions(drug1, drug2)
+            )
+    ids = shared.vertex_ids(names)
+    assert ids.tolist() == engine.vertex_ids(names).tolist()
+    assert shared.find_edges(ids, ids[::-1]).tolist() == (
+        engine.find_edges(ids, ids[::-1]).tolist()
+    )
+
+    # An unchanged source reuses the image; a rewritten one rebuilds it
+    builds = []
+    open_or_build_shared_graph(image_path, [snapshot_path], builds.append)
+    assert builds == []
+    graph.add_interaction("Metformin", "Aspirin", "hypoglycemia")
+    graph.save_snapshot(snapshot_path)
+    rebuilt = open_or_build_shared_graph(
+        image_path,
+        [snapshot_path],
+        lambda: FrozenDrugGraph.from_snapshot(snapshot_path),
+    )
+    assert rebuilt.search_interaction("metformin", "aspirin") == "hypoglycemia"
+    assert len(open_shared_graph(image_path)) == len(graph)
+
+
+def test_prefix_index_ranks_completions():
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graph.add_interaction("Valproate Sodium", "Warfarin", "bleeding")
+    index = PrefixIndex.from_graph(
+        graph.freeze(), ["Sodium chloride", "warfarin", "Warfarinol"]
+    )
+
+    names = [r["name"] for r in index.search("WAR", 10)]
+    assert names == ["Warfarin", "Warfarinol"]
+    assert index.search("warfarin")[0] == {
+        "name": "Warfarin",
+        "interactions": graph.degree("Warfarin"),
+        "in_graph": True,
+    }
+    # Full-name matches rank above word-start matches
+    assert [r["name"] for r in index.search("sod")] == [
+        "Sodium chloride",
+        "Valproate Sodium",
+    ]
+    assert index.search("sodium chloride")[0]["in_graph"] is False
+    assert index.search("a", limit=3) == sorted(
+        index.search("a", limit=3), key=lambda r: -r["interactions"]
+    )
+    assert index.search("zzz") == [] and index.search("  ") == []
+
+
+def test_trigram_index_resolves_only_unambiguous_typos():
+    assert edit_distance("warfarin", "wafrarin", 2) == 1
+    assert edit_distance("warfarin", "aspirin", 1) == 2
+    index = TrigramIndex(
+        [
+            "Warfarin",
+            "Ibuprofen",
+            "Lisinopril",
+            "Fosinopril",
+            "Sodium chloride",
+            "Mesna",
+        ]
+    )
+
+    assert index.lookup("warfarine") == ("Warfarin", 1)
+    assert index.lookup("WAFRARIN") == ("Warfarin", 1)
+    assert index.lookup("sodium  chlorid") == ("Sodium chloride", 1)
+    assert index.lookup("lisinoprill") == ("Lisinopril", 1)
+    # Equally close to two names, or too far from any: left to embeddings
+    assert index.lookup("sinopril") is None
+    assert index.lookup("ibuprofenxyz") is None
+    # Short names must match exactly
+    assert index.lookup("mes") is None and index.lookup("mesna") == ("Mesna", 0)
+    assert index.candidates("ibuprofin")[0][0] == 1
+    # A lower edit cap keeps two-edit matches to other drugs out
+    index = TrigramIndex(["Prednisolone", "Warfarin"])
+    assert index.lookup("prednisone") == ("Prednisolone", 2)
+    assert index.lookup("prednisone", max_typos=1) is None
+    assert index.lookup("warfarine", max_typos=1) == ("Warfarin", 1)
+    assert index.lookup("warfarine", max_typos=0) is None
+
+
+def test_alias_index_loads_and_learns(tmp_path):
+    path = tmp_path / "aliases.ndjson"
+    path.write_text(
+        '{"alias": "Tylenol", "drug": "Acetaminophen"}\n'
+        "not json\n"
+        '{"alias": "Coumadin", "drug": "Warfarin"}\n',
+        encoding="utf-8",
+    )
+    learned_path = tmp_path / "aliases.learned.ndjson"
+    aliases = AliasIndex(str(path), str(learned_path))
+    assert len(aliases) == 2
+    assert aliases.resolve(" TYLENOL ") == "Acetaminophen"
+    assert aliases.resolve("Advil") is None
+
+    seed = path.read_bytes()
+    assert aliases.learn("Advil", "Ibuprofen")
+    assert not aliases.learn("advil", "Ibuprofen")
+    assert not aliases.learn("Warfarin", "warfarin")
+    assert path.read_bytes() == seed
+    reloaded = AliasIndex(str(path), str(learned_path))
+    assert reloaded.resolve("advil") == "Ibuprofen" and len(reloaded) == 3
+    assert AliasIndex(str(path)).resolve("advil") is None
+
+
+def test_search_all_interactions_uses_both_directions():
+    graph = DrugInteractionGraph()
+    graph.add_interaction("Warfarin", "Aspirin", "bleeding")
+    graph.add_interaction("Ibuprofen", "Warfarin", "bleeding risk")
+    graph.add_interaction("Aspirin", "Clopidogrel", "platelets")
+    graph.add_interaction("Metformin", "Alcohol", "lactic acidosis")
+
+    results = graph.search_all_interactions("warfarin", "ASPIRIN")
+
+    assert results[0] == {
+        "drug": "Warfarin",
+        "partner": "Aspirin",
+        "condition": "bleeding",
+        "conditions": ["bleeding"],
+    }
+    assert sorted((r["drug"], r["partner"]) for r in results[1:]) == [
+        ("Aspirin", "Clopidogrel"),
+        ("Warfarin", "Ibuprofen"),
+    ]
+    assert graph.search_all_interactions("Metformin", "Unknown") == [
+        {
+            "drug": "Metformin",
+            "partner": "Alcohol",
+            "condition": "lactic acidosis",
+            "conditions": ["lactic acidosis"],
+        }
+    ]
+    assert graph.search_all_interactions("Unknown", "Other") == []
+
+
+def test_regimen_interactions_match_pairwise_search():
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graph.add_interaction("Warfarin", "Aspirin", "bruising")
+    regimen = ["ibuprofen", "WARFARIN", "Unknown", "aspirin", "Warfarin", "Lisinopril"]
+    expected = [
+        (a, b, graph.search_interaction(a, b))
+        for i, a in enumerate(["Ibuprofen", "Warfarin", "Aspirin", "Lisinopril"])
+        for b in ["Ibuprofen", "Warfarin", "Aspirin", "Lisinopril"][i + 1 :]
+        if graph.search_interaction(a, b)
+    ]
+
+    for source in (graph, graph.freeze()):
+        results = source.search_regimen_interactions(regimen)
+        assert [(r["drug1"], r["drug2"], r["condition"]) for r in results] == expected
+        assert ("Warfarin", "Aspirin") in [(r["drug1"], r["drug2"]) for r in results]
+        assert source.search_regimen_interactions(["Warfarin"]) == []
+        assert source.search_regimen_interactions([]) == []
+
+
+def test_indirect_interactions_are_bounded_and_agree(tmp_path):
+    # A - B - C - D - E chain, plus hub H linked to A, C and a long tail
+    rows = [("A", "B", "x"), ("B", "C", "x"), ("C", "D", "x"), ("D", "E", "x")]
+    rows += [("H", "A", "y"), ("H", "C", "y")]
+    rows += [("H", f"T{i}", "z") for i in range(50)]
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(_write_csv(tmp_path / "chain.csv", rows))
+    engine = graph.freeze()
+
+    for g in (graph, engine):
+        shared = g.find_indirect_interactions("a", "c")
+        assert not shared["direct"] and shared["distance"] == 2
+        assert sorted(shared["shared_partners"]) == ["B", "H"]
+        assert shared["shared_partner_count"] == 2
+
+        far = g.find_indirect_interactions("A", "E", max_depth=4)
+        assert far["path"][0] == "A" and far["path"][-1] == "E"
+        assert far["distance"] == 4 and not far["truncated"]
+        assert g.find_indirect_interactions("B", "E")["path"] == ["B", "C", "D", "E"]
+
+        assert g.find_indirect_interactions("A", "E", max_depth=3)["path"] is None
+        assert g.find_indirect_interactions("A", "Unknown") is None
+
+        # Sampling the hub's row is reported, not hidden
+        capped = g.find_indirect_interactions("T0", "E", max_depth=4, max_fanout=5)
+        assert capped["truncated"]
+        exact = g.find_indirect_interactions("T0", "D", max_fanout=100)
+        assert exact["path"] == ["T0", "H", "C", "D"] and not exact["truncated"]
+
+
+def test_statistics_match_engine_and_cache_per_source(tmp_path):
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graph.add_interaction("Warfarin", "Aspirin", "Second report")
+    engine = graph.freeze()
+
+    computed = graph.get_statistics()
+    assert graph.get_statistics() is computed
+    frozen = engine.compute_statistics()
+    assert computed.degrees.tolist() == frozen.degrees.tolist()
+    assert computed.condition_counts.tolist() == frozen.condition_counts.tolist()
+    assert computed.summary() == frozen.summary()
+
+    summary = computed.summary(top=3)
+    degrees = graph.get_drug_degrees()
+    assert [hub["interactions"] for hub in summary["top_drugs"]] == sorted(
+        degrees.values(), reverse=True
+    )[:3]
+    assert summary["top_drugs"][0]["interactions"] == summary["max_degree"]
+    assert sum(b["drugs"] for b in summary["degree_histogram"]) == len(degrees)
+    warfarin = graph.get_all_interactions_for_drug("Warfarin")
+    vertex = graph._name_to_vertex["warfarin"]
+    assert computed.condition_counts[vertex] == sum(
+        len(i["conditions"]) for i in warfarin
+    )
+
+    graph.add_interaction("Warfarin", "Newdrug", "x")
+    assert graph.get_statistics() is not computed
+
+    snapshot = str(tmp_path / "graph.snap")
+    stats_file = str(tmp_path / "graph.stats")
+    graph.save_snapshot(snapshot)
+    stamp = source_stamp([snapshot])
+    first = load_or_compute_statistics(stats_file, stamp, graph)
+    cached = load_or_compute_statistics(stats_file, stamp, graph)
+    assert not first.metadata and cached.metadata["sources"]
+    assert cached.summary() == first.summary()
+    assert GraphStatistics.load(stats_file).top_names == first.top_names
+
+    # Statistics of the loaded graph are filed under its load-time stamp,
+    # so a snapshot written since then does not look up to date
+    graph.add_interaction("Newdrug", "Otherdrug", "y")
+    graph.save_snapshot(snapshot)
+    os.utime(snapshot, ns=(0, os.stat(snapshot).st_mtime_ns + 10**9))
+    updated = load_or_compute_statistics(stats_file, stamp, graph)
+    assert updated.totals["interactions"] == first.totals["interactions"] + 1
+    assert GraphStatistics.load(stats_file).metadata["sources"] == stamp
+    assert source_stamp([snapshot]) != stamp
+
+
+def test_condition_index_and_or_prefix_queries():
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    engine = graph.freeze()
+
+    def scan(groups):
+        # Reference: every edge with one condition whose words cover a group
+        hits = []
+        for edge in graph.graph.es:
+            for condition in graph._decode_conditions(edge["condition_ids"]):
+                words = set(condition.lower().split())
+                if any(all(w in words for w in group) for group in groups):
+                    hits.append(edge.index)
+                    break
+        return hits
+
+    for query, groups in [
+        ("bleeding risk", [["bleeding", "risk"]]),
+        ("Toxicity OR hyperkalemia", [["toxicity"], ["hyperkalemia"]]),
+        ("increased", [["increased"]]),
+    ]:
+        expected = scan(groups)
+        assert graph.condition_index.search(query).tolist() == expected
+        for g in (graph, engine):
+            result = g.search_by_condition(query, limit=None)
+            assert result["total"] == len(expected)
+            assert result == engine.search_by_condition(query, limit=None)
+
+    prefix = graph.search_by_condition("bleed*", limit=None)
+    assert prefix["total"] == graph.search_by_condition("bleeding")["total"]
+    assert graph.search_by_condition("bleeding unknownword")["total"] == 0
+
+    page = engine.search_by_condition("increased", limit=2, offset=1)
+    everything = engine.search_by_condition("increased", limit=None)
+    assert page["interactions"] == everything["interactions"][1:3]
+    assert all(
+        "bleeding" in c.lower()
+        for i in graph.search_by_condition("bleeding", limit=None)["interactions"]
+        for c in i["matched_conditions"]
+    )
+
+    # Words of a group must occur in the same condition
+    split = DrugInteractionGraph()
+    split.add_interaction("A", "B", "lactic acid increased")
+    split.add_interaction("A", "B", "metabolic acidosis")
+    split.add_interaction("C", "D", "lactic acidosis")
+    for g in (split, split.freeze()):
+        result = g.search_by_condition("lactic acidosis", limit=None)
+        assert result["total"] == 1
+        assert result["interactions"][0]["matched_conditions"] == ["lactic acidosis"]
+        either = g.search_by_condition("lactic acid OR metabolic", limit=None)
+        assert either["total"] == 1
+        assert either["interactions"][0]["matched_conditions"] == [
+            "lactic acid increased",
+            "metabolic acidosis",
+        ]
+
+    graph.add_interaction("Drug X", "Drug Y", "QT prolonged")
+    result = graph.search_by_condition("qt prolonged")
+    assert result["total"] == 1
+    assert {result["interactions"][0]["drug1"], result["interactions"][0]["drug2"]} == {
+        "Drug X",
+        "Drug Y",
+    }
+
+
+def test_render_view_reduces_and_lays_out_natively():
+    hubs = ig.Graph.Barabasi(3000, 3)
+    degrees = np.array(hubs.degree())
+
+    top = select_vertices(hubs, degrees, max_nodes=50)
+    assert len(top) == 50 and degrees[top].min() >= np.sort(degrees)[-50]
+    core = select_vertices(hubs, degrees, max_nodes=50, reduction="k_core")
+    coreness = np.array(hubs.coreness())
+    assert len(core) == 50 and coreness[core].min() >= np.sort(coreness)[-50]
+    ego = select_vertices(hubs, degrees, max_nodes=10, focus=5)
+    assert len(ego) == 10 and 5 in ego
+    assert set(ego.tolist()) - {5} <= set(hubs.neighbors(5))
+    with pytest.raises(ValueError):
+        select_vertices(hubs, degrees, reduction="ego")
+    small = hubs.induced_subgraph(range(40))
+    kept = select_vertices(small, np.array(small.degree()), max_nodes=50, focus=5)
+    assert np.array_equal(kept, np.arange(40))
+
+    for layout in ("auto", "circle", "kamada_kawai", "random", "drl"):
+        pos = compute_layout(hubs.induced_subgraph(top.tolist()), layout)
+        assert pos.shape == (50, 2) and np.abs(pos).max() == pytest.approx(1.0)
+    subgraph = hubs.induced_subgraph(top.tolist())
+    assert np.array_equal(compute_layout(subgraph), compute_layout(subgraph))
+
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    view = graph._render_view("warfarin", "auto", 3, "auto", layout_cache=None)
+    assert len(view["vertices"]) == 3 and view["pos"].shape == (3, 2)
+    assert view["names"][view["highlight"]] == "Warfarin"
+    assert view["partners"].sum() == 2 and not view["partners"][view["highlight"]]
+    whole = graph._render_view("aspirin", "circle", 500, "auto", layout_cache=None)
+    assert len(whole["vertices"]) == graph.get_stats()["drugs"]
+    assert whole["names"][whole["highlight"]] == "Aspirin"
+    full = graph._render_view(None, "circle", 1000, "auto", layout_cache=None)
+    assert len(full["vertices"]) == graph.get_stats()["drugs"]
+    assert len(full["edges"]) == len(graph)
+
+    x, y = edge_coordinates(full["pos"], full["edges"])
+    assert len(x) == 3 * len(graph) and np.isnan(y[2::3]).all()
+    source, target = full["edges"][0]
+    assert (x[0], y[1]) == (full["pos"][source, 0], full["pos"][target, 1])
+    for name, text in zip(full["names"], graph._hover_texts(full, partners=2)):
+        partners = graph.get_all_interactions_for_drug(name, limit=2)
+        assert text.count("• ") == len(partners)
+        assert all(f"• {p['drug']}<br>" in text for p in partners)
+
+
+def test_layout_cache_reuses_layouts_by_content(tmp_path, monkeypatch):
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    cache_dir = str(tmp_path / "layouts")
+
+    first = graph._render_view("warfarin", "spring", 50, "top_k", cache_dir)
+    assert len(list((tmp_path / "layouts").glob("*.npy"))) == 1
+
+    # Same subgraph with another highlight, or after a reload: no layout run
+    monkeypatch.setattr(drug_graph_layout, "compute_layout", pytest.fail, raising=True)
+    for highlight in ("warfarin", "aspirin", None):
+        view = graph._render_view(highlight, "spring", 50, "top_k", cache_dir)
+        assert np.array_equal(view["pos"], first["pos"])
+    monkeypatch.undo()
+
+    subgraph = graph.graph.induced_subgraph(first["vertices"].tolist())
+    keys = {
+        layout_key(subgraph, "spring"),
+        layout_key(subgraph, "spring", seed=7),
+        layout_key(subgraph, "circle"),
+    }
+    assert len(keys) == 3
+    graph.add_interaction("Warfarin", "New Drug", "Bleeding")
+    changed = graph.graph.induced_subgraph(
+        graph._render_view("warfarin", "circle", 50, "top_k", None)["vertices"].tolist()
+    )
+    assert layout_key(changed, "spring") not in keys
+
+    # Unreadable entries are recomputed and replaced
+    for path in (tmp_path / "layouts").glob("*.npy"):
+        path.write_bytes(b"garbage")
+    again = cached_layout(subgraph, "spring", cache_dir=cache_dir)
+    assert np.array_equal(again, first["pos"])
+
+
+def test_highlight_renders_share_the_default_cached_layout(tmp_path, monkeypatch):
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    monkeypatch.chdir(tmp_path)
+
+    plt.close(graph.visualize(highlight_drug="Aspirin"))
+    assert len(list((tmp_path / drug_graph_layout.LAYOUT_CACHE_DIR).glob("*.npy"))) == 1
+
+    # Other highlights draw the same graph, so they reuse its layout
+    monkeypatch.setattr(drug_graph_layout, "compute_layout", pytest.fail, raising=True)
+    for highlight in ("Warfarin", "aspirin", None):
+        plt.close(graph.visualize(highlight_drug=highlight))
+    assert len(list((tmp_path / drug_graph_layout.LAYOUT_CACHE_DIR).glob("*.npy"))) == 1
+
+
+def test_pair_key_index_batch_lookup():
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    graph.add_interaction("Aspirin", "Aspirin", None)
+    names = graph.graph.vs["name"] + ["Unknown"]
+    drugs1 = [a for a in names for _ in names]
+    drugs2 = [b for _ in names for b in names]
+
+    engine = graph.freeze()
+    for source, index in (
+        (graph, graph.build_pair_index()),
+        (engine, engine.pair_index),
+    ):
+        edge_ids = index.lookup(source.vertex_ids(drugs1), source.vertex_ids(drugs2))
+        assert len(index) == graph.get_stats()["interactions"]
+        for drug1, drug2, edge_id in zip(drugs1, drugs2, edge_ids.tolist()):
+            v1, v2 = graph.vertex_ids([drug1, drug2]).tolist()
+            connected = (
+                min(v1, v2) >= 0 and graph.graph.get_eid(v1, v2, error=False) >= 0
+            )
+            assert (edge_id >= 0) == connected
+    expected = graph.vertex_ids(["warfarin", "aspirin"])
+    assert graph.build_pair_index().lookup(expected[:1], expected[1:]).tolist() == [
+        graph.graph.get_eid(*expected.tolist())
+    ]
+
+
+def test_interactions_for_drug_pagination_and_filter():
+    graph = DrugInteractionGraph()
+    graph.load_from_csv(SAMPLE_CSV)
+    engine = graph.freeze()
+
+    for source in (graph, engine):
+        everything = source.get_all_interactions_for_drug("Warfarin")
+        assert source.degree("warfarin") == len(everything) > 2
+        assert source.get_all_interactions_for_drug("warfarin", limit=2) == (
+            everything[:2]
+        )
+        assert source.get_all_interactions_for_drug("warfarin", limit=2, offset=1) == (
+            everything[1:3]
+        )
+
+        bleeding = source.get_all_interactions_for_drug("warfarin", condition="BLEED")
+        assert bleeding and all("bleed" in i["condition"].lower() for i in bleeding)
+        assert (
+            source.get_all_interactions_for_drug(
+                "warfarin", condition="bleed", offset=1, limit=1
+            )
+            == bleeding[1:2]
+        )
+        assert source.get_all_interactions_for_drug("warfarin", offset=999) == []
+
+    assert graph.get_all_interactions_for_drug("Warfarin") == (
+        engine.get_all_interactions_for_drug("Warfarin")
+    )
+
+
+if __name__ == "__main__":
+    import sys
+
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -93,14 +93,11 @@ def main():
     print("7. Analyzing drugs with most interactions:")
     print("-" * 70)
 
-    drug_connections = {}
-    for v in graph.graph.vs:
-        drug_name = v["name"]
-        interactions = graph.get_all_interactions_for_drug(drug_name)
-        drug_connections[drug_name] = len(interactions)
-
-    # Sort by number of connections
-    sorted_drugs = sorted(drug_connections.items(), key=lambda x: x[1], reverse=True)
+    # Ranked once by get_statistics() and reused until the graph changes
+    sorted_drugs = [
+        (hub["drug"], hub["interactions"])
+        for hub in graph.get_statistics().top_drugs(10)
+    ]
 
     print("   Top 10 drugs by number of interactions:")
     for i, (drug, count) in enumerate(sorted_drugs[:10], 1):